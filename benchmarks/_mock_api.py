@@ -0,0 +1,41 @@
+"""
+Helpers for running the client against the mocked API
+responses that the integration tests use, optionally with
+some artificial latency, so that benchmarks don't need
+network access (or an API key)
+"""
+
+import re
+import time
+from contextlib import contextmanager
+from typing import Any, Collection, Generator, cast
+from unittest.mock import patch
+
+import requests
+
+from tests.integration.census.mock_api_responses import MOCK_API
+from tests.utils import MockRes
+
+
+def make_mock_get(delay_s: float = 0.0):
+    def mock_get(url: str, *args: Any, **kwargs: Any) -> MockRes:
+        if delay_s > 0:
+            time.sleep(delay_s)
+
+        url_without_api_key = re.sub(r"(\?|&)key=.*", "", url)
+
+        res = cast(Collection[Any], MOCK_API.get(url_without_api_key))
+
+        return MockRes(404 if res is None else 200, res)
+
+    return mock_get
+
+
+@contextmanager
+def mock_api(delay_s: float = 0.0) -> Generator[None, None, None]:
+    """
+    Routes every request made by the client to `MOCK_API`,
+    sleeping `delay_s` seconds per request to simulate latency
+    """
+    with patch.object(requests.Session, "get", side_effect=make_mock_get(delay_s)):
+        yield
@@ -0,0 +1,146 @@
+"""
+Compares reading every variable from a warm on-disk cache of
+`n_groups` groups, 23 variables each (ACS5 has ~1,200 groups with
+~28k variables), when they're stored one file per group (in each
+cache format), and when they're in the variable store. Also times
+looking up a single variable in the store.
+
+Run with:
+    python -m benchmarks.cache_cold_start [n_groups]
+"""
+
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from the_census._config import Config
+from the_census._persistence.onDisk import OnDiskCache
+from the_census._persistence.variableStore import SqliteVariableStore
+from the_census._variables.models import GroupCode, VariableCode
+from the_census._variables.repository.service import GROUPS_FILE, VariableRepository
+
+DEFAULT_N_GROUPS = 200
+VARIABLES_PER_GROUP = 23
+
+
+def make_config(cache_dir: str, cache_format: str = "csv") -> Config:
+    return Config(
+        2019,
+        "acs",
+        "acs5",
+        cache_dir=cache_dir,
+        should_cache_on_disk=True,
+        should_load_from_existing_cache=True,
+        cache_format=cache_format,
+    )
+
+
+def make_variables(group: GroupCode, g: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            dict(
+                code=f"{group}_{v:03d}E",
+                group_code=group,
+                group_concept=f"Group {g}",
+                name=f"Estimate!!Total:!!Item {v}",
+                predicate_type="int",
+                predicate_only=True,
+                limit=0,
+                cleaned_name=f"Estimate_Total_Item{v}",
+            )
+            for v in range(VARIABLES_PER_GROUP)
+        ]
+    )
+
+
+def make_store(config: Config) -> SqliteVariableStore:
+    return SqliteVariableStore(config, OnDiskCache(config, MagicMock()), MagicMock())
+
+
+def warm_cache(config: Config, n_groups: int) -> None:
+    cache = OnDiskCache(config, MagicMock())
+    store = make_store(config)
+    groups: List[Dict[str, Any]] = []
+
+    for g in range(n_groups):
+        group = GroupCode(f"B{g:05d}")
+        groups.append(
+            dict(code=group, description=f"Group {g}", cleaned_name=f"Group{g}")
+        )
+        store.put_group(group, make_variables(group, g))
+
+    cache.put(GROUPS_FILE, pd.DataFrame(groups))
+
+
+def warm_group_files(config: Config, n_groups: int) -> None:
+    """
+    Caches variables as they used to be: one file per group
+    """
+    cache = OnDiskCache(config, MagicMock())
+
+    for g in range(n_groups):
+        group = GroupCode(f"B{g:05d}")
+        cache.put(f"variables/{group}.csv", make_variables(group, g))
+
+
+def read_group_files(config: Config, n_groups: int) -> int:
+    cache = OnDiskCache(config, MagicMock())
+    frames = [cache.get(f"variables/B{g:05d}.csv") for g in range(n_groups)]
+
+    return sum(len(frame) for frame in frames)
+
+
+def cold_start(config: Config) -> VariableRepository:
+    return VariableRepository(
+        OnDiskCache(config, MagicMock()),
+        make_store(config),
+        MagicMock(),
+        MagicMock(),
+        MagicMock(),
+        MagicMock(),
+    )
+
+
+def main() -> None:
+    n_groups = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_N_GROUPS
+
+    for cache_format in ["csv", "feather", "parquet"]:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            config = make_config(cache_dir, cache_format)
+            warm_group_files(config, n_groups)
+
+            start = time.perf_counter()
+            n_variables = read_group_files(config, n_groups)
+            read_ms = (time.perf_counter() - start) * 1000
+
+            print(
+                f"{cache_format + ' files':>13}: read all {read_ms:8.1f}ms "
+                f"({n_variables} variables)"
+            )
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        config = make_config(cache_dir)
+        warm_cache(config, n_groups)
+
+        start = time.perf_counter()
+        found = cold_start(config).find_variables(VariableCode("B00000_000E"))
+        find_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        repo = cold_start(config)
+        n_variables = len(repo.variables)
+        read_ms = (time.perf_counter() - start) * 1000
+
+        print(
+            f"{'store':>13}: read all {read_ms:8.1f}ms "
+            f"({n_variables} variables, {len(repo.groups)} groups); "
+            f"find 1 variable {find_ms:.1f}ms ({len(found)} found)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Times filling a `VariableSet` and a `GroupSet` as the variable
+repository does: one batch per group, with every variable added
+twice (once from the API, once when the same group is re-queried).
+
+Run with:
+    python -m benchmarks.code_sets [n_variables ...]
+"""
+
+import sys
+import time
+from typing import List
+
+from the_census._variables.models import Group, GroupCode, GroupVariable, VariableCode
+from the_census._variables.repository.models import GroupSet, VariableSet
+
+DEFAULT_SIZES = [1_000, 10_000, 50_000]
+VARIABLES_PER_GROUP = 25
+
+
+def make_variables(n_variables: int) -> List[List[GroupVariable]]:
+    batches: List[List[GroupVariable]] = []
+
+    for g in range(0, n_variables, VARIABLES_PER_GROUP):
+        group = GroupCode(f"B{g:06d}")
+        batches.append(
+            [
+                GroupVariable(
+                    code=VariableCode(f"{group}_{v:03d}E"),
+                    group_code=group,
+                    group_concept=f"Group {g}",
+                    name=f"Estimate!!Total:!!Item {v}",
+                    limit=0,
+                    predicate_only=True,
+                    predicate_type="int",
+                    cleaned_name=f"Estimate_Total_Item{v}",
+                )
+                for v in range(min(VARIABLES_PER_GROUP, n_variables - g))
+            ]
+        )
+
+    return batches
+
+
+def make_groups(n_groups: int) -> List[Group]:
+    # every tenth group shares its name with the next one
+    return [
+        Group(
+            code=GroupCode(f"B{g:06d}"),
+            description=f"Group {g - g % 10 if g % 10 < 2 else g}",
+            cleaned_name=f"Group{g - g % 10 if g % 10 < 2 else g}",
+        )
+        for g in range(n_groups)
+    ]
+
+
+def main() -> None:
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+
+    for n_variables in sizes:
+        batches = make_variables(n_variables)
+        groups = make_groups(n_variables // VARIABLES_PER_GROUP)
+
+        start = time.perf_counter()
+        variable_set = VariableSet()
+        for batch in batches + batches:
+            variable_set.add(*batch)
+        variables_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        group_set = GroupSet(*groups)
+        group_set.add(*groups)
+        groups_ms = (time.perf_counter() - start) * 1000
+
+        print(
+            f"{n_variables:>7} variables: VariableSet {variables_ms:9.1f}ms; "
+            f"{len(groups):>5} groups: GroupSet {groups_ms:7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
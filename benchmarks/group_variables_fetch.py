@@ -0,0 +1,100 @@
+"""
+Times `VariableRepository.get_variables_by_group` for `n_groups`
+groups that aren't cached, against an API that takes
+`DELAY_S` to answer each request, with the requests made one
+at a time and concurrently.
+
+Run with:
+    python -m benchmarks.group_variables_fetch [n_groups]
+"""
+
+import sys
+import time
+from typing import Any, Dict, Optional
+from unittest.mock import MagicMock
+
+from tests.utils import MockRes
+from the_census._api.fetch import CensusApiFetchService
+from the_census._api.interface import IHttpTransport
+from the_census._api.rate_limit import TokenBucket
+from the_census._api.serialization import ApiSerializationService
+from the_census._config import Config
+from the_census._data_transformation.service import CensusDataTransformer
+from the_census._persistence.inMemory import InMemoryCache
+from the_census._persistence.onDisk import OnDiskCache
+from the_census._persistence.variableStore import SqliteVariableStore
+from the_census._variables.models import GroupCode
+from the_census._variables.repository.service import VariableRepository
+
+DEFAULT_N_GROUPS = 200
+DELAY_S = 0.05
+VARIABLES_PER_GROUP = 23
+
+
+class SlowTransport(IHttpTransport):
+    """
+    Answers every group's variables request after `DELAY_S`
+    """
+
+    def get(self, url: str, timeout: Optional[float] = None) -> Any:
+        time.sleep(DELAY_S)
+
+        group = url.split("/groups/")[1].split(".json")[0]
+        variables: Dict[str, Any] = {
+            f"{group}_{v:03d}E": dict(
+                label=f"Estimate!!Total:!!Item {v}",
+                concept=f"Group {group}",
+                predicateType="int",
+                group=group,
+                limit=0,
+                predicateOnly=True,
+            )
+            for v in range(VARIABLES_PER_GROUP)
+        }
+
+        return MockRes(200, dict(variables=variables))
+
+    def close(self) -> None:
+        ...
+
+
+def make_repo(max_concurrent_requests: int) -> VariableRepository:
+    config = Config(2019, max_concurrent_requests=max_concurrent_requests)
+    cache = OnDiskCache(config, MagicMock())
+
+    return VariableRepository(
+        cache,
+        SqliteVariableStore(config, cache, MagicMock()),
+        InMemoryCache(config, MagicMock()),
+        CensusDataTransformer(config, MagicMock()),
+        CensusApiFetchService(
+            config,
+            ApiSerializationService(),
+            SlowTransport(),
+            TokenBucket(),
+            MagicMock(),
+        ),
+        MagicMock(),
+    )
+
+
+def main() -> None:
+    n_groups = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_N_GROUPS
+    groups = [GroupCode(f"B{g:05d}") for g in range(n_groups)]
+
+    for max_concurrent_requests in [1, 10, 50]:
+        repo = make_repo(max_concurrent_requests)
+
+        start = time.perf_counter()
+        variables = repo.get_variables_by_group(*groups)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        print(
+            f"max_concurrent_requests={max_concurrent_requests:>2}: "
+            f"{elapsed_ms:8.1f}ms for {n_groups} groups "
+            f"({len(variables)} variables, {DELAY_S * 1000:.0f}ms latency)"
+        )
+
+
+if __name__ == "__main__":
+    main()
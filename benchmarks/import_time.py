@@ -0,0 +1,176 @@
+"""
+Times a cold start, each phase in a fresh interpreter: importing
+`the_census`, importing `Census`, making the first `Census` (which
+is when pandas, requests, etc. are imported), and its first query.
+Also lists the packages that took the longest to import, as
+`python -X importtime` reports them.
+
+With `--max-ms`, exits non-zero if importing `Census` takes longer
+than that (at the median), so that it can catch regressions.
+
+Run with:
+    python -m benchmarks.import_time [--runs R] [--top N] [--max-ms MS]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Set, Tuple
+
+from benchmarks.mock_server import MockApiConfig, serve
+
+IMPORT_STATEMENTS = ["import the_census", "from the_census import Census"]
+
+# run in a fresh interpreter; prints how long (in ms) each phase took
+COLD_START = """
+import json, os, sys, time
+
+start = time.perf_counter()
+from the_census import Census
+imported = time.perf_counter()
+
+import the_census._container
+wired = time.perf_counter()
+
+from benchmarks.mock_server import LocalTransport
+transport = LocalTransport(sys.argv[1])
+
+made = time.perf_counter()
+census = Census(
+    2019,
+    survey="acs5",
+    cache_dir=os.path.join(sys.argv[2], "cache"),
+    log_file=os.path.join(sys.argv[2], "census.log"),
+    transport=transport,
+)
+constructed = time.perf_counter()
+
+census.get_groups()
+queried = time.perf_counter()
+
+print(json.dumps({
+    "from the_census import Census": (imported - start) * 1000,
+    "importing the container": (wired - imported) * 1000,
+    "Census()": (constructed - made) * 1000,
+    "first query (get_groups)": (queried - constructed) * 1000,
+}))
+"""
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:  # type: ignore
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "CENSUS_API_KEY": "benchmark"},
+    )
+
+
+def import_ms(statement: str) -> float:
+    res = run_python(
+        "-c",
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print((time.perf_counter() - start) * 1000)",
+    )
+
+    return float(res.stdout)
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """
+    Parses `-X importtime` output into (module, self us, cumulative us)
+    """
+    parsed: List[Tuple[str, int, int]] = []
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        parsed.append((module.strip(), int(self_us), int(cumulative_us)))
+
+    return parsed
+
+
+def slowest_packages(statement: str, top: int) -> Tuple[int, List[Tuple[str, int]]]:
+    """
+    The time `statement` spends importing modules (beyond what
+    the interpreter imports on its own), and the top-level
+    packages that took the longest, by cumulative time
+    """
+    baseline: Set[str] = {
+        module
+        for module, _, _ in parse_importtime(
+            run_python("-X", "importtime", "-c", "pass").stderr
+        )
+    }
+    imported = [
+        entry
+        for entry in parse_importtime(
+            run_python("-X", "importtime", "-c", statement).stderr
+        )
+        if entry[0] not in baseline
+    ]
+
+    total_us = sum(self_us for _, self_us, _ in imported)
+    packages: Dict[str, int] = {}
+    for module, _, cumulative_us in imported:
+        if "." not in module and module != "the_census":
+            packages[module] = max(packages.get(module, 0), cumulative_us)
+
+    return total_us, sorted(packages.items(), key=lambda p: -p[1])[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    medians: Dict[str, float] = {}
+
+    for statement in IMPORT_STATEMENTS:
+        medians[statement] = statistics.median(
+            import_ms(statement) for _ in range(args.runs)
+        )
+        total_us, packages = slowest_packages(statement, args.top)
+
+        print(
+            f"{statement:32} {medians[statement]:8.1f}ms "
+            f"(median of {args.runs}; {total_us / 1000:.1f}ms importing modules)"
+        )
+        for package, cumulative_us in packages:
+            print(f"    {package:28} {cumulative_us / 1000:8.1f}ms")
+
+    phases: Dict[str, List[float]] = {}
+    with serve(MockApiConfig()) as server:
+        for _ in range(args.runs):
+            with tempfile.TemporaryDirectory() as tmp:
+                res = run_python("-c", COLD_START, server.url, tmp)
+
+            for phase, ms in json.loads(res.stdout).items():
+                phases.setdefault(phase, []).append(ms)
+
+    print("cold start:")
+    for phase, times in phases.items():
+        print(f"    {phase:28} {statistics.median(times):8.1f}ms")
+
+    budgeted = IMPORT_STATEMENTS[-1]
+    if args.max_ms is not None and medians[budgeted] > args.max_ms:
+        print(
+            f"`{budgeted}` took {medians[budgeted]:.1f}ms, "
+            f"over the budget of {args.max_ms:.1f}ms"
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+Drives `Census` end to end against the local mock API (see
+`benchmarks.mock_server`), and reports, for each of its main entry
+points: requests/sec, p50/p99 latency, peak RSS, and the most
+memory allocated at once while the call ran.
+
+Every run uses a new `Census`, so that nothing is served from its
+in-memory cache.
+
+Run with:
+    python -m benchmarks.load_test [--variables N] [--geographies M]
+        [--latency-ms L] [--error-rate E] [--concurrency C] [--runs R]
+"""
+
+import argparse
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+from benchmarks.mock_server import LocalTransport, MockApiConfig, serve
+from the_census import Census, GeoDomain
+from the_census._variables.models import GroupCode, VariableCode
+
+# pyright: reportPrivateUsage=false
+
+
+@dataclass(frozen=True)
+class EntryPoint:
+    name: str
+    # makes whatever the call needs, without timing it
+    setup: Callable[[], Optional[Census]]
+    call: Callable[[Any], object]
+
+
+@dataclass(frozen=True)
+class Result:
+    name: str
+    runs: int
+    errors: int
+    requests: int
+    mb_received: float
+    elapsed_s: float
+    latencies_ms: List[float]
+    peak_rss_mb: float
+    peak_allocated_mb: float
+
+    def percentile(self, p: float) -> float:
+        if len(self.latencies_ms) == 1:
+            return self.latencies_ms[0]
+
+        return statistics.quantiles(self.latencies_ms, n=100, method="inclusive")[
+            int(p) - 1
+        ]
+
+
+def peak_rss_mb() -> float:
+    # kilobytes on Linux, bytes on macOS
+    scale = 1024 ** 2 if sys.platform == "darwin" else 1024
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def run(entry: EntryPoint, transport: LocalTransport, runs: int) -> Result:
+    latencies_ms: List[float] = []
+    errors = 0
+    requests = 0
+    n_bytes = 0
+    elapsed_s = 0.0
+
+    for _ in range(runs):
+        census = entry.setup()
+
+        requests_before, bytes_before = transport.counts()
+        start = time.perf_counter()
+
+        try:
+            entry.call(census)
+        except Exception:
+            errors += 1
+
+        took_s = time.perf_counter() - start
+        requests_after, bytes_after = transport.counts()
+
+        elapsed_s += took_s
+        latencies_ms.append(took_s * 1000)
+        requests += requests_after - requests_before
+        n_bytes += bytes_after - bytes_before
+
+    # allocations are traced in a run of their own, since
+    # tracing slows everything else down
+    census = entry.setup()
+    tracemalloc.start()
+    try:
+        entry.call(census)
+    except Exception:
+        pass
+    _, peak_allocated = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return Result(
+        entry.name,
+        runs,
+        errors,
+        requests,
+        n_bytes / 1024 ** 2,
+        elapsed_s,
+        latencies_ms,
+        peak_rss_mb(),
+        peak_allocated / 1024 ** 2,
+    )
+
+
+def main() -> None:
+    defaults = MockApiConfig()
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--variables", type=int, default=defaults.n_variables)
+    parser.add_argument("--geographies", type=int, default=defaults.n_geographies)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    config = MockApiConfig(
+        n_variables=args.variables,
+        n_geographies=args.geographies,
+        latency_s=args.latency_ms / 1000,
+        error_rate=args.error_rate,
+    )
+
+    os.environ.setdefault("CENSUS_API_KEY", "benchmark")
+
+    groups = [GroupCode(config.group_code(g)) for g in range(config.n_groups)]
+    variables = [
+        VariableCode(code)
+        for g in range(config.n_groups)
+        for code in config.variable_codes(g)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp_dir, serve(config) as server:
+        transport = LocalTransport(server.url, pool_size=args.concurrency)
+
+        def new_census() -> Census:
+            return Census(
+                config.year,
+                config.dataset,
+                config.survey,
+                transport=transport,
+                max_concurrent_requests=args.concurrency,
+                cache_dir=os.path.join(tmp_dir, "cache"),
+                log_file=os.path.join(tmp_dir, "census.log"),
+            )
+
+        def with_variables() -> Census:
+            census = new_census()
+            census.get_variables_by_group(*groups)
+
+            return census
+
+        entry_points = [
+            # the healthcheck, and setting up the container
+            EntryPoint("Census()", lambda: None, lambda _: new_census()),
+            EntryPoint("get_groups", new_census, lambda c: c.get_groups()),
+            EntryPoint(
+                "get_variables_by_group",
+                new_census,
+                lambda c: c.get_variables_by_group(*groups),
+            ),
+            EntryPoint(
+                "get_all_variables", new_census, lambda c: c.get_all_variables()
+            ),
+            EntryPoint(
+                "get_geography_codes",
+                new_census,
+                lambda c: c.get_geography_codes(
+                    GeoDomain("county"), GeoDomain("state")
+                ),
+            ),
+            EntryPoint(
+                "get_stats",
+                with_variables,
+                lambda c: c.get_stats(
+                    variables, GeoDomain("county"), GeoDomain("state", "01")
+                ),
+            ),
+        ]
+
+        print(
+            f"{config.n_variables} variables ({config.n_groups} groups), "
+            f"{config.n_geographies} geographies, {args.latency_ms:.0f}ms latency, "
+            f"{args.error_rate:.0%} errors, {args.concurrency} concurrent requests, "
+            f"{args.runs} runs each\n"
+        )
+        print(
+            f"{'':>22} {'req/s':>8} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7} "
+            f"{'MB recv':>8} {'peak RSS MB':>12} {'peak alloc MB':>14}"
+        )
+
+        for entry in entry_points:
+            result = run(entry, transport, args.runs)
+
+            print(
+                f"{result.name:>22} "
+                f"{result.requests / result.elapsed_s:8.1f} "
+                f"{result.percentile(50):9.1f} {result.percentile(99):9.1f} "
+                f"{result.errors:>7} {result.mb_received:8.1f} "
+                f"{result.peak_rss_mb:12.1f} {result.peak_allocated_mb:14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+"""
+A local stand-in for the Census API, serving synthetic groups,
+variables, geographies and data, at whatever scale, latency and
+error rate a benchmark needs.
+
+The server runs in its own process, so that it doesn't compete with
+the client for the GIL, or count towards the client's memory use.
+`Census` objects reach it through a `LocalTransport`:
+
+```python
+with serve(MockApiConfig(n_variables=5_000)) as server:
+    census = Census(2019, transport=LocalTransport(server.url))
+```
+
+Run on its own with:
+    python -m benchmarks.mock_server [--port 8000] [--variables N] ...
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Generator, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from the_census._api.transport import HttpTransport
+
+CENSUS_API_URL = "https://api.census.gov"
+
+# the geographies served, each with the geographies it has to be in
+GEOGRAPHIES: Dict[str, List[str]] = {
+    "us": [],
+    "state": [],
+    "county": ["state"],
+    "tract": ["state", "county"],
+}
+
+
+@dataclass(frozen=True)
+class MockApiConfig:
+    year: int = 2019
+    dataset: str = "acs"
+    survey: str = "acs5"
+
+    # how many variables there are, across how many groups
+    n_variables: int = 1_000
+    variables_per_group: int = 25
+    # how many geographies every `for=...:*` query returns
+    n_geographies: int = 100
+
+    # how long every response takes
+    latency_s: float = 0.0
+    # the share of requests that fail with a 503
+    error_rate: float = 0.0
+    seed: int = 0
+
+    @property
+    def n_groups(self) -> int:
+        return -(-self.n_variables // self.variables_per_group)
+
+    def group_code(self, g: int) -> str:
+        return f"B{g:05d}"
+
+    def variable_codes(self, g: int) -> List[str]:
+        first = g * self.variables_per_group
+        last = min(first + self.variables_per_group, self.n_variables)
+
+        return [
+            f"{self.group_code(g)}_{v - first + 1:03d}E" for v in range(first, last)
+        ]
+
+
+def _variable(config: MockApiConfig, g: int, code: str) -> Dict[str, Any]:
+    return dict(
+        label=f"Estimate!!Total:!!Item {code[-4:-1]}",
+        concept=f"SYNTHETIC CONCEPT {g} BY SEX BY AGE",
+        predicateType="int",
+        group=config.group_code(g),
+        limit=0,
+        predicateOnly=True,
+    )
+
+
+class _Routes:
+    """
+    Builds the responses to every route of the API. Metadata
+    responses are built once, and served from memory after that
+    """
+
+    config: MockApiConfig
+    base_path: str
+    _static: Dict[str, bytes]
+
+    def __init__(self, config: MockApiConfig) -> None:
+        self.config = config
+        self.base_path = f"/data/{config.year}/{config.dataset}/{config.survey}"
+        self._static = {}
+
+    def get(self, path: str, query: str) -> Optional[bytes]:
+        if query == "":
+            if path not in self._static:
+                res = self._metadata(path)
+                if res is None:
+                    return None
+                self._static[path] = json.dumps(res).encode()
+
+            return self._static[path]
+
+        if path != self.base_path:
+            return None
+
+        return self._data(dict(parse_qsl(query)), query)
+
+    def _metadata(self, path: str) -> Any:
+        config = self.config
+
+        if path == self.base_path + ".json":
+            return "OK"
+
+        if path == self.base_path + "/groups.json":
+            return dict(
+                groups=[
+                    dict(
+                        name=config.group_code(g),
+                        description=f"SYNTHETIC CONCEPT {g} BY SEX BY AGE",
+                        variables=f"{CENSUS_API_URL}{self.base_path}"
+                        f"/groups/{config.group_code(g)}.json",
+                    )
+                    for g in range(config.n_groups)
+                ]
+            )
+
+        if path == self.base_path + "/variables.json":
+            return dict(
+                variables={
+                    code: _variable(config, g, code)
+                    for g in range(config.n_groups)
+                    for code in config.variable_codes(g)
+                }
+            )
+
+        if path.startswith(self.base_path + "/groups/"):
+            group = path.rsplit("/", 1)[1].removesuffix(".json")
+            g = int(group[1:]) if group[1:].isdigit() else -1
+
+            if not 0 <= g < config.n_groups:
+                return None
+
+            return dict(
+                variables={
+                    code: _variable(config, g, code)
+                    for code in config.variable_codes(g)
+                }
+            )
+
+        if path == self.base_path + "/geography.json":
+            return dict(
+                default=[dict(isDefault="True")],
+                fips=[
+                    dict(
+                        name=name,
+                        geoLevelDisplay=f"{i:03d}",
+                        referenceDate=f"{config.year}-01-01",
+                        **(dict(requires=parents, wildcard=parents) if parents else {}),
+                    )
+                    for i, (name, parents) in enumerate(GEOGRAPHIES.items())
+                ],
+            )
+
+        return None
+
+    def _data(self, params: Dict[str, str], query: str) -> Optional[bytes]:
+        variables = params.get("get", "").split(",")
+        for_level = unquote(params.get("for", "")).split(":")[0]
+        in_levels = [
+            unquote(value).split(":") for key, value in parse_qsl(query) if key == "in"
+        ]
+
+        if for_level not in GEOGRAPHIES or variables[0] != "NAME":
+            return None
+
+        codes = variables[1:]
+        header = variables + [level for level, _ in in_levels] + [for_level]
+        parents = [value for _, value in in_levels]
+
+        rows: List[List[str]] = [header]
+        for i in range(self.config.n_geographies):
+            rows.append(
+                [f"{for_level.title()} {i}"]
+                + [str((i * 7 + j * 13) % 100_000) for j in range(len(codes))]
+                + parents
+                + [f"{i:06d}"]
+            )
+
+        return json.dumps(rows).encode()
+
+
+def _make_handler(routes: _Routes) -> type:
+    config = routes.config
+    rand = random.Random(config.seed)
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        # keeps connections open between requests, as the API does
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            if config.latency_s > 0:
+                time.sleep(config.latency_s)
+
+            with lock:
+                should_fail = rand.random() < config.error_rate
+
+            if should_fail:
+                self._respond(503, b"Service Unavailable", "text/plain")
+                return
+
+            url = urlsplit(self.path)
+            query = "&".join(
+                param for param in url.query.split("&") if not param.startswith("key=")
+            )
+            body = routes.get(url.path, query)
+
+            if body is None:
+                self._respond(404, b"Not Found", "text/plain")
+            else:
+                self._respond(200, body, "application/json")
+
+        def _respond(self, status: int, body: bytes, content_type: str) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_: Any) -> None:
+
+            ...
+
+    return Handler
+
+
+def make_server(config: MockApiConfig, port: int = 0) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", port), _make_handler(_Routes(config)))
+    server.daemon_threads = True
+
+    return server
+
+
+def _serve_from_child(config: MockApiConfig, port: int, ready: Connection) -> None:
+    server = make_server(config, port)
+
+    ready.send(server.server_address[1])
+
+    server.serve_forever()
+
+
+@dataclass(frozen=True)
+class MockServer:
+    config: MockApiConfig
+    url: str
+
+
+@contextmanager
+def serve(
+    config: MockApiConfig = MockApiConfig(), port: int = 0
+) -> Generator[MockServer, None, None]:
+    """
+    Serves the mock API from another process until the context
+    exits. By default, it listens on any free port
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_serve_from_child, args=(config, port, sender), daemon=True
+    )
+    process.start()
+
+    try:
+        yield MockServer(config, f"http://127.0.0.1:{receiver.recv()}")
+    finally:
+        process.terminate()
+        process.join()
+
+
+class LocalTransport(HttpTransport):
+    """
+    Sends requests meant for the Census API to `url` instead,
+    and counts how many it's sent, and how many bytes it's received
+    """
+
+    _url: str
+    _lock: threading.Lock
+    n_requests: int
+    n_bytes: int
+
+    def __init__(self, url: str, pool_size: int = 64):
+        super().__init__(pool_size=pool_size)
+
+        self._url = url
+        self._lock = threading.Lock()
+        self.n_requests = 0
+        self.n_bytes = 0
+
+    def get(self, url: str, timeout: Optional[float] = None) -> Any:
+        res = super().get(url.replace(CENSUS_API_URL, self._url, 1), timeout)
+
+        with self._lock:
+            self.n_requests += 1
+            self.n_bytes += len(res.content)
+
+        return res
+
+    def counts(self) -> Tuple[int, int]:
+        with self._lock:
+            return self.n_requests, self.n_bytes
+
+
+def main() -> None:
+    defaults = MockApiConfig()
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--variables", type=int, default=defaults.n_variables)
+    parser.add_argument("--geographies", type=int, default=defaults.n_geographies)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_s * 1000)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    args = parser.parse_args()
+
+    config = MockApiConfig(
+        n_variables=args.variables,
+        n_geographies=args.geographies,
+        latency_s=args.latency_ms / 1000,
+        error_rate=args.error_rate,
+    )
+
+    print(f"serving {asdict(config)} on http://127.0.0.1:{args.port}")
+
+    make_server(config, args.port).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Records `n_responses` stats responses (each about the size of a
+49-variable query for every tract in a state) with
+`RecordingTransport`, then times replaying them with
+`ReplayTransport`, against parsing the same JSON from memory.
+
+Run with:
+    python -m benchmarks.replay [n_responses]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Any, List, Optional
+
+from tests.utils import MockRes
+from the_census._api.interface import IHttpTransport
+from the_census._api.transport import RecordingTransport, ReplayTransport
+
+DEFAULT_N_RESPONSES = 200
+ROWS_PER_RESPONSE = 1_500
+VARIABLES_PER_RESPONSE = 49
+
+
+def make_response(i: int) -> List[List[str]]:
+    header = ["NAME"] + [f"B{i:05d}_{v:03d}E" for v in range(VARIABLES_PER_RESPONSE)]
+    rows = [
+        [f"Census Tract {r}, Some County, Some State"]
+        + [str((r * v + i) % 10_000) for v in range(VARIABLES_PER_RESPONSE)]
+        for r in range(ROWS_PER_RESPONSE)
+    ]
+
+    return [header] + rows
+
+
+class FakeTransport(IHttpTransport):
+    """
+    Answers every request with a stats response
+    """
+
+    def get(self, url: str, timeout: Optional[float] = None) -> Any:
+        return MockRes(200, make_response(int(url.split("i=")[1].split("&")[0])))
+
+    def close(self) -> None:
+
+        ...
+
+
+def url(i: int) -> str:
+    return f"https://api.census.gov/data/2019/acs/acs5?get=NAME&i={i}&key=secret"
+
+
+def main() -> None:
+    n_responses = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_N_RESPONSES
+
+    with tempfile.TemporaryDirectory() as archive_dir:
+        archive_path = os.path.join(archive_dir, "responses.db")
+
+        with RecordingTransport(archive_path, FakeTransport()) as transport:
+            for i in range(n_responses):
+                transport.get(url(i))
+
+        archive_mb = os.path.getsize(archive_path) / 1024 ** 2
+        raw = [json.dumps(make_response(i)) for i in range(n_responses)]
+        raw_mb = sum(len(body) for body in raw) / 1024 ** 2
+
+        with ReplayTransport(archive_path) as transport:
+            start = time.perf_counter()
+            for i in range(n_responses):
+                transport.get(url(i)).json()
+            replay_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        for body in raw:
+            json.loads(body)
+        parse_ms = (time.perf_counter() - start) * 1000
+
+    print(
+        f"{n_responses} responses: {raw_mb:.1f}MB of JSON, "
+        f"archived in {archive_mb:.1f}MB"
+    )
+    print(
+        f"replay {replay_ms / n_responses:6.2f}ms/response, "
+        f"parsing JSON from memory {parse_ms / n_responses:6.2f}ms/response"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Times constructing a `Census` on top of a warm on-disk cache of
+`n_groups` groups (ACS5 has ~1,200), and what reading from the
+cache costs once something needs it: finding one variable (as a
+stats query does), and loading every variable (as
+`Census.variables` does).
+
+Run with:
+    python -m benchmarks.startup [n_groups]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks._mock_api import mock_api
+from benchmarks.cache_cold_start import DEFAULT_N_GROUPS, warm_cache
+from the_census import Census
+from the_census._config import Config
+from the_census._variables.models import VariableCode
+
+# pyright: reportPrivateUsage=false
+
+
+def main() -> None:
+    n_groups = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_N_GROUPS
+
+    os.environ.setdefault("CENSUS_API_KEY", "benchmark")
+
+    with tempfile.TemporaryDirectory() as cache_dir, mock_api():
+        warm_cache(
+            Config(
+                2019,
+                "acs",
+                "acs1",
+                cache_dir=cache_dir,
+                should_cache_on_disk=True,
+                should_load_from_existing_cache=True,
+            ),
+            n_groups,
+        )
+
+        start = time.perf_counter()
+        census = Census(
+            2019,
+            cache_dir=cache_dir,
+            should_cache_on_disk=True,
+            should_load_from_existing_cache=True,
+            log_file=os.path.join(cache_dir, "census.log"),
+        )
+        construct_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        found = census._client._variable_repo.find_variables(
+            VariableCode("B00000_000E")
+        )
+        find_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        n_variables = len(census.variables)
+        load_all_ms = (time.perf_counter() - start) * 1000
+
+    print(
+        f"{n_groups} cached groups: construct {construct_ms:8.1f}ms, "
+        f"find 1 variable {find_ms:8.1f}ms ({len(found)} found), "
+        f"load all {load_all_ms:8.1f}ms ({n_variables} variables)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Compares ways of building the stats frame from API chunks:
+- joining chunks one at a time with `pd.merge`, then converting
+  the object-dtype result with `astype` (the original approach)
+- the same joins, with numeric columns parsed afterwards (the
+  fallback path, for chunks whose geographies don't line up)
+- assembling chunks in one go, parsing numeric columns straight
+  from the raw rows (the fast path)
+
+Run with:
+    python -m benchmarks.stats_assembly [n_variables] [n_geographies]
+"""
+
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from the_census._api.fetch import MAX_QUERY_SIZE
+from the_census._config import Config
+from the_census._data_transformation.service import CensusDataTransformer
+from the_census._utils.chunk import chunk
+
+MERGE_KEYS = ["state", "county", "tract"]
+
+
+def make_variables(n_variables: int) -> List[str]:
+    return [f"B{i:05d}_001E" for i in range(n_variables)]
+
+
+def make_results(n_variables: int, n_geographies: int) -> List[List[List[str]]]:
+    variables = make_variables(n_variables)
+    geographies = [
+        (f"Tract {i}", f"{i % 50:02d}", f"{i % 300:03d}", f"{i:06d}")
+        for i in range(n_geographies)
+    ]
+    value = "12345"
+
+    return [
+        [["NAME"] + codes + MERGE_KEYS]
+        + [
+            [name] + [value] * len(codes) + [st, co, tr]
+            for name, st, co, tr in geographies
+        ]
+        for codes in chunk(variables, MAX_QUERY_SIZE - 1)
+    ]
+
+
+def measure(name: str, fn: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+    start = time.perf_counter()
+    df = fn()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:>14}: {elapsed_ms:8.1f}ms, peak {peak / 2 ** 20:8.1f}MiB")
+
+    return df
+
+
+def main() -> None:
+    n_variables = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    n_geographies = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+
+    results = make_results(n_variables, n_geographies)
+    transformer = CensusDataTransformer(Config(), MagicMock())
+
+    print(
+        f"{len(results)} chunks, {n_variables} variables, {n_geographies} geographies"
+    )
+
+    type_conversions: Dict[str, Any] = {
+        code: float for code in make_variables(n_variables)
+    }
+
+    original = measure(
+        "merge + astype",
+        lambda: transformer._merge_chunks(results, MERGE_KEYS).astype(type_conversions),
+    )
+    merged = measure(
+        "merge + parse",
+        lambda: transformer._parse_numeric_columns(
+            transformer._merge_chunks(results, MERGE_KEYS), type_conversions
+        ),
+    )
+    concatenated = measure(
+        "concat + parse",
+        lambda: transformer._concat_chunks(results, MERGE_KEYS, type_conversions),
+    )
+
+    for df in [merged, concatenated]:
+        pd.testing.assert_frame_equal(
+            original.sort_index(axis=1), df.sort_index(axis=1)
+        )
+    print("all approaches produce the same frame")
+
+
+if __name__ == "__main__":
+    main()
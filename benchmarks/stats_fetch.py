@@ -0,0 +1,81 @@
+"""
+Compares sequential and concurrent chunk fetching in
+`CensusApiFetchService.stats`.
+
+Run with:
+    python -m benchmarks.stats_fetch
+"""
+
+import time
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from benchmarks._mock_api import mock_api
+from the_census._api.fetch import CensusApiFetchService
+from the_census._api.rate_limit import TokenBucket
+from the_census._api.transport import HttpTransport
+from the_census._config import Config
+from the_census._data_transformation.service import CensusDataTransformer
+from the_census._geographies.models import GeoDomain
+from the_census._variables.models import VariableCode
+
+DELAY_S = 0.1
+RUNS = 5
+
+VARIABLES = [
+    VariableCode(code) for code in ["B17015_001E", "B18104_001E", "B18105_001E"]
+]
+FOR_DOMAIN = GeoDomain("congressional district")
+IN_DOMAINS = [GeoDomain("state", "01")]
+SUPPORTED_GEOS = pd.DataFrame(
+    [
+        dict(name="state", hierarchy="040"),
+        dict(name="congressional district", hierarchy="500"),
+    ]
+)
+
+
+def fetch_and_transform(max_concurrent_requests: int) -> pd.DataFrame:
+    config = Config(2019, max_concurrent_requests=max_concurrent_requests)
+    api = CensusApiFetchService(
+        config, MagicMock(), HttpTransport(), TokenBucket(), MagicMock()
+    )
+    transformer = CensusDataTransformer(config, MagicMock())
+
+    results: List[List[List[str]]] = list(api.stats(VARIABLES, FOR_DOMAIN, IN_DOMAINS))
+
+    return transformer.stats(
+        results,
+        {code: float for code in VARIABLES},
+        [FOR_DOMAIN] + IN_DOMAINS,
+        {code: code for code in VARIABLES},
+        SUPPORTED_GEOS,
+    )
+
+
+def main() -> None:
+    # the mocked API responses have one variable per chunk
+    with mock_api(DELAY_S), patch("the_census._api.fetch.MAX_QUERY_SIZE", 2):
+        frames = {}
+        for max_concurrent_requests in [1, len(VARIABLES)]:
+            start = time.perf_counter()
+            for _ in range(RUNS):
+                frames[max_concurrent_requests] = fetch_and_transform(
+                    max_concurrent_requests
+                )
+            elapsed_ms = (time.perf_counter() - start) * 1000 / RUNS
+
+            print(
+                f"max_concurrent_requests={max_concurrent_requests}: "
+                f"{elapsed_ms:.1f}ms per query "
+                f"({len(VARIABLES)} chunks, {DELAY_S * 1000:.0f}ms latency)"
+            )
+
+    pd.testing.assert_frame_equal(frames[1], frames[len(VARIABLES)])
+    print("sequential and concurrent results are identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Compares searching `n_groups` groups' worth of variables (ACS5
+has ~1,200 groups with ~28k variables) with the search index, and
+by regex over every variable (as `search_variables` does), for a
+few queries of the sort a search box would send as someone types,
+and for a few misspelled ones (with fuzzy search). Also times
+building the index from the variable store.
+
+Run with:
+    python -m benchmarks.variable_search [n_groups]
+"""
+
+import sys
+import tempfile
+import time
+from typing import Callable
+
+import pandas as pd
+
+from benchmarks.cache_cold_start import (
+    DEFAULT_N_GROUPS,
+    make_config,
+    make_store,
+    warm_cache,
+)
+from the_census._variables.search.index import SearchIndex
+
+RUNS = 100
+
+QUERIES = ["gro*", "group 12*", "group 123 item 7", "estimate total item 22"]
+
+FUZZY_QUERIES = ["grop 12", "estimat totl item 22"]
+
+
+def time_ms(search: Callable[[], pd.DataFrame]) -> float:
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        search()
+
+    return (time.perf_counter() - start) * 1000 / RUNS
+
+
+def search_by_regex(variables: pd.DataFrame, query: str) -> pd.DataFrame:
+    # roughly what `search_variables` would need to do to match every term
+    pattern = "".join(f"(?=.*{term.rstrip('*')})" for term in query.split())
+    text = variables["name"] + " " + variables["group_concept"]
+
+    return variables[text.str.contains(pattern, case=False)]  # type: ignore
+
+
+def main() -> None:
+    n_groups = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_N_GROUPS
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        config = make_config(cache_dir)
+        warm_cache(config, n_groups)
+
+        start = time.perf_counter()
+        variables = make_store(config).get_all()
+        index = SearchIndex()
+        index.add(variables)
+        build_ms = (time.perf_counter() - start) * 1000
+
+    print(f"load & index {len(variables)} variables: {build_ms:8.1f}ms")
+
+    for query in QUERIES:
+        terms = query.split()
+        res = index.search(terms, limit=20)
+
+        index_ms = time_ms(lambda: index.search(terms, limit=20))
+        regex_ms = time_ms(lambda: search_by_regex(variables, query))
+
+        print(
+            f"{query!r:>26}: index {index_ms:6.2f}ms (top {len(res)}), "
+            f"regex {regex_ms:6.2f}ms"
+        )
+
+    for query in FUZZY_QUERIES:
+        terms = query.split()
+        res = index.search(terms, limit=20, fuzzy=True)
+
+        fuzzy_ms = time_ms(lambda: index.search(terms, limit=20, fuzzy=True))
+
+        print(f"{query!r:>26}: fuzzy {fuzzy_ms:6.2f}ms (top {len(res)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,12 @@ from pytest import FixtureRequest, MonkeyPatch
 from pytest_mock.plugin import MockerFixture
 
 from tests import utils
+from the_census._api.health import HEALTH_CHECKS
+from the_census._api.rate_limit import reset_rate_limit
+from the_census._config import Config
+from the_census._persistence.inMemory import InMemoryCache
+from the_census._persistence.interface import IMemoCache
+from the_census._utils.metrics import METRICS
 
 # pyright: reportPrivateUsage=false
 
@@ -18,9 +24,26 @@ def no_requests(monkeypatch: MonkeyPatch):
     monkeypatch.delattr("requests.sessions.Session.request")
 
 
+@pytest.fixture(autouse=True)
+def forget_healthchecks():
+    """Make each test's healthchecks hit the (mocked) API."""
+    HEALTH_CHECKS.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    METRICS.reset()
+
+
+@pytest.fixture(autouse=True)
+def lift_rate_limits():
+    """Keep one test's `max_requests_per_second` from slowing the next."""
+    reset_rate_limit()
+
+
 @pytest.fixture(scope="function")
 def api_fixture(request: FixtureRequest, mocker: MockerFixture):
-    request.cls.requests_get_mock = mocker.patch.object(requests, "get")  # type: ignore
+    request.cls.requests_get_mock = mocker.patch.object(requests.Session, "get")  # type: ignore
 
 
 @pytest.fixture(scope="function")
@@ -48,7 +71,10 @@ def service_fixture(request: FixtureRequest):
     for dep_name, dep_type in inspect.signature(service).parameters.items():
         # this condition will be true if the service inherits
         # from a generic class
-        if hasattr(dep_type.annotation, "__origin__"):
+        if dep_type.annotation is IMemoCache:
+            # memoized methods need a working memo to call through to
+            dependencies[dep_name] = InMemoryCache(Config(), MagicMock())
+        elif hasattr(dep_type.annotation, "__origin__"):
             dependencies[dep_name] = MagicMock(dep_type.annotation.__origin__)
         else:
             dependencies[dep_name] = MagicMock(dep_type.annotation)
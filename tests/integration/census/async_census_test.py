@@ -0,0 +1,130 @@
+import asyncio
+from typing import Set
+
+import pytest
+from pytest_mock import MockerFixture
+
+from tests.integration.census.census_test import (  # noqa: F401
+    api_calls,
+    expectedStatsResWithNames,
+    given_env_var,
+    set_current_path,
+)
+from the_census import AsyncCensus, Census, GeoDomain
+from the_census._exceptions import CensusDoesNotExistException
+from the_census._variables.models import GroupCode, VariableCode
+
+# pyright: reportUnusedImport=false
+
+variables = [
+    VariableCode(code) for code in "B17015_001E,B18104_001E,B18105_001E".split(",")
+]
+groups = [GroupCode(group) for group in ["B17015", "B18104", "B18105"]]
+
+
+@pytest.mark.integration
+class TestAsyncCensus:
+    def test_get_variables_by_group_matches_census(self):
+        census = Census(2019)
+        async_census = AsyncCensus(2019)
+
+        res = asyncio.run(async_census.get_variables_by_group(*groups))
+
+        assert res.to_dict("records") == census.get_variables_by_group(*groups).to_dict(
+            "records"
+        )
+        assert async_census.variables == census.variables
+
+    def test_get_stats_fetches_chunks_concurrently(
+        self, api_calls: Set[str], mocker: MockerFixture
+    ):
+        mocker.patch("the_census._api.fetch.MAX_QUERY_SIZE", 2)
+        census = AsyncCensus(2019)
+
+        async def get_stats():
+            await census.get_variables_by_group(*groups)
+
+            return await census.get_stats(
+                variables,
+                GeoDomain("congressional district"),
+                GeoDomain("state", "01"),
+            )
+
+        res = asyncio.run(get_stats())
+
+        assert res.to_dict("records") == expectedStatsResWithNames
+        assert {
+            "https://api.census.gov/data/2019/acs/acs1?get=NAME,B17015_001E&for=congressional%20district:*&in=state:01",
+            "https://api.census.gov/data/2019/acs/acs1?get=NAME,B18104_001E&for=congressional%20district:*&in=state:01",
+            "https://api.census.gov/data/2019/acs/acs1?get=NAME,B18105_001E&for=congressional%20district:*&in=state:01",
+        }.issubset(api_calls)
+
+    def test_trace_nests_chunks_fetched_concurrently(self, mocker: MockerFixture):
+        mocker.patch("the_census._api.fetch.MAX_QUERY_SIZE", 2)
+        census = AsyncCensus(2019)
+
+        async def get_stats():
+            await census.get_variables_by_group(*groups)
+
+            with AsyncCensus.trace() as trace:
+                await census.get_stats(
+                    variables,
+                    GeoDomain("congressional district"),
+                    GeoDomain("state", "01"),
+                )
+
+            return trace
+
+        trace = asyncio.run(get_stats())
+        by_id = {span.id: span for span in trace.spans}
+        chunks = [span for span in trace.spans if span.name == "fetch chunk"]
+        requests = [span for span in trace.spans if span.name == "GET"]
+
+        assert sorted(span.attributes["chunk"] for span in chunks) == [0, 1, 2]
+        assert all(
+            by_id[span.parent_id or 0].name == "AsyncCensusClient.get_stats"
+            for span in chunks
+        )
+        # requests are made on worker threads, but still nested in their chunk
+        assert sorted(
+            by_id[span.parent_id or 0].attributes["chunk"]
+            for span in requests
+            if by_id[span.parent_id or 0].name == "fetch chunk"
+        ) == [0, 1, 2]
+
+    def test_concurrent_queries(self):
+        census = AsyncCensus(2019)
+
+        async def get_both():
+            return await asyncio.gather(
+                census.get_groups(),
+                census.get_supported_geographies(),
+            )
+
+        group_df, geo_df = asyncio.run(get_both())
+
+        assert not group_df.empty
+        assert not geo_df.empty
+
+    def test_healthcheck_is_deferred(self, api_calls: Set[str]):
+        census = AsyncCensus(2019, healthcheck_ttl_seconds=0)
+
+        assert api_calls == set()
+
+        asyncio.run(census.healthcheck())
+
+        assert api_calls == {"https://api.census.gov/data/2019/acs/acs1.json"}
+
+    def test_healthcheck_fails(self):
+        census = AsyncCensus(2020)
+
+        with pytest.raises(
+            CensusDoesNotExistException,
+            match="Data does not exist for dataset=acs; survey=acs1; year=2020",
+        ):
+            asyncio.run(census.healthcheck())
+
+    def test_repr(self):
+        assert (
+            str(AsyncCensus(2019)) == "<AsyncCensus year=2019 dataset=acs survey=acs1>"
+        )
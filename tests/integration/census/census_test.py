@@ -1,8 +1,13 @@
+import json
 import os
 import re
 import shutil
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable, Collection, Dict, Generator, List, Optional, Set, cast
+from unittest.mock import MagicMock
 
 import pandas
 import pytest
@@ -12,7 +17,15 @@ from pytest_mock import MockerFixture
 
 from tests.integration.census.mock_api_responses import MOCK_API
 from tests.utils import MockRes
-from the_census import Census, GeoDomain
+from the_census import (
+    Census,
+    GeoDomain,
+    HttpTransport,
+    RecordingTransport,
+    ReplayTransport,
+)
+from the_census._api.interface import IHttpTransport
+from the_census._client import CensusClient
 from the_census._exceptions import CensusDoesNotExistException, NoCensusApiKeyException
 from the_census._geographies.models import GeoDomainTypes
 from the_census._utils.clean_variable_name import clean_variable_name
@@ -158,11 +171,38 @@ def verify_resource(
             assert df.to_dict("records") == expected_data
 
 
+def verify_stored_variables(
+    group: str,
+    exists: bool = True,
+    expected_data: Optional[List[Dict[str, Any]]] = None,
+):
+    path = Path("cache/2019/acs/acs1/variables.db")
+
+    df = (
+        pandas.read_sql_query(
+            "SELECT * FROM variables WHERE group_code = ? ORDER BY code",
+            sqlite3.connect(path),
+            params=[group],
+        )
+        if path.exists()
+        else pandas.DataFrame()
+    )
+
+    if not exists:
+        assert df.empty
+    else:
+        assert not df.empty
+
+        if expected_data:
+            df["predicate_only"] = df["predicate_only"].astype(bool)
+            assert df.to_dict("records") == expected_data
+
+
 @pytest.fixture(scope="function", autouse=True)
 def api_calls(mocker: MockerFixture) -> Set[str]:
     _api_calls: Set[str] = set()
 
-    def mockGet(route: str):
+    def mockGet(route: str, timeout: Optional[float] = None):
         route_without_api_key = re.sub(r"(\?|&)key=.*", "", route)
 
         _api_calls.add(route_without_api_key)
@@ -173,7 +213,7 @@ def api_calls(mocker: MockerFixture) -> Set[str]:
 
         return MockRes(status_code, res)
 
-    mocker.patch.object(requests, "get", mockGet)
+    mocker.patch.object(requests.Session, "get", side_effect=mockGet)
 
     return _api_calls
 
@@ -316,6 +356,10 @@ class TestCensus:
         ):
             _ = Census(2020)
 
+        # failed healthchecks aren't remembered
+        with pytest.raises(CensusDoesNotExistException):
+            _ = Census(2020)
+
     def test_no_environment_variable_set(self, mocker: MockerFixture):
         mocker.patch.object(os, "getenv", return_value=None)
         with pytest.raises(
@@ -431,7 +475,7 @@ class TestCensus:
 
         # no variables should exist yet
         for code in group_codes:
-            verify_resource(f"variables/{code}.csv", exists=False)
+            verify_stored_variables(code, exists=False)
 
         variables = census.get_variables_by_group(*group_codes)
 
@@ -439,8 +483,8 @@ class TestCensus:
         # verify that they exist in the on-disk cache...
         variables["cleaned_name"] = variables["name"].apply(clean_variable_name)
         for code in group_codes:
-            verify_resource(
-                f"variables/{code}.csv",
+            verify_stored_variables(
+                code,
                 exists=True,
                 expected_data=[
                     variable
@@ -461,8 +505,8 @@ class TestCensus:
 
         for group, variables in allVars.groupby(["group_code"]):  # type: ignore
             variables["cleaned_name"] = variables["name"].apply(clean_variable_name)
-            verify_resource(
-                f"variables/{group}.csv",
+            verify_stored_variables(
+                group,
                 exists=True,
                 expected_data=variables.to_dict("records"),
             )
@@ -772,6 +816,59 @@ class TestCensus:
 
         assert res.to_dict("records") == expectedRes
 
+    @pytest.mark.parametrize("should_cache_on_disk", [True, False])
+    def test_search(self, api_calls: Set[str], should_cache_on_disk: bool):
+        census = Census(2019, should_cache_on_disk=should_cache_on_disk)
+
+        res = census.search("ambulatory estimate")
+
+        assert res["code"].tolist() == ["B18105_001E", "B18105_001EA"]
+        assert res["score"].is_monotonic_decreasing
+        assert "cleaned_name" not in res.columns
+
+        api_calls.clear()
+
+        res = census.search("annot* total", limit=2)
+
+        assert len(res) == 2
+        assert all(res["name"].str.startswith("Annotation"))
+        assert len(api_calls) == 0
+
+    def test_fuzzy_search(self):
+        census = Census(2019)
+
+        assert census.search("ambulatry dificulty estimate").empty
+
+        res = census.search("ambulatry dificulty estimate", fuzzy=True)
+
+        assert res["code"].tolist() == ["B18105_001E", "B18105_001EA"]
+
+    def test_find_groups(self):
+        census = Census(2019)
+
+        res = census.find_groups("ambulatry dificulty", fuzzy=True)
+
+        assert res["code"].tolist() == ["B18105"]
+        assert res["score"].tolist()[0] > 0
+
+        res = census.find_groups("sex by age by .* difficulty")
+
+        assert res["code"].tolist() == ["B18104", "B18105"]
+
+    def test_search_uses_cached_variables(self, api_calls: Set[str]):
+        census = Census(2019, should_cache_on_disk=True)
+        expected = census.search("ambulatory estimate")
+
+        api_calls.clear()
+
+        census = Census(
+            2019, should_cache_on_disk=True, should_load_from_existing_cache=True
+        )
+        res = census.search("ambulatory estimate")
+
+        assert res.to_dict("records") == expected.to_dict("records")
+        assert not any("variables" in call for call in api_calls)
+
     @pytest.mark.parametrize("should_rename_columns", [(True), (False)])
     def test_stats_batches_api_calls(
         self, api_calls: Set[str], mocker: MockerFixture, should_rename_columns: bool
@@ -802,6 +899,67 @@ class TestCensus:
             "https://api.census.gov/data/2019/acs/acs1?get=NAME,B18105_001E&for=congressional%20district:*&in=state:01",
         }.issubset(api_calls)
 
+    def test_stats_fetches_only_new_variables(
+        self, api_calls: Set[str], mocker: MockerFixture
+    ):
+        census = Census(2019, replace_column_headers=True)
+
+        mocker.patch("the_census._api.fetch.MAX_QUERY_SIZE", 2)
+
+        variables = [
+            VariableCode(code)
+            for code in "B17015_001E,B18104_001E,B18105_001E".split(",")
+        ]
+        for_domain = GeoDomain("congressional district")
+        in_domains = [GeoDomain("state", "01")]
+        _ = census.get_all_variables()
+
+        _ = census.get_stats(variables[:2], for_domain, *in_domains)
+        api_calls.clear()
+
+        res = census.get_stats(variables, for_domain, *in_domains)
+
+        assert res.to_dict("records") == expectedStatsResWithNames
+        assert api_calls == {
+            "https://api.census.gov/data/2019/acs/acs1?get=NAME,B18105_001E&for=congressional%20district:*&in=state:01",
+        }
+
+    @pytest.mark.parametrize("copy_results", [True, False])
+    def test_stats_copies(self, copy_results: bool):
+        census = Census(2019, copy_results=copy_results)
+        variables = [VariableCode("B17015_001E")]
+        for_domain = GeoDomain("congressional district")
+        in_domains = [GeoDomain("state", "01")]
+        _ = census.get_all_variables()
+
+        res = census.get_stats(variables, for_domain, *in_domains)
+        res["extra"] = 1
+        res.iloc[0, 0] = "changed"
+
+        again = census.get_stats(variables, for_domain, *in_domains)
+
+        assert "extra" not in again.columns
+        assert (again.iloc[0, 0] == "changed") != copy_results
+
+    @pytest.mark.parametrize("use_cache, refresh_cache", [(False, False), (True, True)])
+    def test_uncached_stats_are_not_copied(
+        self, mocker: MockerFixture, use_cache: bool, refresh_cache: bool
+    ):
+        census = Census(2019)
+        _ = census.get_all_variables()
+        copy = mocker.spy(CensusClient, "_CensusClient__copy")
+
+        res = census.get_stats(
+            [VariableCode("B17015_001E")],
+            GeoDomain("congressional district"),
+            GeoDomain("state", "01"),
+            use_cache=use_cache,
+            refresh_cache=refresh_cache,
+        )
+
+        assert not res.empty
+        copy.assert_not_called()
+
     def test_stats_with_duplicate_variable_names_across_groups(self):
         """Some group variables can have the same name (e.g. EstimateTotal). This
         test verifies that in this case, variable names are suffixed with their group code
@@ -945,6 +1103,52 @@ class TestCensus:
             },
         ]
 
+    @pytest.mark.parametrize(
+        "cache_format,should_rename_columns",
+        [("csv", True), ("csv", False), ("feather", True)],
+    )
+    def test_stats_cached_on_disk(
+        self, api_calls: Set[str], cache_format: str, should_rename_columns: bool
+    ):
+        if cache_format != "csv":
+            pytest.importorskip("pyarrow")
+
+        variables = [
+            VariableCode(code)
+            for code in "B17015_001E,B18104_001E,B18105_001E".split(",")
+        ]
+        for_domain = GeoDomain("congressional district")
+        in_domains = [GeoDomain("state", "01")]
+
+        def make_census() -> Census:
+            census = Census(
+                2019,
+                should_load_from_existing_cache=True,
+                should_cache_on_disk=True,
+                replace_column_headers=should_rename_columns,
+                cache_format=cache_format,
+            )
+            _ = census.get_all_variables()
+
+            return census
+
+        expected = make_census().get_stats(variables, for_domain, *in_domains)
+
+        # a new session, with the variables in a different order
+        census = make_census()
+        api_calls.clear()
+
+        res = census.get_stats(list(reversed(variables)), for_domain, *in_domains)
+
+        assert not any("get=NAME" in call for call in api_calls)
+        pandas.testing.assert_frame_equal(
+            res, expected[expected.columns[:3].tolist() + expected.columns[3:][::-1].tolist()]  # type: ignore
+        )
+
+        _ = census.get_stats(variables, for_domain, *in_domains, refresh_cache=True)
+
+        assert any("get=NAME" in call for call in api_calls)
+
     @pytest.mark.parametrize("should_load_from_cache", [(True), (False)])
     def test_populate_variable_repository(
         self,
@@ -1032,7 +1236,7 @@ class TestCensus:
     def test_empty_api_responses(
         self, censusCall: Callable[[Census], pandas.DataFrame], mocker: MockerFixture
     ):
-        mocker.patch.object(requests, "get", return_value=MockRes(204))
+        mocker.patch.object(requests.Session, "get", return_value=MockRes(204))
 
         census = Census(2019)
 
@@ -1097,6 +1301,218 @@ class TestCensus:
             == "For more documentation on the census, see https://www2.census.gov/programs-surveys/\nFor more documentation on ACS subject defintiions, see https://www2.census.gov/programs-surveys/acs/tech_docs/subject_definitions/2019_ACSSubjectDefinitions.pdf\n"
         )
 
+    def test_in_memory_cache(self, api_calls: Set[str]):
+        census = Census(2019)
+
+        _ = census.get_groups()
+        _ = census.get_groups()
+        info = census.cache_info()
+
+        assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+
+        census.invalidate("get_groups")
+        api_calls.clear()
+        _ = census.get_groups()
+
+        assert "https://api.census.gov/data/2019/acs/acs1/groups.json" in api_calls
+
+        census.clear()
+
+        assert census.cache_info().entries == 0
+
+        with pytest.raises(ValueError, match="Unknown queries"):
+            census.invalidate("get_banana")
+
+    def test_concurrent_identical_queries_share_requests(self):
+        census = Census(2019)
+        get = cast(MagicMock, requests.Session.get)
+        serve = get.side_effect
+
+        def slow_get(url: str, timeout: Optional[float] = None) -> MockRes:
+            time.sleep(0.05)
+            return serve(url, timeout)
+
+        get.side_effect = slow_get
+        get.reset_mock()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda _: census.get_variables_by_group(GroupCode("B17015")),
+                    range(4),
+                )
+            )
+
+        assert get.call_count == 1
+        assert all(res.equals(results[0]) for res in results)
+
+    def test_census_objects_share_transport(self, mocker: MockerFixture):
+        transport = HttpTransport()
+        transport_get = mocker.spy(transport, "get")
+
+        # so that both healthchecks are made
+        _ = Census(2019, transport=transport, healthcheck_ttl_seconds=0)
+        _ = Census(2019, transport=transport, healthcheck_ttl_seconds=0)
+
+        assert transport_get.call_count == 2
+
+    def test_healthcheck_is_made_once_per_dataset(self, api_calls: Set[str]):
+        _ = Census(2019)
+        api_calls.clear()
+
+        _ = Census(2019)
+        _ = Census(2019, dataset="acs", survey="acs1")
+
+        assert api_calls == set()
+
+    def test_deferred_healthcheck(self, api_calls: Set[str]):
+        census = Census(2019, defer_healthcheck=True)
+
+        assert api_calls == set()
+
+        _ = census.get_groups()
+
+        assert api_calls == {"https://api.census.gov/data/2019/acs/acs1/groups.json"}
+
+    def test_deferred_healthcheck_fails_with_first_query(self):
+        census = Census(2020, defer_healthcheck=True)
+
+        with pytest.raises(
+            CensusDoesNotExistException,
+            match="Data does not exist for dataset=acs; survey=acs1; year=2020",
+        ):
+            _ = census.get_groups()
+
+    def test_metrics(self, api_calls: Set[str]):
+        census = Census(2019, replace_column_headers=True)
+        _ = census.get_all_variables()
+        stats = census.get_stats(
+            [
+                VariableCode(code)
+                for code in "B17015_001E,B18104_001E,B18105_001E".split(",")
+            ],
+            GeoDomain("congressional district"),
+            GeoDomain("state", "01"),
+        )
+        _ = census.get_groups()
+        _ = census.get_groups()
+
+        metrics = Census.metrics()
+
+        assert metrics.timings["CensusStatisticsService.get_stats"].calls == 1
+        assert metrics.timings["VariableRepository.get_groups"].calls == 2
+        assert metrics.counters["stats_rows"] == len(stats)
+        assert metrics.counters['api_requests{status="200"}'] == len(api_calls)
+        assert metrics.counters['memo_hits{query="get_groups"}'] == 1
+        assert "the_census_stats_rows_total 7" in metrics.to_prometheus()
+
+    def test_trace(self, api_calls: Set[str]):
+        census = Census(2019, replace_column_headers=True)
+        _ = census.get_all_variables()
+        path = Path("trace.json")
+
+        with Census.trace(str(path)) as trace:
+            stats = census.get_stats(
+                [
+                    VariableCode(code)
+                    for code in "B17015_001E,B18104_001E,B18105_001E".split(",")
+                ],
+                GeoDomain("congressional district"),
+                GeoDomain("state", "01"),
+            )
+
+        by_id = {span.id: span for span in trace.spans}
+
+        def ancestors(name: str) -> List[str]:
+            span = next(span for span in trace.spans if span.name == name)
+            names: List[str] = []
+
+            while span.parent_id is not None:
+                span = by_id[span.parent_id]
+                names.append(span.name)
+
+            return names
+
+        root = next(span for span in trace.spans if span.parent_id is None)
+        request = next(span for span in trace.spans if span.name == "GET")
+
+        assert root.name == "CensusClient.get_stats"
+        assert root.attributes["rows"] == len(stats)
+        assert ancestors("GET") == [
+            "fetch chunk",
+            "fetch stats",
+            "CensusStatisticsService.get_stats",
+            "CensusClient.get_stats",
+        ]
+        assert ancestors("variable lookup")[-1] == "CensusClient.get_stats"
+        assert ancestors("sort")[0] == "CensusDataTransformer.stats"
+        assert request.attributes["status"] == 200
+        assert request.attributes["url_length"] > 0
+
+        written = json.loads(path.read_text())
+
+        assert {event["name"] for event in written["traceEvents"]} >= {
+            "CensusClient.get_stats",
+            "fetch chunk",
+            "GET",
+            "sort",
+        }
+
+        # nothing's traced outside of the block
+        _ = census.get_groups()
+
+        assert all(span.name != "VariableRepository.get_groups" for span in trace.spans)
+
+    def test_record_and_replay(self, api_calls: Set[str], mocker: MockerFixture):
+        archive = Path("temp/responses.db")
+        variables = [
+            VariableCode(code)
+            for code in "B17015_001E,B18104_001E,B18105_001E".split(",")
+        ]
+        for_domain = GeoDomain("congressional district")
+        in_domain = GeoDomain("state", "01")
+
+        def query(transport: IHttpTransport) -> pandas.DataFrame:
+            census = Census(2019, transport=transport, replace_column_headers=True)
+            _ = census.get_all_variables()
+
+            return census.get_stats(variables, for_domain, in_domain)
+
+        with RecordingTransport(archive) as transport:
+            recorded = query(transport)
+
+        n_calls = len(api_calls)
+        mocker.patch.object(requests.Session, "get", side_effect=ConnectionError)
+
+        with ReplayTransport(archive) as transport:
+            replayed = query(transport)
+
+        assert replayed.to_dict("records") == recorded.to_dict("records")
+        assert n_calls > 0
+
+    def test_list_available_datasets_is_recorded(self):
+        archive = Path("temp/datasets.db")
+
+        with RecordingTransport(archive) as transport:
+            recorded = Census(2019, transport=transport).list_available_datasets()
+
+        with ReplayTransport(archive) as transport:
+            res = transport.get("https://api.census.gov/data.json")
+
+        assert len(res.json()["dataset"]) >= len(recorded)
+
+    def test_list_available_datasets_is_in_the_census_memo(self):
+        census = Census(2019)
+
+        datasets = census.list_available_datasets()
+
+        assert census.cache_info().entries == 1
+        assert census.list_available_datasets() is datasets
+
+        census.invalidate("list_available_datasets")
+
+        assert census.cache_info().entries == 0
+
     def test_repr(self):
         c = Census(2019)
 
@@ -0,0 +1,106 @@
+import sqlite3
+import zlib
+from pathlib import Path
+
+import pytest
+
+from tests.utils import MockRes
+from the_census._api.archive import ResponseArchive, normalize_url
+from the_census._api.retry import retry_after_seconds
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        (
+            "https://api.census.gov/data/2019/acs/acs1.json",
+            "https://api.census.gov/data/2019/acs/acs1.json",
+        ),
+        (
+            "https://api.census.gov/data/2019/acs/acs1?key=abc",
+            "https://api.census.gov/data/2019/acs/acs1",
+        ),
+        (
+            "https://api.census.gov/data/2019/acs/acs1?get=NAME&for=state:*&key=abc",
+            "https://api.census.gov/data/2019/acs/acs1?for=state:*&get=NAME",
+        ),
+    ],
+)
+def test_normalize_url(url: str, expected: str):
+    assert normalize_url(url) == expected
+
+
+def test_put_and_get(tmp_path: Path):
+    archive = ResponseArchive(tmp_path / "responses.db")
+
+    archive.put("https://api.census.gov/a?key=1", MockRes(200, {"a": [1, 2]}))
+    archive.put("https://api.census.gov/b?key=1", MockRes(404, b""))
+
+    a = archive.get("https://api.census.gov/a?key=2")
+    b = archive.get("https://api.census.gov/b")
+
+    assert a is not None and a.status_code == 200
+    assert a.json() == {"a": [1, 2]}
+    assert b is not None and b.status_code == 404
+    assert b.content == b""
+    with pytest.raises(ValueError):
+        b.json()
+    assert archive.get("https://api.census.gov/c") is None
+    assert len(archive) == 2
+
+
+def test_archive_persists(tmp_path: Path):
+    archive = ResponseArchive(tmp_path / "responses.db")
+    archive.put("https://api.census.gov/a", MockRes(200, ["hi"]))
+    archive.close()
+
+    res = ResponseArchive(tmp_path / "responses.db").get("https://api.census.gov/a")
+
+    assert res is not None
+    assert res.json() == ["hi"]
+
+
+def test_responses_are_archived_without_being_decoded(tmp_path: Path):
+    archive = ResponseArchive(tmp_path / "responses.db")
+    page = b"<html>Invalid Key</html>"
+
+    archive.put(
+        "https://api.census.gov/a",
+        MockRes(200, page, headers={"Content-Type": "text/html", "X-Other": "1"}),
+    )
+    archive.put(
+        "https://api.census.gov/b", MockRes(503, b"", headers={"Retry-After": "5"})
+    )
+
+    a = archive.get("https://api.census.gov/a")
+    b = archive.get("https://api.census.gov/b")
+
+    assert a is not None and a.content == page
+    assert a.headers == {"Content-Type": "text/html"}
+    with pytest.raises(ValueError):
+        a.json()
+    assert b is not None and b.headers == {"Retry-After": "5"}
+    assert retry_after_seconds(b) == 5
+
+
+def test_archives_without_headers_are_migrated(tmp_path: Path):
+    path = tmp_path / "responses.db"
+    with sqlite3.connect(path) as connection:
+        connection.execute(
+            "CREATE TABLE responses "
+            "(url TEXT PRIMARY KEY, status_code INTEGER NOT NULL, body BLOB)"
+        )
+        connection.execute(
+            "INSERT INTO responses VALUES (?, ?, ?)",
+            ["https://api.census.gov/a", 200, zlib.compress(b'["hi"]')],
+        )
+    connection.close()
+
+    archive = ResponseArchive(path)
+    archive.put("https://api.census.gov/b", MockRes(429, headers={"Retry-After": "1"}))
+
+    a = archive.get("https://api.census.gov/a")
+    b = archive.get("https://api.census.gov/b")
+
+    assert a is not None and a.json() == ["hi"] and a.headers == {}
+    assert b is not None and b.headers == {"Retry-After": "1"}
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+from typing import Optional
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from tests.utils import MockRes
+from the_census._api.async_fetch import AsyncCensusApiFetchService, shared_executor
+from the_census._api.health import HEALTH_CHECKS
+from the_census._api.rate_limit import TokenBucket
+from the_census._config import Config
+from the_census._exceptions import CensusDoesNotExistException, InvalidQueryException
+from the_census._geographies.models import GeoDomain
+from the_census._variables.models import VariableCode
+
+
+def make_service(transport: MagicMock, max_concurrent_requests: int = 2):
+    return AsyncCensusApiFetchService(
+        Config(2019, max_concurrent_requests=max_concurrent_requests),
+        MagicMock(),
+        transport,
+        TokenBucket(),
+        MagicMock(),
+    )
+
+
+def test_stats_returns_chunks_in_order_and_respects_concurrency_cap(
+    mocker: MockerFixture,
+):
+    mocker.patch("the_census._api.fetch.MAX_QUERY_SIZE", 2)
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def mock_get(url: str, timeout: Optional[float] = None) -> MockRes:
+        nonlocal in_flight, max_in_flight
+
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+
+        code = url.split("get=NAME,")[1].split("&")[0]
+        # earlier chunks finish last
+        time.sleep(0.01 * (5 - int(code)))
+
+        with lock:
+            in_flight -= 1
+
+        return MockRes(200, [["NAME", code]])
+
+    service = make_service(MagicMock(get=mock_get), max_concurrent_requests=2)
+
+    res = asyncio.run(
+        service.stats([VariableCode(str(i)) for i in range(5)], GeoDomain("state"))
+    )
+
+    assert res == [[["NAME", str(i)]] for i in range(5)]
+    assert max_in_flight == 2
+
+
+def test_service_can_be_used_across_event_loops():
+    transport = MagicMock()
+    transport.get.return_value = MockRes(200, {"variables": {}})
+    service = make_service(transport)
+
+    assert asyncio.run(service.variables_for_group("abc")) is not None
+    assert asyncio.run(service.variables_for_group("def")) is not None
+
+
+def test_fetch_raises_for_invalid_query():
+    HEALTH_CHECKS.record_pass(Config(2019))
+    transport = MagicMock()
+    transport.get.return_value = MockRes(404)
+    service = make_service(transport)
+
+    with pytest.raises(
+        InvalidQueryException, match="Could not make query for route `/groups.json`"
+    ):
+        asyncio.run(service.group_data())
+
+
+def test_fetch_raises_if_dataset_does_not_exist():
+    transport = MagicMock()
+    transport.get.return_value = MockRes(404)
+    service = make_service(transport)
+
+    with pytest.raises(CensusDoesNotExistException):
+        asyncio.run(service.group_data())
+
+
+def test_healthcheck_fail():
+    transport = MagicMock()
+    transport.get.return_value = MockRes(404)
+    service = make_service(transport)
+
+    with pytest.raises(CensusDoesNotExistException):
+        asyncio.run(service.healthcheck())
+
+
+def test_services_share_an_executor():
+    transport = MagicMock()
+    transport.get.return_value = MockRes(200, {"variables": {}})
+    services = [make_service(transport, max_concurrent_requests=2) for _ in range(3)]
+    executor = shared_executor(2)
+
+    for service in services:
+        assert asyncio.run(service.variables_for_group("abc")) is not None
+
+    assert shared_executor(1) is executor
+
+
+def test_shared_executor_grows_for_services_that_allow_more_requests(
+    mocker: MockerFixture,
+):
+    mocker.patch("the_census._api.async_fetch._executor", None)
+    mocker.patch("the_census._api.async_fetch._executor_workers", 0)
+
+    executor = shared_executor(2)
+    bigger = shared_executor(4)
+
+    assert bigger is not executor
+    assert shared_executor(4) is bigger
+    assert shared_executor(2) is bigger
@@ -1,4 +1,7 @@
-from typing import List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 from unittest.mock import MagicMock, call
 
 import pytest
@@ -7,22 +10,37 @@ from callee import StartsWith, String
 from tests.service_test_fixtures import ApiServiceTestFixture
 from tests.utils import MockRes
 from the_census._api.fetch import CensusApiFetchService
+from the_census._api.health import HEALTH_CHECKS
 from the_census._api.interface import ICensusApiSerializationService
+from the_census._api.rate_limit import TokenBucket
+from the_census._api.transport import HttpTransport
 from the_census._config import Config
-from the_census._exceptions import CensusDoesNotExistException, InvalidQueryException
+from the_census._exceptions import (
+    CensusApiUnavailableException,
+    CensusDoesNotExistException,
+    InvalidQueryException,
+)
 from the_census._geographies.models import GeoDomain
 from the_census._variables.models import VariableCode
 
 mockConfig = Config(year=2019, dataset="acs", survey="acs1")
+TIMEOUT = mockConfig.request_timeout_seconds
 
 
 class ApiServiceWrapper(CensusApiFetchService):
     def __init__(self, parser: ICensusApiSerializationService) -> None:
-        super().__init__(config=mockConfig, parser=parser, logging_factory=MagicMock())
+        super().__init__(
+            config=mockConfig,
+            parser=parser,
+            transport=HttpTransport(),
+            rate_limiter=TokenBucket(),
+            logging_factory=MagicMock(),
+        )
 
 
 class TestApiFetchService(ApiServiceTestFixture[ApiServiceWrapper]):
     def test_400_status_code(self):
+        HEALTH_CHECKS.record_pass(mockConfig)
         self.requests_get_mock.return_value = MockRes(404)
 
         with pytest.raises(
@@ -69,7 +87,7 @@ class TestApiFetchService(ApiServiceTestFixture[ApiServiceWrapper]):
         self._service.geography_codes(domain, parent_domains)
 
         self.requests_get_mock.assert_called_once_with(
-            String() & StartsWith(expected_route)
+            String() & StartsWith(expected_route), timeout=TIMEOUT
         )
 
     def test_group_data_calls_fetch(self):
@@ -77,7 +95,8 @@ class TestApiFetchService(ApiServiceTestFixture[ApiServiceWrapper]):
 
         self.requests_get_mock.assert_called_once_with(
             String()
-            & StartsWith("https://api.census.gov/data/2019/acs/acs1/groups.json")
+            & StartsWith("https://api.census.gov/data/2019/acs/acs1/groups.json"),
+            timeout=TIMEOUT,
         )
 
     def test_supported_geographies_calls_fetch(self):
@@ -85,7 +104,8 @@ class TestApiFetchService(ApiServiceTestFixture[ApiServiceWrapper]):
 
         self.requests_get_mock.assert_called_once_with(
             String()
-            & StartsWith("https://api.census.gov/data/2019/acs/acs1/geography.json")
+            & StartsWith("https://api.census.gov/data/2019/acs/acs1/geography.json"),
+            timeout=TIMEOUT,
         )
 
     def test_variables_for_group_calls_fetch(self):
@@ -97,7 +117,8 @@ class TestApiFetchService(ApiServiceTestFixture[ApiServiceWrapper]):
             String()
             & StartsWith(
                 f"https://api.census.gov/data/2019/acs/acs1/groups/{group}.json"
-            )
+            ),
+            timeout=TIMEOUT,
         )
 
     def test_stats_calls_fetch_in_batches(self):
@@ -120,13 +141,15 @@ class TestApiFetchService(ApiServiceTestFixture[ApiServiceWrapper]):
                 String()
                 & StartsWith(
                     "https://api.census.gov/data/2019/acs/acs1?get=NAME,1,2&for=banana:*&in=phone:92"
-                )
+                ),
+                timeout=TIMEOUT,
             ),
             call(
                 String()
                 & StartsWith(
                     "https://api.census.gov/data/2019/acs/acs1?get=NAME,3,4&for=banana:*&in=phone:92"
-                )
+                ),
+                timeout=TIMEOUT,
             ),
         ]
 
@@ -135,7 +158,8 @@ class TestApiFetchService(ApiServiceTestFixture[ApiServiceWrapper]):
 
         self.requests_get_mock.assert_called_once_with(
             String()
-            & StartsWith("https://api.census.gov/data/2019/acs/acs1/variables.json")
+            & StartsWith("https://api.census.gov/data/2019/acs/acs1/variables.json"),
+            timeout=TIMEOUT,
         )
 
     def test_stats_yields_batches(self):
@@ -178,3 +202,129 @@ class TestApiFetchService(ApiServiceTestFixture[ApiServiceWrapper]):
             self._service.healthcheck()
 
         self.cast_mock(self._service._logger.exception).assert_called_once_with(msg)
+
+    def test_healthcheck_is_skipped_once_passed(self):
+        self.requests_get_mock.return_value = MockRes(200)
+
+        self._service.healthcheck()
+        self._service.healthcheck()
+
+        assert self.requests_get_mock.call_count == 1
+        self.cast_mock(self._service._logger.debug).assert_called_with(
+            "healthcheck OK (passed recently)"
+        )
+
+    def test_failed_query_checks_that_dataset_exists(self):
+        self.requests_get_mock.return_value = MockRes(404)
+
+        with pytest.raises(CensusDoesNotExistException):
+            self._service.group_data()
+
+        self.requests_get_mock.assert_called_with(
+            "https://api.census.gov/data/2019/acs/acs1.json", timeout=TIMEOUT
+        )
+
+    def test_successful_query_shows_that_dataset_exists(self):
+        self.requests_get_mock.return_value = MockRes(200, ["ok"])
+
+        self._service._fetch("/groups.json")
+        self._service.healthcheck()
+
+        assert self.requests_get_mock.call_count == 1
+        assert HEALTH_CHECKS.passed(mockConfig)
+
+    def test_fetch_retries_server_errors(self):
+        sleep = self.mocker.patch("the_census._api.retry.time.sleep")
+        self.requests_get_mock.side_effect = [MockRes(503), MockRes(200, ["ok"])]
+
+        assert self._service._fetch("/groups.json") == ["ok"]
+        assert self.requests_get_mock.call_count == 2
+        sleep.assert_called_once()
+
+    def test_healthcheck_fails_if_api_stays_unavailable(self):
+        self.mocker.patch("the_census._api.retry.time.sleep")
+        self.requests_get_mock.return_value = MockRes(503)
+
+        with pytest.raises(CensusApiUnavailableException):
+            self._service.healthcheck()
+
+        assert self.requests_get_mock.call_count == mockConfig.max_retries + 1
+
+    def test_identical_concurrent_fetches_share_a_request(self):
+        def slow_get(url: str, timeout: Optional[float] = None) -> MockRes:
+            time.sleep(0.05)
+            return MockRes(200, ["ok"])
+
+        self.requests_get_mock.side_effect = slow_get
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda route: self._service._fetch(route),
+                    ["/groups.json"] * 4 + ["/geography.json"],
+                )
+            )
+
+        assert results == [["ok"]] * 5
+        assert self.requests_get_mock.call_count == 2
+
+    def test_stats_with_concurrent_requests_yields_batches_in_order(self):
+        self.mocker.patch("the_census._api.fetch.MAX_QUERY_SIZE", 2)
+        service = CensusApiFetchService(
+            Config(2019, max_concurrent_requests=3),
+            MagicMock(),
+            HttpTransport(),
+            TokenBucket(),
+            MagicMock(),
+        )
+
+        def mock_get(url: str, timeout: Optional[float] = None) -> MockRes:
+            # the first chunk is the slowest, so it
+            # will be the last one to come back
+            if "get=NAME,1&" in url:
+                time.sleep(0.05)
+
+            code = url.split("get=NAME,")[1].split("&")[0]
+
+            return MockRes(200, [["NAME", code], ["place", f"value {code}"]])
+
+        self.requests_get_mock.side_effect = mock_get
+
+        res = list(
+            service.stats(
+                [VariableCode("1"), VariableCode("2"), VariableCode("3")],
+                GeoDomain("state"),
+            )
+        )
+
+        assert res == [
+            [["NAME", "1"], ["place", "value 1"]],
+            [["NAME", "2"], ["place", "value 2"]],
+            [["NAME", "3"], ["place", "value 3"]],
+        ]
+        assert self.requests_get_mock.call_count == 3
+
+    def test_variables_for_groups_fetches_concurrently_in_order(self):
+        service = CensusApiFetchService(
+            Config(2019, max_concurrent_requests=3),
+            MagicMock(parse_group_variables=lambda res: res),  # type: ignore
+            HttpTransport(),
+            TokenBucket(),
+            MagicMock(),
+        )
+
+        def mock_get(url: str, timeout: Optional[float] = None) -> MockRes:
+            group = url.split("/groups/")[1].split(".json")[0]
+
+            # every request waits for the others to start, so they
+            # have to be made at the same time to finish
+            barrier.wait(timeout=1)
+
+            return MockRes(200, [group])
+
+        barrier = threading.Barrier(3)
+        self.requests_get_mock.side_effect = mock_get
+
+        res = list(service.variables_for_groups(["g1", "g2", "g3"]))
+
+        assert res == [["g1"], ["g2"], ["g3"]]
@@ -0,0 +1,69 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from the_census._api import health
+from the_census._api.health import HealthChecks
+from the_census._config import Config
+
+
+@pytest.fixture
+def now(mocker: MockerFixture) -> MagicMock:
+    return mocker.patch.object(health.time, "time", return_value=1000.0)
+
+
+def test_passes_are_remembered_until_they_expire(now: MagicMock):
+    config = Config(2019, healthcheck_ttl_seconds=60)
+    checks = HealthChecks()
+
+    assert not checks.passed(config)
+
+    checks.record_pass(config)
+
+    assert checks.passed(config)
+    assert not checks.passed(Config(2018, healthcheck_ttl_seconds=60))
+
+    now.return_value = 1059.0
+    assert checks.passed(config)
+
+    now.return_value = 1060.0
+    assert not checks.passed(config)
+
+
+def test_passes_are_shared_on_disk(now: MagicMock, tmp_path: Path):
+    config = Config(2019, cache_dir=str(tmp_path), should_cache_on_disk=True)
+
+    HealthChecks().record_pass(config)
+
+    assert (tmp_path / "healthchecks" / "2019-acs-acs1.json").exists()
+    assert HealthChecks().passed(config)
+    # without `should_cache_on_disk`, other processes'
+    # passes (and so the disk) aren't looked at
+    assert not HealthChecks().passed(
+        Config(2019, cache_dir=str(tmp_path), should_cache_on_disk=False)
+    )
+
+
+def test_unreadable_passes_are_ignored(tmp_path: Path):
+    config = Config(2019, cache_dir=str(tmp_path), should_cache_on_disk=True)
+    (tmp_path / "healthchecks").mkdir()
+    (tmp_path / "healthchecks" / "2019-acs-acs1.json").write_text("{")
+
+    assert not HealthChecks().passed(config)
+
+
+def test_zero_ttl_turns_caching_off(tmp_path: Path):
+    config = Config(
+        2019,
+        cache_dir=str(tmp_path),
+        should_cache_on_disk=True,
+        healthcheck_ttl_seconds=0,
+    )
+    checks = HealthChecks()
+
+    checks.record_pass(config)
+
+    assert not checks.passed(config)
+    assert not (tmp_path / "healthchecks").exists()
@@ -0,0 +1,152 @@
+import gc
+from typing import List
+
+import pytest
+from pytest_mock import MockerFixture
+
+from the_census._api import rate_limit
+from the_census._api.rate_limit import (
+    TokenBucket,
+    reset_rate_limit,
+    shared_rate_limiter,
+)
+from the_census._config import Config
+
+# pyright: reportPrivateUsage=false
+
+
+class Owner:
+    pass
+
+
+class FakeClock:
+    now: float
+    sleeps: List[float]
+
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(mocker: MockerFixture) -> FakeClock:
+    clock = FakeClock()
+
+    mocker.patch.object(rate_limit.time, "monotonic", clock.monotonic)
+    mocker.patch.object(rate_limit.time, "sleep", clock.sleep)
+
+    return clock
+
+
+def test_unlimited_bucket_never_waits(clock: FakeClock):
+    bucket = TokenBucket()
+
+    for _ in range(1_000):
+        bucket.acquire()
+
+    assert clock.sleeps == []
+
+
+def test_bucket_lets_a_burst_through_then_paces_requests(clock: FakeClock):
+    bucket = TokenBucket(max_requests_per_second=4)
+
+    for _ in range(8):
+        bucket.acquire()
+
+    assert clock.sleeps == [0.25, 0.25, 0.25, 0.25]
+
+
+def test_bucket_refills_while_idle(clock: FakeClock):
+    bucket = TokenBucket(max_requests_per_second=2)
+
+    bucket.acquire()
+    bucket.acquire()
+    clock.now += 0.5
+    bucket.acquire()
+
+    assert clock.sleeps == []
+
+
+def test_deferring_holds_back_every_request(clock: FakeClock):
+    bucket = TokenBucket()
+
+    bucket.defer(3)
+    bucket.defer(1)
+    bucket.acquire()
+    bucket.acquire()
+
+    assert clock.sleeps == [3.0]
+
+
+def test_the_lowest_limit_in_place_applies(clock: FakeClock):
+    bucket = TokenBucket(max_requests_per_second=10)
+    owner, other_owner = Owner(), Owner()
+
+    bucket.limit(owner, 20)
+    assert bucket.max_requests_per_second == 10
+
+    bucket.limit(other_owner, 5)
+    assert bucket.max_requests_per_second == 5
+
+    del other_owner
+    gc.collect()
+    assert bucket.max_requests_per_second == 10
+
+
+def test_limits_are_lifted_with_their_owners(clock: FakeClock):
+    bucket = TokenBucket()
+    owner = Owner()
+
+    bucket.limit(owner, 2)
+    for _ in range(4):
+        bucket.acquire()
+    assert clock.sleeps == [0.5, 0.5]
+
+    del owner
+    gc.collect()
+    for _ in range(4):
+        bucket.acquire()
+
+    assert bucket.max_requests_per_second is None
+    assert clock.sleeps == [0.5, 0.5]
+
+
+def test_reset_lifts_every_limit():
+    bucket = TokenBucket(max_requests_per_second=10)
+    owner = Owner()
+    bucket.limit(owner, 5)
+
+    bucket.reset()
+
+    assert bucket.max_requests_per_second == 10
+
+
+@pytest.mark.parametrize("max_requests_per_second", [0, -1])
+def test_rate_must_be_positive(max_requests_per_second: float):
+    with pytest.raises(ValueError, match="must be positive"):
+        TokenBucket(max_requests_per_second)
+
+
+def test_shared_rate_limiter_applies_the_lowest_limit(mocker: MockerFixture):
+    mocker.patch.object(rate_limit, "_shared", TokenBucket())
+    fast, slow = Config(max_requests_per_second=20), Config(max_requests_per_second=5)
+
+    assert shared_rate_limiter(Config()).max_requests_per_second is None
+    assert shared_rate_limiter(fast) is shared_rate_limiter(Config())
+    assert shared_rate_limiter(fast).max_requests_per_second == 20
+    assert shared_rate_limiter(slow).max_requests_per_second == 5
+
+    # once the slower `Census` is gone, the faster one isn't held back
+    del slow
+    gc.collect()
+    assert shared_rate_limiter(Config()).max_requests_per_second == 20
+
+    reset_rate_limit()
+    assert shared_rate_limiter(Config()).max_requests_per_second is None
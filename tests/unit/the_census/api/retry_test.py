@@ -0,0 +1,165 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Any, List
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+
+from tests.utils import MockRes
+from the_census._api import retry
+from the_census._api.retry import backoff_seconds, get_with_retries, retry_after_seconds
+from the_census._config import Config
+from the_census._exceptions import CensusApiUnavailableException
+
+URL = "https://api.census.gov/data/2019/acs/acs1/groups.json?key=secret"
+
+
+@pytest.fixture
+def sleep(mocker: MockerFixture) -> MagicMock:
+    return mocker.patch.object(retry.time, "sleep")
+
+
+def get(responses: List[Any], config: Config = Config()) -> Any:
+    transport = MagicMock(get=MagicMock(side_effect=responses))
+    rate_limiter = MagicMock()
+
+    res = get_with_retries(transport, URL, config, rate_limiter, MagicMock())
+
+    assert rate_limiter.acquire.call_count == transport.get.call_count
+
+    return res
+
+
+def test_success_is_not_retried(sleep: MagicMock):
+    assert get([MockRes(200, ["ok"])]).json() == ["ok"]
+
+    sleep.assert_not_called()
+
+
+@pytest.mark.parametrize("status_code", [400, 404, 204])
+def test_client_errors_are_not_retried(sleep: MagicMock, status_code: int):
+    assert get([MockRes(status_code)]).status_code == status_code
+
+    sleep.assert_not_called()
+
+
+@pytest.mark.parametrize("status_code", [500, 502, 503, 504])
+def test_server_errors_are_retried_with_backoff(sleep: MagicMock, status_code: int):
+    res = get(
+        [MockRes(status_code), MockRes(status_code), MockRes(200)],
+        Config(retry_backoff_seconds=2),
+    )
+
+    assert res.status_code == 200
+    first, second = [args[0] for args, _ in sleep.call_args_list]
+    assert 0 <= first <= 2
+    assert 0 <= second <= 4
+
+
+@pytest.mark.parametrize(
+    "error", [requests.ConnectionError("reset"), requests.Timeout(), TimeoutError()]
+)
+def test_connection_errors_are_retried(sleep: MagicMock, error: Exception):
+    assert get([error, MockRes(200)]).status_code == 200
+
+    sleep.assert_called_once()
+
+
+def test_requests_time_out_and_are_retried(sleep: MagicMock):
+    transport = MagicMock(get=MagicMock(side_effect=[requests.Timeout(), MockRes(200)]))
+
+    res = get_with_retries(
+        transport, URL, Config(request_timeout_seconds=5), MagicMock(), MagicMock()
+    )
+
+    assert res.status_code == 200
+    assert [args for args, _ in transport.get.call_args_list] == [(URL, 5), (URL, 5)]
+    sleep.assert_called_once()
+
+
+def test_throttling_defers_every_request(sleep: MagicMock):
+    transport = MagicMock(
+        get=MagicMock(
+            side_effect=[MockRes(429, headers={"Retry-After": "7"}), MockRes(200)]
+        )
+    )
+    rate_limiter = MagicMock()
+
+    get_with_retries(transport, URL, Config(), rate_limiter, MagicMock())
+
+    rate_limiter.defer.assert_called_once_with(7.0)
+    sleep.assert_not_called()
+
+
+def test_throttling_without_retry_after_defers_by_backoff(sleep: MagicMock):
+    transport = MagicMock(get=MagicMock(side_effect=[MockRes(429), MockRes(200)]))
+    rate_limiter = MagicMock()
+
+    get_with_retries(
+        transport, URL, Config(retry_backoff_seconds=3), rate_limiter, MagicMock()
+    )
+
+    (wait,), _ = rate_limiter.defer.call_args
+    assert 0 <= wait <= 3
+    sleep.assert_not_called()
+
+
+def test_gives_up_after_max_retries(sleep: MagicMock):
+    transport = MagicMock(get=MagicMock(return_value=MockRes(503)))
+    logger = MagicMock()
+
+    with pytest.raises(
+        CensusApiUnavailableException,
+        match=r"groups\.json` failed after 3 attempt\(s\) \(status 503\)",
+    ):
+        get_with_retries(transport, URL, Config(max_retries=2), MagicMock(), logger)
+
+    assert transport.get.call_count == 3
+    assert sleep.call_count == 2
+    # the API key is never logged
+    assert "secret" not in str(logger.mock_calls)
+
+
+def test_gives_up_on_connection_errors_with_the_last_one(sleep: MagicMock):
+    error = requests.ConnectionError("reset")
+
+    with pytest.raises(CensusApiUnavailableException) as e:
+        get([error], Config(max_retries=0))
+
+    assert e.value.__cause__ is error
+    sleep.assert_not_called()
+
+
+def test_other_errors_are_not_retried(sleep: MagicMock):
+    with pytest.raises(ValueError):
+        get([ValueError("bad"), MockRes(200)])
+
+    sleep.assert_not_called()
+
+
+def test_backoff_is_capped(mocker: MockerFixture):
+    uniform = mocker.patch.object(retry.random, "uniform", return_value=0)
+
+    backoff_seconds(3, 0.5)
+    backoff_seconds(30, 0.5)
+
+    assert uniform.call_args_list == [
+        mocker.call(0, 4.0),
+        mocker.call(0, retry.MAX_BACKOFF_SECONDS),
+    ]
+
+
+def test_retry_after_seconds():
+    in_a_minute = format_datetime(
+        datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True
+    )
+
+    assert retry_after_seconds(MockRes(429)) is None
+    assert retry_after_seconds(MockRes(429, headers={"Retry-After": "2.5"})) == 2.5
+    assert retry_after_seconds(MockRes(429, headers={"Retry-After": "-1"})) == 0
+    assert retry_after_seconds(MockRes(429, headers={"Retry-After": "soon"})) is None
+
+    seconds = retry_after_seconds(MockRes(429, headers={"Retry-After": in_a_minute}))
+    assert seconds is not None and 55 < seconds <= 60
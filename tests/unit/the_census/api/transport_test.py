@@ -0,0 +1,70 @@
+from pathlib import Path
+from typing import cast
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+from requests.adapters import HTTPAdapter
+
+from tests.utils import MockRes
+from the_census._api.interface import IHttpTransport
+from the_census._api.transport import HttpTransport, RecordingTransport, ReplayTransport
+from the_census._exceptions import ResponseNotRecordedException
+
+# pyright: reportPrivateUsage=false
+
+
+@pytest.mark.parametrize("url", ["https://api.census.gov", "http://api.census.gov"])
+def test_transport_pools_connections(url: str):
+    transport = HttpTransport(pool_size=25)
+
+    adapter = cast(HTTPAdapter, transport._session.get_adapter(url))
+
+    assert adapter._pool_maxsize == 25  # type: ignore
+    assert transport._session.headers["Connection"] == "keep-alive"
+
+
+def test_transport_without_keep_alive_closes_connections():
+    transport = HttpTransport(keep_alive=False)
+
+    assert transport._session.headers["Connection"] == "close"
+
+
+def test_transport_gets_through_its_session(mocker: MockerFixture):
+    get_mock = mocker.patch.object(
+        requests.Session, "get", return_value=MockRes(200, ["hi"])
+    )
+
+    with HttpTransport() as transport:
+        res = transport.get("https://api.census.gov/data.json", 5.0)
+
+    get_mock.assert_called_once_with("https://api.census.gov/data.json", timeout=5.0)
+    assert res.json() == ["hi"]
+
+
+def test_recording_transport_archives_responses(tmp_path: Path):
+    inner = MagicMock(IHttpTransport)
+    inner.get.return_value = MockRes(200, ["hi"])
+
+    with RecordingTransport(tmp_path / "responses.db", inner) as transport:
+        res = transport.get("https://api.census.gov/data.json?key=secret", 5.0)
+
+    assert res.json() == ["hi"]
+    inner.get.assert_called_once_with(
+        "https://api.census.gov/data.json?key=secret", 5.0
+    )
+    inner.close.assert_called_once()
+
+    with ReplayTransport(tmp_path / "responses.db") as transport:
+        assert transport.get("https://api.census.gov/data.json?key=other").json() == [
+            "hi"
+        ]
+
+        with pytest.raises(ResponseNotRecordedException):
+            transport.get("https://api.census.gov/other.json")
+
+
+def test_replay_transport_needs_an_archive(tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        ReplayTransport(tmp_path / "responses.db")
@@ -233,7 +233,7 @@ class TestCensusDataTransformer(ServiceTestFixture[CensusDataTransformer]):
             assert res.dtypes.to_dict() == {  # type: ignore
                 "NAME": np.dtype("O"),
                 "apple": np.dtype("float64"),
-                "banana": np.dtype("int64"),
+                "banana": pd.Int64Dtype(),
                 "geoCol1": np.dtype("O"),
                 "geoCol2": np.dtype("O"),
                 "peach": np.dtype("O"),
@@ -252,7 +252,7 @@ class TestCensusDataTransformer(ServiceTestFixture[CensusDataTransformer]):
             assert res.dtypes.to_dict() == {  # type: ignore
                 "NAME": np.dtype("O"),
                 "var2": np.dtype("float64"),
-                "var1": np.dtype("int64"),
+                "var1": pd.Int64Dtype(),
                 "geoCol1": np.dtype("O"),
                 "geoCol2": np.dtype("O"),
                 "var4": np.dtype("O"),
@@ -267,3 +267,90 @@ class TestCensusDataTransformer(ServiceTestFixture[CensusDataTransformer]):
                 "var3",
                 "var4",
             ]
+
+    @pytest.mark.parametrize("are_chunks_aligned", [True, False])
+    def test_stats_assembles_chunks(self, are_chunks_aligned: bool):
+        supported_geos = pd.DataFrame(
+            [dict(name="geoCol1", hierarchy=1), dict(name="geoCol2", hierarchy=2)]
+        )
+        second_chunk_rows = [["1", "7", "4", "5"], ["6", "8", "9", "10"]]
+        results = [
+            [
+                ["NAME", "var1", "geoCol1", "geoCol2"],
+                ["1", "5", "4", "5"],
+                ["6", "6", "9", "10"],
+            ],
+            [["NAME", "var2", "geoCol1", "geoCol2"]]
+            + (second_chunk_rows if are_chunks_aligned else second_chunk_rows[::-1]),
+        ]
+        merge_chunks = self.mocker.spy(self._service, "_merge_chunks")
+        self.mocker.patch.object(self._service._config, "replace_column_headers", True)
+
+        res = self._service.stats(
+            results,
+            dict(var1=float, var2=float),
+            [GeoDomain("geoCol1"), GeoDomain("geoCol2")],
+            dict(var1="banana", var2="apple"),
+            supported_geos,
+        )
+
+        assert merge_chunks.call_count == (0 if are_chunks_aligned else 1)
+        assert res.to_dict("records") == [
+            dict(NAME="1", geoCol1="4", geoCol2="5", banana=5.0, apple=7.0),
+            dict(NAME="6", geoCol1="9", geoCol2="10", banana=6.0, apple=8.0),
+        ]
+
+    @pytest.mark.parametrize("are_chunks_aligned", [True, False])
+    def test_stats_masks_annotation_values(self, are_chunks_aligned: bool):
+        supported_geos = pd.DataFrame([dict(name="geoCol1", hierarchy=1)])
+        second_chunk_rows = [["a", "-999999999", "1"], ["b", "2.5", "2"]]
+        results = [
+            [["NAME", "intVar", "geoCol1"], ["a", "-666666666", "1"], ["b", None, "2"]],
+            [["NAME", "floatVar", "geoCol1"]]
+            + (second_chunk_rows if are_chunks_aligned else second_chunk_rows[::-1]),
+        ]
+        self.mocker.patch.object(self._service._config, "replace_column_headers", False)
+
+        res = self._service.stats(
+            results,
+            dict(intVar=int, floatVar=float),
+            [GeoDomain("geoCol1")],
+            dict(intVar="IntVar", floatVar="FloatVar"),
+            supported_geos,
+        )
+
+        assert res.dtypes.to_dict() == {  # type: ignore
+            "NAME": np.dtype("O"),
+            "geoCol1": np.dtype("O"),
+            "intVar": pd.Int64Dtype(),
+            "floatVar": np.dtype("float64"),
+        }
+        assert res["intVar"].isna().tolist() == [True, True]
+        assert res["floatVar"].isna().tolist() == [True, False]
+        assert res["floatVar"][1] == 2.5
+
+    @pytest.mark.parametrize("are_chunks_aligned", [True, False])
+    def test_stats_keeps_non_integer_int_columns_as_floats(
+        self, are_chunks_aligned: bool
+    ):
+        supported_geos = pd.DataFrame([dict(name="geoCol1", hierarchy=1)])
+        second_chunk_rows = [["a", "3", "1"], ["b", "-666666666", "2"]]
+        results = [
+            [["NAME", "fractional", "geoCol1"], ["a", "1.5", "1"], ["b", "2", "2"]],
+            [["NAME", "whole", "geoCol1"]]
+            + (second_chunk_rows if are_chunks_aligned else second_chunk_rows[::-1]),
+        ]
+        self.mocker.patch.object(self._service._config, "replace_column_headers", False)
+
+        res = self._service.stats(
+            results,
+            dict(fractional=int, whole=int),
+            [GeoDomain("geoCol1")],
+            dict(fractional="Fractional", whole="Whole"),
+            supported_geos,
+        )
+
+        assert res.dtypes["fractional"] == np.dtype("float64")  # type: ignore
+        assert res["fractional"].tolist() == [1.5, 2.0]
+        assert res.dtypes["whole"] == pd.Int64Dtype()  # type: ignore
+        assert res["whole"].isna().tolist() == [False, True]
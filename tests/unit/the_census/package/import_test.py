@@ -0,0 +1,44 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import the_census
+
+HEAVY_MODULES = ["pandas", "requests", "tqdm", "punq", "dotenv"]
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import the_census",
+        "from the_census import Census, AsyncCensus, GeoDomain",
+    ],
+)
+def test_importing_does_not_import_heavy_modules(statement: str):
+    res = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; {statement}; "
+            f"print(sorted(set({HEAVY_MODULES!r}) & set(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        # some tests change directories
+        cwd=Path(the_census.__file__).parents[1],
+    )
+
+    assert res.stdout.strip() == "[]"
+
+
+def test_exports_are_imported_on_first_use():
+    from the_census._api.transport import ReplayTransport
+
+    assert the_census.ReplayTransport is ReplayTransport
+    assert "ReplayTransport" in dir(the_census)
+
+    with pytest.raises(AttributeError, match="has no attribute 'Nope'"):
+        the_census.Nope  # type: ignore
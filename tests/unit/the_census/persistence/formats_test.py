@@ -0,0 +1,99 @@
+import re
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pandas
+import pytest
+from pytest_mock import MockerFixture
+
+from the_census._config import Config
+from the_census._exceptions import UnsupportedCacheFormatException
+from the_census._persistence import formats
+from the_census._persistence.formats import get_cache_format
+from the_census._persistence.onDisk import OnDiskCache
+
+groups = pandas.DataFrame(
+    [
+        dict(code="123", description="numbers", cleaned_name="Numbers"),
+        dict(code="abc", description="alphabet", cleaned_name="Alphabet"),
+    ]
+)
+
+
+def make_cache(tmp_path: Path, cache_format: str) -> OnDiskCache:
+    return OnDiskCache(
+        Config(
+            2019,
+            cache_dir=str(tmp_path),
+            should_cache_on_disk=True,
+            should_load_from_existing_cache=True,
+            cache_format=cache_format,
+        ),
+        MagicMock(),
+    )
+
+
+@pytest.mark.parametrize("cache_format", ["feather", "parquet"])
+def test_binary_formats_preserve_dtypes(tmp_path: Path, cache_format: str):
+    pytest.importorskip("pyarrow")
+    cache = make_cache(tmp_path, cache_format)
+
+    assert cache.put("groups.csv", groups)
+    assert not cache.put("groups.csv", groups)
+
+    res = cache.get("groups.csv")
+
+    assert (cache.cache_path / f"groups.{cache_format}").exists()
+    # a CSV would read these codes back as integers
+    assert res.to_dict("records") == groups.to_dict("records")
+
+
+@pytest.mark.parametrize("cache_format", ["feather", "parquet"])
+def test_csv_cache_is_migrated(tmp_path: Path, cache_format: str):
+    pytest.importorskip("pyarrow")
+    make_cache(tmp_path, "csv").put("variables/g1.csv", groups)
+
+    cache = make_cache(tmp_path, cache_format)
+    res = cache.get("variables/g1.csv")
+
+    assert len(res) == 2
+    assert not (cache.cache_path / "variables/g1.csv").exists()
+    assert (cache.cache_path / f"variables/g1.{cache_format}").exists()
+
+
+def test_unknown_cache_format():
+    with pytest.raises(
+        UnsupportedCacheFormatException, match="Unknown cache format `banana`"
+    ):
+        get_cache_format("banana")
+
+
+@pytest.mark.parametrize("cache_format", ["feather", "parquet"])
+def test_arrow_formats_need_pyarrow(mocker: MockerFixture, cache_format: str):
+    mocker.patch.object(formats.importlib.util, "find_spec", return_value=None)
+
+    with pytest.raises(
+        UnsupportedCacheFormatException,
+        match=re.escape("pip install the_census[parquet]"),
+    ):
+        get_cache_format(cache_format)
+
+
+@pytest.mark.parametrize("cache_format", ["csv", "feather"])
+def test_put_overwrites(tmp_path: Path, cache_format: str):
+    if cache_format != "csv":
+        pytest.importorskip("pyarrow")
+    cache = make_cache(tmp_path, cache_format)
+    cache.put("groups.csv", groups)
+
+    assert cache.put("groups.csv", groups.head(1), overwrite=True)
+    assert len(cache.get("groups.csv")) == 1
+
+
+def test_csv_reads_with_dtypes(tmp_path: Path):
+    cache = make_cache(tmp_path, "csv")
+    cache.put("groups.csv", groups)
+
+    res = cache.get("groups.csv", dtype=dict(code=str))
+
+    assert res["code"].tolist() == ["123", "abc"]
@@ -0,0 +1,140 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from unittest.mock import MagicMock
+
+import pandas
+import pytest
+from pytest_mock.plugin import MockerFixture
+
+from the_census._config import Config
+from the_census._persistence.inMemory import InMemoryCache, size_of
+from the_census._persistence.models import MemoStats
+from the_census._utils.memoize import memoize
+
+frame = pandas.DataFrame(dict(a=range(100)))
+
+
+def make_memo(**config: object) -> InMemoryCache:
+    return InMemoryCache(Config(**config), MagicMock())  # type: ignore
+
+
+def test_evicts_least_recently_used_when_full():
+    memo = make_memo(memo_max_bytes=size_of(frame) * 2)
+
+    memo.put("q", 1, frame)
+    memo.put("q", 2, frame)
+    _ = memo.get("q", 1)
+    memo.put("q", 3, frame)
+
+    assert memo.get("q", 1) == (True, frame)
+    assert memo.get("q", 2) == (False, None)
+    assert memo.stats() == MemoStats(
+        hits=2,
+        misses=1,
+        evictions=1,
+        entries=2,
+        size_bytes=size_of(frame) * 2,
+        max_bytes=size_of(frame) * 2,
+    )
+
+
+def test_does_not_keep_values_larger_than_cache():
+    memo = make_memo(memo_max_bytes=size_of(frame) - 1)
+
+    memo.put("q", 1, frame)
+
+    assert memo.stats().entries == 0
+
+
+def test_entries_expire(mocker: MockerFixture):
+    monotonic = mocker.patch("time.monotonic", return_value=100.0)
+    memo = make_memo(memo_ttl_seconds=10)
+
+    memo.put("q", 1, frame)
+    monotonic.return_value = 109.0
+    found_before_expiry, _ = memo.get("q", 1)
+    monotonic.return_value = 110.0
+    found_after_expiry, _ = memo.get("q", 1)
+
+    assert found_before_expiry
+    assert not found_after_expiry
+    assert memo.stats().evictions == 1
+
+
+def test_invalidate():
+    memo = make_memo()
+    memo.put("q1", 1, frame)
+    memo.put("q1", 2, frame)
+    memo.put("q2", 1, frame)
+
+    memo.invalidate("q1", 1)
+    assert memo.stats().entries == 2
+
+    memo.invalidate("q1")
+    assert memo.stats().entries == 1
+
+    memo.clear()
+    assert memo.stats() == MemoStats(0, 0, 0, 0, 0, memo.stats().max_bytes)
+
+
+class Repo:
+    calls: List[int]
+
+    def __init__(self) -> None:
+        self._memo = make_memo()
+        self.calls = []
+
+    @memoize("get_value")
+    def get_value(self, value: int) -> int:
+        self.calls.append(value)
+        return value
+
+
+def test_memoize():
+    repo = Repo()
+
+    assert [repo.get_value(1), repo.get_value(1), repo.get_value(2)] == [1, 1, 2]
+    assert repo.calls == [1, 2]
+
+    repo._memo.invalidate("get_value")
+    _ = repo.get_value(1)
+
+    assert repo.calls == [1, 2, 1]
+
+
+def test_concurrent_misses_compute_once():
+    memo = make_memo()
+    calls: List[int] = []
+    lock = threading.Lock()
+
+    def compute() -> pandas.DataFrame:
+        with lock:
+            calls.append(1)
+        time.sleep(0.05)
+        return frame
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(lambda _: memo.get_or_compute("q", 1, compute), range(8))
+        )
+
+    assert calls == [1]
+    assert all(result is frame for result in results)
+    assert memo.stats().entries == 1
+
+
+def test_peek_is_not_counted():
+    memo = make_memo()
+    memo.put("q", 1, frame)
+
+    assert memo.peek("q", 1) == (True, frame)
+    assert memo.peek("q", 2) == (False, None)
+    assert memo.stats().hits == 0
+    assert memo.stats().misses == 0
+
+
+@pytest.mark.parametrize("value", [frame, "abc", 1])
+def test_size_of(value: object):
+    assert size_of(value) > 0
@@ -0,0 +1,121 @@
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pandas
+
+from the_census._config import Config
+from the_census._persistence.onDisk import OnDiskCache
+from the_census._persistence.variableStore import VARIABLES_DB, SqliteVariableStore
+from the_census._variables.models import GroupCode, VariableCode
+
+
+def make_variables(group: str, n: int) -> pandas.DataFrame:
+    variables: List[Dict[str, Any]] = [
+        dict(
+            code=f"{group}_{v:03d}E",
+            group_code=group,
+            group_concept=f"concept {group}",
+            name=f"Estimate!!Total:!!Item {v}",
+            predicate_type="int",
+            predicate_only=True,
+            limit=0,
+            cleaned_name=f"Estimate_Total_Item{v}",
+        )
+        for v in range(n)
+    ]
+    return pandas.DataFrame(variables)
+
+
+def make_store(tmp_path: Path, **config: Any) -> SqliteVariableStore:
+    config = dict(
+        dict(
+            cache_dir=str(tmp_path),
+            should_cache_on_disk=True,
+            should_load_from_existing_cache=True,
+        ),
+        **config,
+    )
+    cache = OnDiskCache(Config(2019, **config), MagicMock())
+
+    return SqliteVariableStore(Config(2019, **config), cache, MagicMock())
+
+
+def test_put_and_get(tmp_path: Path):
+    store = make_store(tmp_path)
+    g1, g2 = make_variables("g1", 3), make_variables("g2", 2)
+
+    assert store.put_group(GroupCode("g1"), g1)
+    assert store.put_group(GroupCode("g2"), g2)
+    assert not store.put_group(GroupCode("g1"), g1)
+
+    pandas.testing.assert_frame_equal(store.get_group(GroupCode("g1")), g1)
+    assert store.get_group(GroupCode("g3")).empty
+    assert store.get_variables(
+        VariableCode("g2_001E"), VariableCode("g1_000E"), VariableCode("nope")
+    )["code"].tolist() == ["g1_000E", "g2_001E"]
+    assert len(store.get_all()) == 5
+
+
+def test_store_persists_across_sessions(tmp_path: Path):
+    make_store(tmp_path).put_group(GroupCode("g1"), make_variables("g1", 3))
+
+    assert len(make_store(tmp_path).get_group(GroupCode("g1"))) == 3
+
+
+def test_store_is_not_opened_until_needed(tmp_path: Path):
+    store = make_store(tmp_path)
+
+    assert not (store._cache.cache_path / VARIABLES_DB).exists()  # type: ignore
+
+
+def test_store_is_in_memory_without_on_disk_cache(tmp_path: Path):
+    store = make_store(tmp_path, should_cache_on_disk=False)
+
+    assert store.put_group(GroupCode("g1"), make_variables("g1", 3))
+    assert len(store.get_all()) == 3
+    assert not tmp_path.joinpath("2019").exists()
+
+
+def test_legacy_group_files_are_migrated(tmp_path: Path):
+    store = make_store(tmp_path)
+    g1 = make_variables("g1", 3)
+    legacy_path = store._cache.cache_path / "variables"  # type: ignore
+    legacy_path.mkdir(parents=True)
+    g1.to_csv(legacy_path / "g1.csv", index=False)
+
+    pandas.testing.assert_frame_equal(store.get_group(GroupCode("g1")), g1)
+    assert not legacy_path.exists()
+
+
+def test_store_can_be_marked_complete(tmp_path: Path):
+    store = make_store(tmp_path)
+    store.put_group(GroupCode("g1"), make_variables("g1", 3))
+
+    assert not store.is_complete()
+
+    store.set_complete()
+
+    assert store.is_complete()
+    assert make_store(tmp_path).is_complete()
+
+
+def test_search_indices_are_stale_once_variables_are_added(tmp_path: Path):
+    store = make_store(tmp_path)
+
+    assert store.version() == 0
+
+    store.put_group(GroupCode("g1"), make_variables("g1", 3))
+    version = store.version()
+    store.put_search_index("variables", version, b"index")
+
+    assert store.get_search_index("variables") == b"index"
+    assert make_store(tmp_path).get_search_index("variables") == b"index"
+
+    assert not store.put_group(GroupCode("g1"), make_variables("g1", 3))
+    assert store.get_search_index("variables") == b"index"
+
+    store.put_group(GroupCode("g2"), make_variables("g2", 2))
+
+    assert store.version() > version
+    assert store.get_search_index("variables") is None
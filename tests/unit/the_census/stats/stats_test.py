@@ -1,11 +1,15 @@
-from typing import Any, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
 
+import pandas
 import pytest
 
 from tests.service_test_fixtures import ServiceTestFixture
+from the_census._config import Config
 from the_census._exceptions import EmptyRepositoryException
 from the_census._geographies.models import GeoDomain
-from the_census._stats.service import CensusStatisticsService
+from the_census._stats.service import CensusStatisticsService, stats_cache_key
 from the_census._variables.models import GroupCode, GroupVariable, VariableCode
 
 # pyright: reportPrivateUsage=false
@@ -69,14 +73,17 @@ class TestStatsAsDataFrame(ServiceTestFixture[CensusStatisticsService]):
         ]
         for_domain = GeoDomain("state")
         in_domains = [GeoDomain("us")]
-        expected_column_mapping: Dict[str, int] = dict(map=1)
-        expectedTypeMapping: Dict[str, Any] = dict(map=int)
+        expected_column_mapping: Dict[str, str] = dict(
+            var1="name1", var2="name2", var3="name3"
+        )
+        expectedTypeMapping: Dict[str, Any] = dict(var1=int, var2=float)
 
         self.mocker.patch.object(
             self._service,
             "_get_variable_names_and_type_conversions",
             return_value=(expected_column_mapping, expectedTypeMapping),
         )
+        self.mocker.patch.object(self._service._config, "replace_column_headers", True)
 
         geoRepoRetval = []
         self.mocker.patch.object(
@@ -84,21 +91,230 @@ class TestStatsAsDataFrame(ServiceTestFixture[CensusStatisticsService]):
             "get_supported_geographies",
             return_value=geoRepoRetval,
         )
+        self.mocker.patch.object(
+            self._service, "get_cached_stats", return_value=pandas.DataFrame()
+        )
+        self.mocker.patch.object(
+            self._service._transformer,
+            "stats",
+            return_value=pandas.DataFrame(
+                [dict(NAME="Alabama", us="1", state="01", var1=1, var2=2.0, var3="a")]
+            ),
+        )
 
-        self._service.get_stats(variables_to_query, for_domain, *in_domains)
+        res = self._service.get_stats(variables_to_query, for_domain, *in_domains)
 
         apiGet.assert_called_once_with(variables_to_query, for_domain, in_domains)
+        # columns are renamed once they're assembled, not when they're fetched
         self.cast_mock(self._service._transformer.stats).assert_called_once_with(
             [[1, 2], [3]],
             expectedTypeMapping,
             [for_domain] + in_domains,
-            expected_column_mapping,
+            dict(var1="var1", var2="var2", var3="var3"),
             geoRepoRetval,
         )
+        assert res.columns.tolist() == [
+            "NAME",
+            "us",
+            "state",
+            "name1",
+            "name2",
+            "name3",
+        ]
+
+    def test_get_stats_fetches_only_uncached_variables(self):
+        apiGet = self.mocker.patch.object(
+            self._service._api, "stats", side_effect=lambda *_: iter([[]])
+        )
+        self.mocker.patch.object(
+            self._service._variable_repo,
+            "find_variables",
+            return_value=list(variables_in_repo.values()),
+        )
+        self.mocker.patch.object(self._service._config, "replace_column_headers", False)
+        self.mocker.patch.object(
+            self._service, "get_cached_stats", return_value=pandas.DataFrame()
+        )
+        self.mocker.patch.object(
+            self._service._transformer,
+            "stats",
+            side_effect=[
+                pandas.DataFrame(
+                    [
+                        dict(NAME="Alabama", state="01", var1=1, var2=2.0),
+                        dict(NAME="Alaska", state="02", var1=3, var2=4.0),
+                    ]
+                ),
+                pandas.DataFrame(
+                    [
+                        dict(NAME="Alabama", state="01", var3="a"),
+                        dict(NAME="Alaska", state="02", var3="b"),
+                    ]
+                ),
+            ],
+        )
+        for_domain = GeoDomain("state")
+
+        _ = self._service.get_stats([var1.code, var2.code], for_domain)
+        res = self._service.get_stats([var3.code, var2.code], for_domain)
+
+        assert apiGet.call_args_list[-1].args == ([var3.code], for_domain, [])
+        assert res.to_dict("records") == [
+            dict(NAME="Alabama", state="01", var3="a", var2=2.0),
+            dict(NAME="Alaska", state="02", var3="b", var2=4.0),
+        ]
+
+        _ = self._service.get_stats([var1.code, var3.code], for_domain)
+
+        assert apiGet.call_count == 2
+
+    @pytest.mark.parametrize("columns", [["NAME", "state", "var1", "var2"], []])
+    def test_get_stats_renames_columns_of_empty_results(self, columns: List[str]):
+        self.mocker.patch.object(
+            self._service._api, "stats", side_effect=lambda *_: iter([[]])
+        )
+        self.mocker.patch.object(
+            self._service._variable_repo,
+            "find_variables",
+            return_value=list(variables_in_repo.values()),
+        )
+        self.mocker.patch.object(self._service._config, "replace_column_headers", True)
+        self.mocker.patch.object(
+            self._service, "get_cached_stats", return_value=pandas.DataFrame()
+        )
+        self.mocker.patch.object(
+            self._service._transformer,
+            "stats",
+            return_value=pandas.DataFrame(columns=columns),
+        )
+
+        res = self._service.get_stats([var2.code, var1.code], GeoDomain("state"))
+
+        assert res.empty
+        assert res.columns.tolist() == [
+            col for col in ["NAME", "state"] if col in columns
+        ] + ["cleanedName2", "cleanedName1"]
+
+    def test_held_columns_are_not_counted_as_memo_lookups(self):
+        self.mocker.patch.object(
+            self._service._api, "stats", side_effect=lambda *_: iter([[]])
+        )
+        self.mocker.patch.object(
+            self._service._variable_repo,
+            "find_variables",
+            return_value=list(variables_in_repo.values()),
+        )
+        self.mocker.patch.object(
+            self._service, "get_cached_stats", return_value=pandas.DataFrame()
+        )
+        self.mocker.patch.object(
+            self._service._transformer,
+            "stats",
+            return_value=pandas.DataFrame([dict(NAME="Alabama", state="01", var1=1)]),
+        )
+
+        _ = self._service.get_stats([var1.code], GeoDomain("state"))
+        _ = self._service.get_stats([var1.code], GeoDomain("state"))
+
+        stats = self._service._memo.stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    def test_concurrent_queries_keep_each_others_columns(self):
+        barrier = threading.Barrier(2)
+
+        def stats(*args: Any) -> pandas.DataFrame:
+            # both have fetched before either holds its columns
+            barrier.wait(timeout=5)
+            code = next(iter(args[3]))
+
+            return pandas.DataFrame([{"NAME": "Alabama", "state": "01", code: 1}])
+
+        self.mocker.patch.object(
+            self._service._variable_repo,
+            "find_variables",
+            return_value=list(variables_in_repo.values()),
+        )
+        self.mocker.patch.object(self._service._transformer, "stats", side_effect=stats)
+        for_domain = GeoDomain("state")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            _ = list(
+                executor.map(
+                    lambda code: self._service.assemble_stats(
+                        [], [code], for_domain, variables_fetched=[code]
+                    ),
+                    [var1.code, var2.code],
+                )
+            )
+
+        self.cast_mock(self._service._api.stats).assert_not_called()
+        assert (
+            self._service.uncached_variables([var1.code, var2.code], for_domain) == []
+        )
+
+    def test_get_cached_stats_keeps_fractional_int_columns_as_floats(self):
+        self.mocker.patch.object(self._service._config, "replace_column_headers", False)
+        self.mocker.patch.object(
+            self._service,
+            "_get_variable_names_and_type_conversions",
+            return_value=(dict(var1="name1", var2="name2"), dict(var1=int, var2=int)),
+        )
+        get = self.mocker.patch.object(
+            self._service._cache,
+            "get",
+            return_value=pandas.DataFrame(
+                dict(
+                    NAME=["a", "b"], state=["01", "02"], var1=[1.0, None], var2=[1.5, 2]
+                )
+            ),
+        )
+
+        res = self._service.get_cached_stats([var1.code, var2.code], GeoDomain("state"))
+
+        assert get.call_args.kwargs["dtype"]["var1"] == "float64"
+        assert res.dtypes["var1"] == pandas.Int64Dtype()
+        assert res.dtypes["var2"] == "float64"
+        assert res["var2"].tolist() == [1.5, 2.0]
+
+    def test_get_stats_from_cache(self):
+        cached = pandas.DataFrame([dict(NAME="Alabama", state="01", var1=1)])
+        self.mocker.patch.object(self._service, "get_cached_stats", return_value=cached)
+
+        res = self._service.get_stats([var1.code], GeoDomain("state", "01"))
+
+        assert res is cached
+        self.cast_mock(self._service._api.stats).assert_not_called()
+
+    @pytest.mark.parametrize(
+        "use_cache,refresh_cache", [(False, False), (False, True), (True, True)]
+    )
+    def test_get_stats_skips_cached_results(self, use_cache: bool, refresh_cache: bool):
+        fetched = pandas.DataFrame([dict(NAME="Alabama", state="01", var1=1)])
+        get_cached_stats = self.mocker.patch.object(self._service, "get_cached_stats")
+        store_stats = self.mocker.patch.object(self._service, "store_stats")
+        self.mocker.patch.object(self._service, "assemble_stats", return_value=fetched)
+
+        res = self._service.get_stats(
+            [var1.code],
+            GeoDomain("state", "01"),
+            use_cache=use_cache,
+            refresh_cache=refresh_cache,
+        )
+
+        assert res is fetched
+        get_cached_stats.assert_not_called()
+        if use_cache:
+            store_stats.assert_called_once_with(
+                fetched, [var1.code], GeoDomain("state", "01"), overwrite=True
+            )
+        else:
+            store_stats.assert_not_called()
 
     def test_get_stats_with_empty_variable_repo(self):
         variables_to_query = [var1.code]
-        self.mocker.patch.object(self._service._variable_repo, "variables", dict())
+        self.mocker.patch.object(
+            self._service._variable_repo, "find_variables", return_value=[]
+        )
 
         with pytest.raises(
             EmptyRepositoryException,
@@ -114,7 +330,9 @@ class TestStatsAsDataFrame(ServiceTestFixture[CensusStatisticsService]):
         }
 
         self.mocker.patch.object(
-            self._service._variable_repo, "variables", variables_in_repo
+            self._service._variable_repo,
+            "find_variables",
+            return_value=list(variables_in_repo.values()),
         )
 
         (
@@ -127,7 +345,7 @@ class TestStatsAsDataFrame(ServiceTestFixture[CensusStatisticsService]):
             "var2": "cleanedName2",
             "var3": "cleanedName3",
         }
-        assert typeMapping == {"var1": float, "var2": float}
+        assert typeMapping == {"var1": int, "var2": float}
 
     def test_get_variable_names_and_type_conversions_for_duplicate_names(self):
         variable_with_duplicate_name = GroupVariable(
@@ -142,8 +360,8 @@ class TestStatsAsDataFrame(ServiceTestFixture[CensusStatisticsService]):
         )
         self.mocker.patch.object(
             self._service._variable_repo,
-            "variables",
-            dict(variables_in_repo, var5=variable_with_duplicate_name),
+            "find_variables",
+            return_value=[*variables_in_repo.values(), variable_with_duplicate_name],
         )
         variables_to_query = {
             var1.code,
@@ -163,4 +381,34 @@ class TestStatsAsDataFrame(ServiceTestFixture[CensusStatisticsService]):
             "var3": "cleanedName3_g1",
             "var5": "cleanedName1_g2",
         }
-        assert type_mapping == {"var1": float, "var2": float}
+        assert type_mapping == {"var1": int, "var2": float}
+
+
+def test_stats_cache_key_is_canonical():
+    config = Config(2019, "acs", "acs5")
+
+    key = stats_cache_key(
+        config,
+        [VariableCode("var1"), VariableCode("var2")],
+        GeoDomain("tract"),
+        [GeoDomain("state", "01"), GeoDomain("county", "001")],
+    )
+
+    assert key == stats_cache_key(
+        config,
+        [VariableCode("var2"), VariableCode("var1")],
+        GeoDomain("tract"),
+        [GeoDomain("county", "001"), GeoDomain("state", "01")],
+    )
+    assert key != stats_cache_key(
+        Config(2018, "acs", "acs5"),
+        [VariableCode("var1"), VariableCode("var2")],
+        GeoDomain("tract"),
+        [GeoDomain("state", "01"), GeoDomain("county", "001")],
+    )
+    assert key != stats_cache_key(
+        config,
+        [VariableCode("var1"), VariableCode("var2")],
+        GeoDomain("tract"),
+        [GeoDomain("state", "02"), GeoDomain("county", "001")],
+    )
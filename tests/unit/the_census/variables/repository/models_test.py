@@ -0,0 +1,51 @@
+from dataclasses import replace
+
+from the_census._variables.models import Group, GroupCode, GroupVariable, VariableCode
+from the_census._variables.repository.models import GroupSet, VariableSet
+
+var1 = GroupVariable(
+    code=VariableCode("var1"),
+    group_code=GroupCode("g1"),
+    group_concept="concept1",
+    name="name 1",
+    limit=1,
+    predicate_only=False,
+    predicate_type="int",
+    cleaned_name="cleanedName1",
+)
+var2 = replace(var1, code=VariableCode("var2"), cleaned_name="cleanedName2")
+
+
+def test_variable_set_skips_existing_variables():
+    variables = VariableSet(var1)
+
+    variables.add(replace(var1), var2)
+
+    assert len(variables) == 2
+    assert variables.cleanedName1_g1 == var1
+    assert variables.cleanedName2_g1 == var2
+
+
+def test_variable_set_replaces_variables_with_same_name():
+    renamed = replace(var1, code=VariableCode("var3"))
+    variables = VariableSet(var1)
+
+    variables.add(renamed)
+    variables.add(var1)
+
+    assert len(variables) == 1
+    assert variables.cleanedName1_g1 == var1
+
+
+def test_group_set_suffixes_duplicate_names():
+    groups = GroupSet(
+        Group(GroupCode("g1"), "group", cleaned_name="Group"),
+        Group(GroupCode("g2"), "group", cleaned_name="Group"),
+    )
+
+    groups.add(
+        Group(GroupCode("g1"), "group", cleaned_name="Group"),
+        Group(GroupCode("g3"), "group", cleaned_name="Group"),
+    )
+
+    assert dict(groups.items()) == dict(Group_g1="g1", Group_g2="g2", Group_g3="g3")
@@ -3,11 +3,10 @@ from unittest.mock import call
 
 import pandas
 import pytest
-from callee.strings import Glob, String
 
 from tests.service_test_fixtures import ServiceTestFixture
 from tests.utils import DataFrameColumnMatcher, shuffled_cases
-from the_census._variables.models import Group, GroupCode, GroupVariable
+from the_census._variables.models import Group, GroupCode, GroupVariable, VariableCode
 from the_census._variables.repository.service import VariableRepository
 
 # pyright: reportPrivateUsage = false
@@ -117,15 +116,17 @@ class TestVariableRepository(ServiceTestFixture[VariableRepository]):
         transformer_retval = pandas.DataFrame(all_variables[cache_miss_index])
 
         cache_side_effect = [
-            pandas.DataFrame(variables) if i != cache_miss_index else None
+            pandas.DataFrame(variables if i != cache_miss_index else [])
             for i, variables in enumerate(all_variables)
         ]
 
         self.mocker.patch.object(
-            self._service._cache, "get", side_effect=cache_side_effect
+            self._service._store, "get_group", side_effect=cache_side_effect
         )
         api_mock = self.mocker.patch.object(
-            self._service._api, "variables_for_group", return_value="something"
+            self._service._api,
+            "variables_for_groups",
+            side_effect=lambda groups: iter(["something"] * len(groups)),  # type: ignore
         )
         self.mocker.patch.object(
             self._service._transformer, "variables", return_value=transformer_retval
@@ -135,20 +136,24 @@ class TestVariableRepository(ServiceTestFixture[VariableRepository]):
         res = self._service.get_variables_by_group(*cache_groups)
 
         assert res["code"].tolist() == expected_codes
-        api_mock.assert_called_once_with(cache_miss_group)
-        self.cast_mock(self._service._cache.put).assert_called_once_with(
-            String() & Glob(f"**{cache_miss_group}**"), transformer_retval
+        api_mock.assert_called_once_with([cache_miss_group])
+        self.cast_mock(self._service._store.put_group).assert_called_once_with(
+            cache_miss_group, transformer_retval
         )
 
     def test_get_all_variables(self):
-        def cachePutSideEffect(resource: str, _: Any) -> bool:
-            return "group2" in resource or "group1" in resource
+        def cachePutSideEffect(group: str, _: Any) -> bool:
+            return group in ["group1", "group2"]
+
+        self.mocker.patch.object(
+            self._service._store, "is_complete", return_value=False
+        )
 
         self.mocker.patch.object(
             self._service._api, "all_variables", return_value=["something"]
         )
         cache_put = self.mocker.patch.object(
-            self._service._cache, "put", side_effect=cachePutSideEffect
+            self._service._store, "put_group", side_effect=cachePutSideEffect
         )
 
         transformer_res = pandas.DataFrame(group1_vars + group2_vars + group3_vars)
@@ -168,11 +173,55 @@ class TestVariableRepository(ServiceTestFixture[VariableRepository]):
         assert dict(self._service.variables.items()) == expectedVariables
 
         cache_put.call_args_list == [
-            call(
-                "variables/group1.csv", DataFrameColumnMatcher(["var1", "var2"], "code")
-            ),
-            call(
-                "variables/group2.csv", DataFrameColumnMatcher(["var3", "var4"], "code")
-            ),
-            call("variables/group3.csv", DataFrameColumnMatcher(["var5"], "code")),
+            call("group1", DataFrameColumnMatcher(["var1", "var2"], "code")),
+            call("group2", DataFrameColumnMatcher(["var3", "var4"], "code")),
+            call("group3", DataFrameColumnMatcher(["var5"], "code")),
         ]
+
+    def test_get_all_variables_from_complete_store(self):
+        self.mocker.patch.object(self._service._store, "is_complete", return_value=True)
+        self.mocker.patch.object(
+            self._service._store,
+            "get_all",
+            return_value=pandas.DataFrame(group1_vars + group2_vars),
+        )
+        all_variables = self.mocker.patch.object(self._service._api, "all_variables")
+
+        res = self._service.get_all_variables()
+
+        assert res["code"].tolist() == ["var1", "var2", "var3", "var4"]
+        assert len(self._service.variables) == 4
+        all_variables.assert_not_called()
+
+    def test_cache_is_not_read_until_needed(self):
+        self.cast_mock(self._service._cache.get).assert_not_called()
+        self.cast_mock(self._service._store.get_all).assert_not_called()
+
+    def test_find_variables_loads_only_missing_variables(self):
+        self._service.register_variables(pandas.DataFrame(group1_vars))
+        get_variables = self.mocker.patch.object(
+            self._service._store,
+            "get_variables",
+            return_value=pandas.DataFrame(group2_vars[:1]),
+        )
+
+        res = self._service.find_variables(
+            VariableCode("var1"), VariableCode("var3"), VariableCode("var5")
+        )
+
+        assert res == [GroupVariable(**group1_vars[0]), GroupVariable(**group2_vars[0])]
+        get_variables.assert_called_once_with("var3", "var5")
+
+    def test_variables_are_loaded_from_the_store_once(self):
+        get_all = self.mocker.patch.object(
+            self._service._store,
+            "get_all",
+            return_value=pandas.DataFrame(group1_vars + group2_vars),
+        )
+
+        assert len(self._service.variables) == 4
+        assert len(self._service.variables) == 4
+        assert self._service.find_variables(VariableCode("var5")) == []
+
+        get_all.assert_called_once()
+        self.cast_mock(self._service._store.get_variables).assert_not_called()
@@ -0,0 +1,202 @@
+from typing import Any, Dict, List
+
+import pandas
+import pytest
+
+from the_census._variables.models import GroupCode
+from the_census._variables.search.index import (
+    GROUP_FIELDS,
+    SearchIndex,
+    tokenize,
+    trigrams,
+)
+
+
+def make_variables(group: str, concept: str, *names: str) -> pandas.DataFrame:
+    variables: List[Dict[str, Any]] = [
+        dict(
+            code=f"{group}_{v:03d}E",
+            group_code=group,
+            group_concept=concept,
+            name=name,
+            predicate_type="int",
+            predicate_only=True,
+            limit=0,
+            cleaned_name=name.replace(" ", ""),
+        )
+        for v, name in enumerate(names)
+    ]
+    return pandas.DataFrame(variables)
+
+
+@pytest.fixture
+def index() -> SearchIndex:
+    index = SearchIndex()
+    index.add(
+        make_variables(
+            "B17001",
+            "POVERTY STATUS IN THE PAST 12 MONTHS BY SEX BY AGE",
+            "Estimate!!Total:",
+            "Estimate!!Total:!!Income in the past 12 months below poverty level:",
+            "Estimate!!Total:!!Male:",
+        )
+    )
+    index.add(
+        make_variables(
+            "B18105",
+            "SEX BY AGE BY AMBULATORY DIFFICULTY",
+            "Estimate!!Total:",
+            "Estimate!!Total:!!Male:",
+        )
+    )
+
+    return index
+
+
+def codes(res: pandas.DataFrame) -> List[str]:
+    return [] if res.empty else res["code"].tolist()
+
+
+def test_tokenize():
+    assert tokenize("Estimate!!Total:!!Under 5 years") == [
+        "estimate",
+        "total",
+        "under",
+        "5",
+        "years",
+    ]
+    assert tokenize("B01001_001E") == ["b01001_001e"]
+
+
+def test_search_ranks_results(index: SearchIndex):
+    # matches in the name count for more than ones only in the group concept
+    assert codes(index.search(["poverty"])) == [
+        "B17001_001E",
+        "B17001_000E",
+        "B17001_002E",
+    ]
+    # matches in the code count for the most
+    assert codes(index.search(["b18105_001e"])) == ["B18105_001E"]
+    assert codes(index.search(["male", "ambulatory"])) == ["B18105_001E"]
+
+    res = index.search(["age"])
+    assert len(res) == 5
+    assert res["score"].is_monotonic_decreasing
+    assert "cleaned_name" not in res.columns
+
+
+def test_search_by_prefix(index: SearchIndex):
+    assert codes(index.search(["ambul*"])) == ["B18105_000E", "B18105_001E"]
+    assert codes(index.search(["b17001*", "MALE"])) == ["B17001_002E"]
+    assert codes(index.search(["zzz*"])) == []
+
+
+def test_search_needs_every_term(index: SearchIndex):
+    assert codes(index.search(["ambulatory", "poverty"])) == []
+    assert codes(index.search(["poverty", "nope"])) == []
+
+
+def test_search_within_groups(index: SearchIndex):
+    assert codes(index.search(["male"], [GroupCode("B18105")])) == ["B18105_001E"]
+
+
+def test_search_limit(index: SearchIndex):
+    assert codes(index.search(["poverty"], limit=1)) == ["B17001_001E"]
+    assert codes(index.search(["sex"], limit=10)) == codes(index.search(["sex"]))
+
+
+def test_groups_are_only_indexed_once(index: SearchIndex):
+    index.add(make_variables("B18105", "SEX BY AGE", "Estimate!!Total:"))
+
+    assert len(index.search(["age"])) == 5
+    assert index.groups == {"B17001", "B18105"}
+
+
+def test_trigrams():
+    assert trigrams("age") == {"  a", " ag", "age", "ge "}
+
+
+def test_fuzzy_search(index: SearchIndex):
+    assert codes(index.search(["ambulatry", "dificulty"])) == []
+    assert codes(index.search(["ambulatry", "dificulty"], fuzzy=True)) == [
+        "B18105_000E",
+        "B18105_001E",
+    ]
+
+
+def test_fuzzy_search_ranks_exact_matches_first(index: SearchIndex):
+    index.add(make_variables("B99999", "POVERTY", "Estimate!!Total:!!Males:"))
+
+    res = index.search(["male"], fuzzy=True)
+
+    assert codes(res) == ["B17001_002E", "B18105_001E", "B99999_000E"]
+    assert res["score"].is_monotonic_decreasing
+
+
+def test_fuzzy_search_needs_short_terms_to_match_exactly(index: SearchIndex):
+    assert codes(index.search(["agw"], fuzzy=True)) == []
+
+
+def test_search_groups():
+    index = SearchIndex(GROUP_FIELDS, group_column="code")
+    index.add(
+        pandas.DataFrame(
+            [
+                dict(code="B17001", description="POVERTY STATUS BY SEX BY AGE"),
+                dict(code="B18105", description="SEX BY AGE BY AMBULATORY DIFFICULTY"),
+            ]
+        )
+    )
+
+    assert codes(index.search(["sex", "age"])) == ["B17001", "B18105"]
+    assert codes(index.search(["b18105"])) == ["B18105"]
+    assert codes(index.search(["ambulatry"], fuzzy=True)) == ["B18105"]
+
+
+def test_saved_index_searches_the_same(index: SearchIndex):
+    index.is_complete = True
+    variables = pandas.concat(
+        [make_variables("B99999", "UNINDEXED", "Estimate!!Total:"), index._variables]
+    )
+
+    loaded = SearchIndex.from_bytes(index.to_bytes(), variables)
+
+    assert loaded is not None
+    assert loaded.is_complete
+    assert loaded.groups == index.groups
+    for terms, fuzzy in [
+        (["male"], False),
+        (["tot*", "age"], False),
+        (["ambulatry"], True),
+    ]:
+        pandas.testing.assert_frame_equal(
+            loaded.search(terms, fuzzy=fuzzy), index.search(terms, fuzzy=fuzzy)
+        )
+
+
+def test_saved_index_can_be_added_to(index: SearchIndex):
+    loaded = SearchIndex.from_bytes(index.to_bytes(), index._variables)
+    assert loaded is not None
+
+    loaded.add(make_variables("B99999", "POVERTY", "Estimate!!Total:!!Males:"))
+
+    assert codes(loaded.search(["males"])) == ["B99999_000E"]
+    assert codes(loaded.search(["male"], [GroupCode("B18105")])) == ["B18105_001E"]
+
+
+def test_saved_index_is_not_loaded_if_it_does_not_fit(index: SearchIndex):
+    data = index.to_bytes()
+
+    assert SearchIndex.from_bytes(data, index._variables.iloc[1:]) is None
+    assert SearchIndex.from_bytes(data, index._variables, GROUP_FIELDS) is None
+    assert SearchIndex.from_bytes(b"not an index", index._variables) is None
+    assert SearchIndex.from_bytes(b"", index._variables) is None
+
+
+def test_copy_leaves_index_as_it_was(index: SearchIndex):
+    copy = index.copy()
+    copy.add(make_variables("B99999", "POVERTY", "Estimate!!Total:!!Males:"))
+
+    assert codes(copy.search(["males"])) == ["B99999_000E"]
+    assert codes(index.search(["males"])) == []
+    assert index.groups == {"B17001", "B18105"}
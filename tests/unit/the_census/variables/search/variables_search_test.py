@@ -1,13 +1,39 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from unittest.mock import MagicMock, call
+
 import pandas
+import pytest
+from pytest_mock import MockerFixture
 
 from tests.service_test_fixtures import ServiceTestFixture
+from the_census._config import Config
+from the_census._persistence.onDisk import OnDiskCache
+from the_census._persistence.variableStore import SqliteVariableStore
 from the_census._variables.models import GroupCode
 from the_census._variables.search.service import VariableSearchService
 
 # pyright: reportPrivateUsage=false
 
+variables: List[Dict[str, Any]] = [
+    dict(
+        code="v1",
+        group_code="g1",
+        name="Poverty status",
+        group_concept="POVERTY BY AGE",
+    ),
+    dict(code="v2", group_code="g1", name="Total", group_concept="POVERTY BY AGE"),
+    dict(code="v3", group_code="g2", name="Total", group_concept="SEX BY AGE"),
+]
+
 
 class TestVariableSearchService(ServiceTestFixture[VariableSearchService]):
+    @pytest.fixture(autouse=True)
+    def without_on_disk_cache(self, service_fixture: None, mocker: MockerFixture):
+        mocker.patch.object(self._service._config, "should_cache_on_disk", False)
+
     def test_search_groups(self):
         foundDf = pandas.DataFrame(
             {
@@ -63,3 +89,164 @@ class TestVariableSearchService(ServiceTestFixture[VariableSearchService]):
         assert res.to_dict("records") == pandas.DataFrame(
             [dict(name="banana"), dict(name="elephant")]
         ).to_dict("records")
+
+    def test_search_indexes_all_variables_once(self):
+        get_all_variables = self.mocker.patch.object(
+            self._service._variable_repository,
+            "get_all_variables",
+            return_value=pandas.DataFrame(variables),
+        )
+
+        res = self._service.search("pover*, status", limit=5)
+        _ = self._service.search("age")
+
+        get_all_variables.assert_called_once()
+        assert res.to_dict("records") == [
+            dict(
+                code="v1",
+                group_code="g1",
+                name="Poverty status",
+                group_concept="POVERTY BY AGE",
+                score=res["score"][0],
+            )
+        ]
+
+    def test_search_in_groups(self):
+        get_variables_by_group = self.mocker.patch.object(
+            self._service._variable_repository,
+            "get_variables_by_group",
+            side_effect=lambda *groups: pandas.DataFrame(  # type: ignore
+                [v for v in variables if v["group_code"] in groups]
+            ),
+        )
+
+        assert self._service.search("age", GroupCode("g2"))["code"].tolist() == ["v3"]
+        assert self._service.search("age", GroupCode("g1"), GroupCode("g2"))[
+            "code"
+        ].tolist() == ["v1", "v2", "v3"]
+        assert get_variables_by_group.call_args_list == [call("g2"), call("g1")]
+
+    def test_search_falls_back_to_regex(self):
+        self.mocker.patch.object(
+            self._service._variable_repository,
+            "get_all_variables",
+            return_value=pandas.DataFrame(variables),
+        )
+
+        res = self._service.search("pov.*status|^tot$")
+
+        assert res["code"].tolist() == ["v1"]
+        assert res["score"].tolist() == [0.0]
+
+    def test_find_groups(self):
+        get_groups = self.mocker.patch.object(
+            self._service._variable_repository,
+            "get_groups",
+            return_value=pandas.DataFrame(
+                [
+                    dict(code="g1", description="POVERTY BY AGE"),
+                    dict(code="g2", description="SEX BY AGE"),
+                ]
+            ),
+        )
+
+        assert self._service.find_groups("povrety", fuzzy=True)["code"].tolist() == [
+            "g1"
+        ]
+        assert self._service.find_groups("age", limit=1)["code"].tolist() == ["g1"]
+        assert self._service.find_groups("^sex")["code"].tolist() == ["g2"]
+        assert get_groups.call_count == 2
+
+
+def make_search(tmp_path: Path) -> Tuple[VariableSearchService, MagicMock]:
+    config = Config(
+        2019,
+        cache_dir=str(tmp_path),
+        should_cache_on_disk=True,
+        should_load_from_existing_cache=True,
+    )
+    store = SqliteVariableStore(config, OnDiskCache(config, MagicMock()), MagicMock())
+    repository = MagicMock()
+
+    def get_variables_by_group(*groups: str) -> pandas.DataFrame:
+        df = pandas.DataFrame(
+            [
+                dict(
+                    v,
+                    predicate_type="int",
+                    predicate_only=False,
+                    limit=0,
+                    cleaned_name="",
+                )
+                for v in variables
+                if v["group_code"] in groups
+            ]
+        )
+        for group in groups:
+            store.put_group(GroupCode(group), df[df["group_code"] == group])
+
+        return df.drop(columns="cleaned_name")
+
+    repository.get_variables_by_group.side_effect = get_variables_by_group
+    repository.get_all_variables.side_effect = lambda: get_variables_by_group(
+        "g1", "g2"
+    )
+
+    return VariableSearchService(config, repository, store, MagicMock()), repository
+
+
+def test_search_index_is_saved_for_later_sessions(tmp_path: Path):
+    search, _ = make_search(tmp_path)
+    expected = search.search("poverty")
+
+    later_search, repository = make_search(tmp_path)
+
+    pandas.testing.assert_frame_equal(later_search.search("poverty"), expected)
+    assert later_search.search("age")["code"].tolist() == ["v1", "v2", "v3"]
+    repository.get_all_variables.assert_not_called()
+
+
+def test_search_index_is_rebuilt_once_variables_are_added(tmp_path: Path):
+    search, _ = make_search(tmp_path)
+    _ = search.search("age", GroupCode("g1"))
+
+    later_search, repository = make_search(tmp_path)
+    _ = later_search.search("age", GroupCode("g1"))
+    repository.get_variables_by_group.assert_not_called()
+
+    # adds g2 to the store, so the saved index is out of date
+    assert later_search.search("age", GroupCode("g2"))["code"].tolist() == ["v3"]
+
+    last_search, repository = make_search(tmp_path)
+
+    assert last_search.search("age", GroupCode("g1"), GroupCode("g2"))[
+        "code"
+    ].tolist() == ["v1", "v2", "v3"]
+    repository.get_variables_by_group.assert_not_called()
+
+
+def test_searches_do_not_wait_on_fetching_variables(tmp_path: Path):
+    search, repository = make_search(tmp_path)
+    _ = search.search("age", GroupCode("g1"))
+
+    fetching = threading.Event()
+    fetched = threading.Event()
+    get_variables_by_group = repository.get_variables_by_group.side_effect
+
+    def slow_get_variables_by_group(*groups: str) -> pandas.DataFrame:
+        fetching.set()
+        assert fetched.wait(5)
+
+        return get_variables_by_group(*groups)
+
+    repository.get_variables_by_group.side_effect = slow_get_variables_by_group
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        cold = executor.submit(search.search, "age", GroupCode("g2"))
+        assert fetching.wait(5)
+
+        # g1's already indexed, so this needn't wait on g2's variables
+        assert search.search("status", GroupCode("g1"))["code"].tolist() == ["v1"]
+
+        fetched.set()
+        assert cold.result()["code"].tolist() == ["v3"]
@@ -1,5 +1,10 @@
+import json
+import logging
+import threading
 import time
-from typing import Any, cast
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, List, cast
 from unittest.mock import MagicMock
 
 import pytest
@@ -7,7 +12,12 @@ from pytest_mock import MockerFixture
 
 from the_census._utils.chunk import chunk
 from the_census._utils.clean_variable_name import clean_variable_name
+from the_census._utils.log import configureLogger
+from the_census._utils.log.factory import LoggerFactory
+from the_census._utils.metrics import BUCKETS, METRICS, MetricsRegistry
+from the_census._utils.single_flight import SingleFlight
 from the_census._utils.timer import timer
+from the_census._utils.tracing import TRACER, span, traced, tracing
 from the_census._utils.unique import get_unique
 
 
@@ -44,9 +54,8 @@ def test_timer_logs_and_returns_values(mocker: MockerFixture):
     def fn() -> int:
         return 1
 
-    mock_logging = mocker.patch("the_census._utils.timer.logging")
-    mock_logger = MagicMock()
-    mocker.patch.object(mock_logging, "getLogger", return_value=mock_logger)
+    mock_logger = mocker.patch("the_census._utils.timer._logger")
+    mock_logger.isEnabledFor.return_value = True
     mocker.patch.object(time, "perf_counter", side_effect=[1, 2])
 
     retval = fn()
@@ -57,6 +66,83 @@ def test_timer_logs_and_returns_values(mocker: MockerFixture):
     assert retval == 1
 
 
+def test_timer_only_logs_when_debugging(mocker: MockerFixture):
+    @timer
+    def fn() -> int:
+        return 1
+
+    mock_logger = mocker.patch("the_census._utils.timer._logger")
+    mock_logger.isEnabledFor.return_value = False
+    mocker.patch.object(time, "perf_counter", side_effect=[1, 1.5])
+    observe = mocker.patch.object(METRICS, "observe")
+
+    assert fn() == 1
+
+    mock_logger.debug.assert_not_called()
+    observe.assert_called_once_with(
+        "test_timer_only_logs_when_debugging.<locals>.fn", 0.5
+    )
+
+
+def test_configure_logger_only_sets_up_each_log_file_once(
+    mocker: MockerFixture, tmp_path: Path
+):
+    mocker.patch.object(configureLogger, "_listener", None)
+    mocker.patch.object(configureLogger, "_file_handlers", {})
+    mocker.patch.object(configureLogger, "_channels", {})
+    mocker.patch.object(configureLogger, "_all_channels", set())
+    census_logger = logging.getLogger("census")
+    package_logger = logging.getLogger("the_census")
+    root = logging.getLogger()
+    n_handlers = len(census_logger.handlers)
+    package_handlers = list(package_logger.handlers)
+    package_level = package_logger.level
+    root_handlers = list(root.handlers)
+    root_level = root.level
+
+    for _ in range(3):
+        a_channel = configureLogger.configureLogger(str(tmp_path / "a.log"), "acs.acs1")
+    b_channel = configureLogger.configureLogger(str(tmp_path / "b.log"), "acs.acs5")
+    # a log file with the same name, elsewhere
+    (tmp_path / "c").mkdir()
+    c_channel = configureLogger.configureLogger(str(tmp_path / "c" / "a.log"), "acs")
+
+    listener = cast(Any, configureLogger._listener)
+    (queue_handler,) = [
+        handler
+        for handler in package_logger.handlers
+        if handler not in package_handlers
+    ]
+    try:
+        # the app's root logger is left alone
+        assert root.handlers == root_handlers
+        assert root.level == root_level
+        assert len(census_logger.handlers) == n_handlers + 1
+        assert len(listener.handlers) == 3
+        assert len({a_channel, b_channel, c_channel}) == 3
+
+        LoggerFactory(a_channel).getLogger("the_census.x").debug("for a")
+        LoggerFactory(b_channel).getLogger("the_census.x").debug("for b")
+        logging.getLogger("the_census.y").debug("for everyone")
+        logging.getLogger("app").warning("for the app")
+    finally:
+        configureLogger._stop_listener()
+        census_logger.removeHandler(census_logger.handlers[-1])
+        package_logger.removeHandler(queue_handler)
+        package_logger.setLevel(package_level)
+        for handler in listener.handlers:
+            handler.close()
+
+    a_log = (tmp_path / "a.log").read_text()
+    b_log = (tmp_path / "b.log").read_text()
+
+    assert "[acs.acs1 DEBUG]" in a_log
+    assert "for a" in a_log and "for b" not in a_log
+    assert "for b" in b_log and "for a" not in b_log
+    assert "for everyone" in a_log and "for everyone" in b_log
+    assert "for the app" not in a_log
+
+
 @pytest.mark.parametrize(
     ["variable_name", "cleaned_name"],
     [
@@ -76,3 +162,227 @@ def test_clean_variable_name(variable_name: str, cleaned_name: str):
     res = clean_variable_name(variable_name)
 
     assert res == cleaned_name
+
+
+def test_single_flight_shares_concurrent_calls():
+    flight = SingleFlight()
+    started = threading.Event()
+    calls: List[str] = []
+
+    def slow_call() -> List[str]:
+        calls.append("call")
+        started.set()
+        time.sleep(0.1)
+        return calls
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(flight.do, "key", slow_call)
+        started.wait(timeout=1)
+        followers = [executor.submit(flight.do, "key", slow_call) for _ in range(3)]
+
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert calls == ["call"]
+    # every caller gets the very same result
+    assert all(result is results[0] for result in results)
+    assert flight.in_flight() == 0
+
+
+def test_single_flight_shares_exceptions():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing_call() -> None:
+        started.set()
+        release.wait(timeout=1)
+        raise ValueError("uh oh")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flight.do, "key", failing_call)
+        started.wait(timeout=1)
+        follower = executor.submit(flight.do, "key", lambda: None)
+        # (the follower has to be waiting by the time the leader fails)
+        time.sleep(0.05)
+        release.set()
+
+        for future in [leader, follower]:
+            with pytest.raises(ValueError, match="uh oh"):
+                future.result()
+
+
+def test_single_flight_calls_again_once_done():
+    flight = SingleFlight()
+
+    assert [flight.do("key", lambda: 1), flight.do("key", lambda: 2)] == [1, 2]
+
+
+def test_single_flight_calls_for_same_key_on_same_thread():
+    flight = SingleFlight()
+
+    assert flight.do("key", lambda: flight.do("key", lambda: 1) + 1) == 2
+
+
+def test_metrics_estimate_percentiles_from_buckets():
+    registry = MetricsRegistry()
+
+    for ms in range(1, 101):
+        registry.observe("fn", ms / 1000)
+
+    timing = registry.snapshot().timings["fn"]
+
+    assert timing.calls == 100
+    assert timing.total_ms == pytest.approx(5050)
+    assert timing.max_ms == pytest.approx(100)
+    # the buckets are 1-2-5 apart, so estimates are only so close
+    assert 40 <= timing.p50_ms <= 60
+    assert 80 <= timing.p90_ms <= 100
+    assert 95 <= timing.p99_ms <= 100
+    assert timing.buckets[BUCKETS.index(0.1)] == 100
+    assert timing.buckets[BUCKETS.index(0.01)] == 10
+
+
+def test_metrics_count_by_label():
+    registry = MetricsRegistry()
+
+    registry.increment("api_requests", status="200")
+    registry.increment("api_requests", status="200")
+    registry.increment("api_requests", status="503")
+    registry.increment("api_response_bytes", 512)
+
+    assert registry.snapshot().counters == {
+        'api_requests{status="200"}': 2,
+        'api_requests{status="503"}': 1,
+        "api_response_bytes": 512,
+    }
+
+    registry.reset()
+
+    assert registry.snapshot().counters == {}
+
+
+def test_metrics_to_prometheus():
+    registry = MetricsRegistry()
+    registry.observe("Service.get", 0.003)
+    registry.increment("memo_hits", query="get_groups")
+
+    text = registry.snapshot().to_prometheus()
+
+    assert "# TYPE the_census_call_duration_seconds histogram" in text
+    assert (
+        'the_census_call_duration_seconds_bucket{function="Service.get",le="0.002"} 0'
+        in text
+    )
+    assert (
+        'the_census_call_duration_seconds_bucket{function="Service.get",le="0.005"} 1'
+        in text
+    )
+    assert (
+        'the_census_call_duration_seconds_bucket{function="Service.get",le="+Inf"} 1'
+        in text
+    )
+    assert 'the_census_call_duration_seconds_sum{function="Service.get"} 0.003' in text
+    assert 'the_census_call_duration_seconds_count{function="Service.get"} 1' in text
+    assert "# TYPE the_census_memo_hits_total counter" in text
+    assert 'the_census_memo_hits_total{query="get_groups"} 1' in text
+
+
+def test_span_does_nothing_unless_tracing():
+    with span("step", rows=1) as step:
+        step.set(rows=2)
+
+    assert not TRACER.enabled
+
+    with tracing() as trace:
+        pass
+
+    assert trace.spans == []
+
+
+def test_tracing_nests_spans():
+    @timer
+    def fn() -> int:
+        with span("inner", chunk=0) as inner:
+            inner.set(rows=3)
+
+        return 1
+
+    with tracing() as trace:
+        with span("outer"):
+            assert fn() == 1
+
+    assert not TRACER.enabled
+
+    inner, timed, outer = trace.spans
+
+    assert outer.name == "outer"
+    assert outer.parent_id is None
+    assert timed.name == "test_tracing_nests_spans.<locals>.fn"
+    assert timed.parent_id == outer.id
+    assert inner.name == "inner"
+    assert inner.parent_id == timed.id
+    assert inner.attributes == {"chunk": 0, "rows": 3}
+    assert outer.start_ns <= timed.start_ns <= inner.start_ns
+    assert inner.end_ns <= timed.end_ns <= outer.end_ns
+
+
+def test_tracing_nests_spans_on_other_threads():
+    def fetch(index: int) -> int:
+        with span("fetch", chunk=index):
+            return index
+
+    with tracing() as trace:
+        with span("query"):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                assert list(executor.map(traced(fetch), range(3))) == [0, 1, 2]
+
+    query = next(s for s in trace.spans if s.name == "query")
+    fetches = [s for s in trace.spans if s.name == "fetch"]
+
+    assert sorted(s.attributes["chunk"] for s in fetches) == [0, 1, 2]
+    assert all(s.parent_id == query.id for s in fetches)
+
+
+def test_tracing_records_errors():
+    with tracing() as trace:
+        with pytest.raises(ValueError):
+            with span("step"):
+                raise ValueError()
+
+    assert trace.spans[0].attributes == {"error": "ValueError"}
+
+
+def test_tracing_only_once_at_a_time():
+    with tracing():
+        with pytest.raises(RuntimeError, match="Already tracing"):
+            with tracing():
+                pass
+
+        assert TRACER.enabled
+
+    assert not TRACER.enabled
+
+
+def test_tracing_writes_chrome_trace(tmp_path: Path):
+    path = tmp_path / "trace.json"
+
+    with tracing(path):
+        with span("outer"):
+            with span("inner", url=Path("a")):
+                pass
+
+    written = json.loads(path.read_text())
+    events = {event["name"]: event for event in written["traceEvents"]}
+
+    assert events["thread_name"]["ph"] == "M"
+    assert events["thread_name"]["args"] == {"name": threading.current_thread().name}
+    assert events["outer"]["ph"] == "X"
+    assert events["outer"]["ts"] == 0
+    assert events["inner"]["ts"] >= 0
+    assert events["inner"]["dur"] <= events["outer"]["dur"]
+    assert events["inner"]["tid"] == threading.get_ident()
+    assert events["inner"]["args"] == {
+        "id": events["inner"]["args"]["id"],
+        "parent_id": events["outer"]["args"]["id"],
+        "url": "a",
+    }
@@ -1,5 +1,6 @@
+import json
 from itertools import product
-from typing import Any, Collection, List, Tuple
+from typing import Any, Collection, Dict, List, Tuple, Union
 
 import pandas
 from callee.base import Matcher  # type: ignore
@@ -98,14 +99,24 @@ class DataFrameColumnMatcher(Matcher):
 
 class MockRes:
     status_code: int
-    content: Collection[Any]
-
-    def __init__(self, status_code: int, content: Collection[Any] = {}) -> None:
+    content: bytes
+    headers: Dict[str, str]
+
+    def __init__(
+        self,
+        status_code: int,
+        content: Union[Collection[Any], bytes] = {},
+        headers: Dict[str, str] = {},
+    ) -> None:
         self.status_code = status_code
-        self.content = content
+        # as `requests` gives it, so it can be archived as it would be
+        self.content = (
+            content if isinstance(content, bytes) else json.dumps(content).encode()
+        )
+        self.headers = headers
 
     def json(self) -> Collection[Any]:
         if self.status_code != 200:
             raise Exception("uh oh")
 
-        return self.content
+        return json.loads(self.content)
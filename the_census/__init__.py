@@ -1,4 +1,44 @@
 # pyright: reportUnusedImport=false
 
-from the_census._geographies.models import GeoDomain
-from the_census.census import Census
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from the_census._api.transport import (
+        HttpTransport,
+        RecordingTransport,
+        ReplayTransport,
+    )
+    from the_census._geographies.models import GeoDomain
+    from the_census.async_census import AsyncCensus
+    from the_census.census import Census
+
+# what the package exports, and the modules they're defined in. Each
+# is only imported when it's first used, so that importing the
+# package doesn't mean importing pandas, requests, etc.
+_EXPORTS: Dict[str, str] = {
+    "HttpTransport": "the_census._api.transport",
+    "RecordingTransport": "the_census._api.transport",
+    "ReplayTransport": "the_census._api.transport",
+    "GeoDomain": "the_census._geographies.models",
+    "AsyncCensus": "the_census.async_census",
+    "Census": "the_census.census",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+
+    # so that this is only called once per name
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
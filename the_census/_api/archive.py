@@ -0,0 +1,164 @@
+import json
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+from urllib.parse import urlsplit, urlunsplit
+
+# responses are read straight from the mapped file, rather than
+# copied into SQLite's page cache, up to this many bytes of it
+MMAP_SIZE = 2 ** 34
+
+# the headers that anything reading responses looks at (e.g.,
+# when retrying), which are archived along with their bodies
+ARCHIVED_HEADERS = ("Content-Type", "Retry-After")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    status_code INTEGER NOT NULL,
+    body BLOB,
+    headers TEXT
+);
+"""
+
+
+def normalize_url(url: str) -> str:
+    """
+    Drops the API key from `url`, and sorts its query parameters, so
+    that the same request is archived under the same URL (and with no
+    secrets), no matter whose key it was made with
+    """
+    parts = urlsplit(url)
+
+    params = sorted(
+        param
+        for param in parts.query.split("&")
+        if len(param) > 0 and not param.startswith("key=")
+    )
+
+    return urlunsplit(parts._replace(query="&".join(params)))
+
+
+class ArchivedResponse:
+    """
+    A response read from a `ResponseArchive`, with the same `status_code`,
+    `content` and (archived) `headers` as the response it was recorded
+    from. Its body is only decoded if `json()` is called, as it would be
+    for a live response, so a body that isn't JSON fails the same way
+    """
+
+    status_code: int
+    headers: Dict[str, str]
+    _body: Optional[bytes]
+
+    def __init__(
+        self, status_code: int, body: Optional[bytes], headers: Optional[str] = None
+    ) -> None:
+        self.status_code = status_code
+        self.headers = json.loads(headers) if headers else {}
+        self._body = body
+
+    @property
+    def content(self) -> bytes:
+        return b"" if self._body is None else zlib.decompress(self._body)
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class ResponseArchive:
+    """
+    Census API responses, by their (normalized) URLs, in a single
+    SQLite file. Each body is compressed on its own, so that any one
+    of them can be read without the rest.
+    """
+
+    _path: Path
+    _connection: sqlite3.Connection
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+
+        # the fetch services make requests from worker threads
+        self._connection = sqlite3.connect(str(self._path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        self._connection.executescript(_SCHEMA)
+        self.__migrate()
+
+    def put(self, url: str, res: Any) -> None:
+        """
+        Archives `res` (its `status_code`, raw `content`, and the
+        `ARCHIVED_HEADERS` it has) as the response to `url`. Nothing
+        is decoded, so any response can be archived, JSON or not
+        """
+        content = getattr(res, "content", None)
+        body = (
+            zlib.compress(bytes(content))
+            if isinstance(content, (bytes, bytearray)) and len(content) > 0
+            else None
+        )
+
+        res_headers = getattr(res, "headers", None) or {}
+        headers = {
+            name: res_headers[name] for name in ARCHIVED_HEADERS if name in res_headers
+        }
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                [
+                    normalize_url(url),
+                    res.status_code,
+                    body,
+                    json.dumps(headers) if headers else None,
+                ],
+            )
+
+    def get(self, url: str) -> Optional[ArchivedResponse]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status_code, body, headers FROM responses WHERE url = ?",
+                [normalize_url(url)],
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return ArchivedResponse(*row)
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()
+
+        return count
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __migrate(self) -> None:
+        columns = [
+            name
+            for _, name, *_ in self._connection.execute("PRAGMA table_info(responses)")
+        ]
+
+        # archives recorded before headers were kept. Their bodies
+        # are compressed JSON, which reads back just the same
+        if "headers" not in columns:
+            with self._connection:
+                self._connection.execute(
+                    "ALTER TABLE responses ADD COLUMN headers TEXT"
+                )
@@ -0,0 +1,215 @@
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from logging import Logger
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from the_census._api.fetch import (
+    API_URL_FORMAT,
+    IN_FLIGHT,
+    check_health,
+    check_response,
+    geography_codes_route,
+    route_url,
+    stats_routes,
+)
+from the_census._api.health import HEALTH_CHECKS
+from the_census._api.interface import (
+    IAsyncCensusApiFetchService,
+    ICensusApiSerializationService,
+    IHttpTransport,
+    IRateLimiter,
+)
+from the_census._api.models import GeographyItem
+from the_census._api.retry import get_with_retries
+from the_census._config import Config
+from the_census._geographies.models import GeoDomain
+from the_census._utils.log.factory import ILoggerFactory
+from the_census._utils.tracing import span, traced
+from the_census._variables.models import Group, GroupVariable, VariableCode
+
+_T = TypeVar("_T")
+
+# the worker threads that every `AsyncCensusApiFetchService` in the
+# process makes its requests on. Each service's semaphore caps how
+# many of its requests are in flight, so this only needs as many
+# threads as the most any one service allows
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def shared_executor(max_workers: int) -> ThreadPoolExecutor:
+    """
+    The process's executor for async requests, with (at least)
+    `max_workers` threads. If it has fewer, a bigger one replaces it;
+    requests already on the old one finish there, and then its
+    threads exit.
+    """
+    global _executor, _executor_workers
+
+    with _executor_lock:
+        if _executor is None or _executor_workers < max_workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+
+            _executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="the_census_async"
+            )
+            _executor_workers = max_workers
+
+        return _executor
+
+
+class AsyncCensusApiFetchService(IAsyncCensusApiFetchService):
+    """
+    Makes the same queries as `CensusApiFetchService`, as coroutines.
+
+    At most `config.max_concurrent_requests` requests are in flight
+    at a time. Each one goes through the (shared, pooled) transport
+    on a worker thread (from a pool shared by every service in the
+    process), so the event loop is never blocked on I/O, or on
+    waiting to retry.
+    """
+
+    _url: str
+    _parser: ICensusApiSerializationService
+    _transport: IHttpTransport
+    _rate_limiter: IRateLimiter
+    _config: Config
+    _logger: Logger
+    _semaphore: Optional[asyncio.Semaphore]
+    _semaphore_loop: Optional[asyncio.AbstractEventLoop]
+
+    def __init__(
+        self,
+        config: Config,
+        parser: ICensusApiSerializationService,
+        transport: IHttpTransport,
+        rate_limiter: IRateLimiter,
+        logging_factory: ILoggerFactory,
+    ) -> None:
+        self._url = API_URL_FORMAT.format(config.year, config.dataset, config.survey)
+        self._parser = parser
+        self._transport = transport
+        self._rate_limiter = rate_limiter
+        self._config = config
+        self._logger = logging_factory.getLogger(__name__)
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    async def healthcheck(self) -> None:
+        await self._run(self._healthcheck_now, self._url + ".json")
+
+    async def geography_codes(
+        self, for_domain: GeoDomain, in_domains: List[GeoDomain] = []
+    ) -> Any:
+        return await self._fetch(route=geography_codes_route(for_domain, in_domains))
+
+    async def group_data(self) -> Dict[str, Group]:
+        groups_res: Dict[str, List[Dict[str, str]]] = await self._fetch(
+            route="/groups.json"
+        )
+
+        return self._parser.parse_groups(groups_res)
+
+    async def supported_geographies(self) -> OrderedDict[str, GeographyItem]:
+        geogRes = await self._fetch(route="/geography.json")
+
+        return self._parser.parse_supported_geographies(geogRes)
+
+    async def variables_for_group(self, group: str) -> List[GroupVariable]:
+        res = await self._fetch(route=f"/groups/{group}.json")
+
+        return self._parser.parse_group_variables(res)
+
+    async def all_variables(self) -> List[GroupVariable]:
+        res = await self._fetch("/variables.json")
+
+        return self._parser.parse_group_variables(res)
+
+    async def stats(
+        self,
+        variables_codes: List[VariableCode],
+        for_domain: GeoDomain,
+        in_domains: List[GeoDomain] = [],
+    ) -> List[List[List[str]]]:
+        routes = stats_routes(variables_codes, for_domain, in_domains)
+
+        # `gather` returns results in the order the
+        # coroutines were passed in, not the order
+        # in which they finished
+        return list(
+            await asyncio.gather(
+                *[self._fetch_chunk(index, route) for index, route in enumerate(routes)]
+            )
+        )
+
+    async def _fetch(self, route: str = "") -> Any:
+        return await self._run(self._fetch_now, route)
+
+    async def _fetch_chunk(self, index: int, route: str) -> Any:
+        # as `CensusApiFetchService._fetch_chunk` does
+        with span("fetch chunk", chunk=index, route_length=len(route)) as fetched:
+            res = await self._fetch(route)
+
+            if isinstance(res, list):
+                fetched.set(rows=max(len(res) - 1, 0))
+
+            return res
+
+    def _fetch_now(self, route: str) -> Any:
+        url = route_url(self._url, route, self._config.api_key)
+
+        # shares responses with identical requests
+        # in flight, as `CensusApiFetchService` does
+        return IN_FLIGHT.do(
+            (self._transport, url),
+            lambda: check_response(
+                route,
+                self._get(url),
+                self._config,
+                lambda: self._healthcheck_now(self._url + ".json"),
+                self._logger,
+            ),
+        )
+
+    def _healthcheck_now(self, url: str) -> None:
+        # as `CensusApiFetchService.healthcheck` does
+        if HEALTH_CHECKS.passed(self._config):
+            self._logger.debug("healthcheck OK (passed recently)")
+            return
+
+        res = IN_FLIGHT.do((self._transport, url), lambda: self._get(url))
+
+        check_health(res, self._config, self._logger)
+
+    def _get(self, url: str) -> Any:
+        # runs on a worker thread, so waiting to retry
+        # doesn't block the event loop
+        return get_with_retries(
+            self._transport, url, self._config, self._rate_limiter, self._logger
+        )
+
+    async def _run(self, fn: Callable[[str], _T], arg: str) -> _T:
+        async with self._get_semaphore():
+            return await asyncio.get_running_loop().run_in_executor(
+                shared_executor(max(self._config.max_concurrent_requests, 1)),
+                traced(fn),
+                arg,
+            )
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # a semaphore belongs to the event loop it was first used on,
+        # so we need a new one if this service is used across loops
+        # (e.g., with successive calls to `asyncio.run`)
+        loop = asyncio.get_running_loop()
+
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(
+                max(self._config.max_concurrent_requests, 1)
+            )
+            self._semaphore_loop = loop
+
+        return self._semaphore
@@ -1,31 +1,143 @@
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from logging import Logger
-from typing import Any, Dict, Generator, List
+from typing import Any, Callable, Dict, Generator, List
 
-import requests
 from requests.utils import requote_uri
 
+from the_census._api.health import HEALTH_CHECKS
 from the_census._api.interface import (
     ICensusApiFetchService,
     ICensusApiSerializationService,
+    IHttpTransport,
+    IRateLimiter,
 )
 from the_census._api.models import GeographyItem
+from the_census._api.retry import get_with_retries
 from the_census._config import Config
 from the_census._exceptions import CensusDoesNotExistException, InvalidQueryException
 from the_census._geographies.models import GeoDomain
 from the_census._utils.chunk import chunk
 from the_census._utils.log.factory import ILoggerFactory
+from the_census._utils.single_flight import SingleFlight
 from the_census._utils.timer import timer
+from the_census._utils.tracing import span, traced
 from the_census._variables.models import Group, GroupVariable, VariableCode
 
 # we can query only 50 variables at a time, max
 MAX_QUERY_SIZE = 50
 API_URL_FORMAT = "https://api.census.gov/data/{0}/{1}/{2}"
 
+# requests being made right now, by every fetch service in the process
+IN_FLIGHT = SingleFlight()
+
+
+def geography_codes_route(for_domain: GeoDomain, in_domains: List[GeoDomain]) -> str:
+    for_clause = f"for={for_domain}"
+    in_clauses = "&in=".join([str(parent) for parent in in_domains])
+
+    querystring = f"?get=NAME&{for_clause}"
+    if len(in_domains):
+        querystring += f"&in={in_clauses}"  # type: ignore
+
+    return requote_uri(querystring)
+
+
+def stats_routes(
+    variables_codes: List[VariableCode],
+    for_domain: GeoDomain,
+    in_domains: List[GeoDomain],
+) -> List[str]:
+    """
+    Builds one route per chunk of `variables_codes`, since the API
+    limits how many variables can be queried at a time
+
+    Returns:
+        List[str]: the routes, in the same order as `variables_codes`
+    """
+
+    domainStr = "for=" + str(for_domain)
+    in_domainstr = "&".join([f"in={domain}" for domain in in_domains])
+
+    if len(in_domainstr) > 0:
+        domainStr += "&"  # type: ignore
+        domainStr += in_domainstr  # type: ignore
+
+    routes: List[str] = []
+
+    # we need the minus 1 since we're also querying name
+    for codes in chunk(variables_codes, MAX_QUERY_SIZE - 1):
+        code_str = ",".join(codes)
+        var_str = "get=NAME" + f",{code_str}" if len(code_str) > 0 else ""
+
+        route = f"?{var_str}&{domainStr}"
+
+        routes.append(requote_uri(route))
+
+    return routes
+
+
+def check_health(res: Any, config: Config, logger: Logger) -> None:
+    if res.status_code in [404, 400]:
+        msg = f"Data does not exist for dataset={config.dataset}; survey={config.survey}; year={config.year}"
+
+        logger.exception(msg)
+
+        raise CensusDoesNotExistException(msg)
+
+    HEALTH_CHECKS.record_pass(config)
+
+    logger.debug("healthcheck OK")
+
+
+def route_url(base_url: str, route: str, api_key: str) -> str:
+    ampersand_or_question_mark = "&" if "?" in route else "?"
+
+    return base_url + route + ampersand_or_question_mark + "key=" + api_key
+
+
+def parse_response(route: str, res: Any, logger: Logger) -> Any:
+    if res.status_code in [400, 404]:
+        msg = f"Could not make query for route `{route}`"
+        logger.exception(msg)
+        raise InvalidQueryException(msg)
+
+    if res.status_code == 204:  # no content
+        msg = f"Received no content for query for route {route}"
+        logger.info(msg)
+
+        return []
+
+    return res.json()
+
+
+def check_response(
+    route: str,
+    res: Any,
+    config: Config,
+    healthcheck: Callable[[], None],
+    logger: Logger,
+) -> Any:
+    """
+    Parses `res`, as `parse_response` does. But a query can fail
+    because its dataset doesn't exist (e.g., if its healthcheck was
+    deferred), so the dataset is checked first, and a
+    `CensusDoesNotExistException` is raised if that's why. A query
+    that succeeds shows that its dataset exists
+    """
+    if res.status_code in [400, 404]:
+        healthcheck()
+    elif res.status_code == 200:
+        HEALTH_CHECKS.record_pass(config)
+
+    return parse_response(route, res, logger)
+
 
 class CensusApiFetchService(ICensusApiFetchService):
     _url: str
     _parser: ICensusApiSerializationService
+    _transport: IHttpTransport
+    _rate_limiter: IRateLimiter
     _config: Config
     _logger: Logger
 
@@ -33,40 +145,35 @@ class CensusApiFetchService(ICensusApiFetchService):
         self,
         config: Config,
         parser: ICensusApiSerializationService,
+        transport: IHttpTransport,
+        rate_limiter: IRateLimiter,
         logging_factory: ILoggerFactory,
     ) -> None:
         self._url = API_URL_FORMAT.format(config.year, config.dataset, config.survey)
         self._parser = parser
+        self._transport = transport
+        self._rate_limiter = rate_limiter
         self._config = config
         self._logger = logging_factory.getLogger(__name__)
 
     def healthcheck(self) -> None:
-        res = requests.get(self._url + ".json")  # type: ignore
+        if HEALTH_CHECKS.passed(self._config):
+            self._logger.debug("healthcheck OK (passed recently)")
+            return
 
-        if res.status_code in [404, 400]:
-            msg = f"Data does not exist for dataset={self._config.dataset}; survey={self._config.survey}; year={self._config.year}"
+        url = self._url + ".json"
 
-            self._logger.exception(msg)
+        # `Census` objects made at the same time, for the
+        # same dataset, share a healthcheck
+        res = IN_FLIGHT.do((self._transport, url), lambda: self._get(url))
 
-            raise CensusDoesNotExistException(msg)
-
-        self._logger.debug("healthcheck OK")
+        check_health(res, self._config, self._logger)
 
     @timer
     def geography_codes(
         self, for_domain: GeoDomain, in_domains: List[GeoDomain] = []
     ) -> Any:
-
-        for_clause = f"for={for_domain}"
-        in_clauses = "&in=".join([str(parent) for parent in in_domains])
-
-        querystring = f"?get=NAME&{for_clause}"
-        if len(in_domains):
-            querystring += f"&in={in_clauses}"  # type: ignore
-
-        uri_querystring: str = requote_uri(querystring)
-
-        return self._fetch(route=uri_querystring)
+        return self._fetch(route=geography_codes_route(for_domain, in_domains))
 
     @timer
     def group_data(self) -> Dict[str, Group]:
@@ -86,6 +193,13 @@ class CensusApiFetchService(ICensusApiFetchService):
 
         return self._parser.parse_group_variables(res)
 
+    @timer
+    def variables_for_groups(
+        self, groups: List[str]
+    ) -> Generator[List[GroupVariable], None, None]:
+        for res in self._fetch_all([f"/groups/{group}.json" for group in groups]):
+            yield self._parser.parse_group_variables(res)
+
     @timer
     def all_variables(self) -> List[GroupVariable]:
         res = self._fetch("/variables.json")
@@ -100,49 +214,61 @@ class CensusApiFetchService(ICensusApiFetchService):
         in_domains: List[GeoDomain] = [],
     ) -> Generator[List[List[str]], None, None]:
 
-        # we need the minus 1 since we're also querying name
-        for codes in chunk(variables_codes, MAX_QUERY_SIZE - 1):
-            code_str = ",".join(codes)
-            var_str = "get=NAME" + f",{code_str}" if len(code_str) > 0 else ""
+        routes = stats_routes(variables_codes, for_domain, in_domains)
 
-            domainStr = "for=" + str(for_domain)
-            in_domainstr = "&".join([f"in={domain}" for domain in in_domains])
+        # not doing any serializing here, because this is a bit more
+        # complicated (we need to convert the stats to the appropriate
+        # data types, [e.g., int, float] further up when we're working
+        # with dataFrames; there's no real good way to do it down here)
 
-            if len(in_domainstr) > 0:
-                domainStr += "&"  # type: ignore
-                domainStr += in_domainstr  # type: ignore
+        yield from self._fetch_all(routes)
 
-            route = f"?{var_str}&{domainStr}"
+    def _fetch_all(self, routes: List[str]) -> Generator[Any, None, None]:
+        """
+        Fetches `routes`, up to `max_concurrent_requests` at a
+        time, yielding each response in the order of `routes`
+        """
+        max_workers = min(self._config.max_concurrent_requests, len(routes))
 
-            uri_route: str = requote_uri(route)
+        if max_workers <= 1:
+            for index, route in enumerate(routes):
+                yield self._fetch_chunk(index, route)
+            return
 
-            # not doing any serializing here, because this is a bit more
-            # complicated (we need to convert the stats to the appropriate
-            # data types, [e.g., int, float] further up when we're working
-            # with dataFrames; there's no real good way to do it down here)
+        self._logger.debug(
+            f"fetching {len(routes)} routes with {max_workers} concurrent requests"
+        )
 
-            yield self._fetch(uri_route)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # `map` yields results in the order the routes were
+            # submitted, not the order they come back in
+            yield from executor.map(
+                traced(self._fetch_chunk), range(len(routes)), routes
+            )
 
-    def _fetch(self, route: str = "") -> Any:
-        ampersand_or_question_mark = "&" if "?" in route else "?"
-        url = (
-            self._url
-            + route
-            + ampersand_or_question_mark
-            + "key="
-            + self._config.api_key
-        )
-        res = requests.get(url)  # type: ignore
+    def _fetch_chunk(self, index: int, route: str) -> Any:
+        with span("fetch chunk", chunk=index, route_length=len(route)) as fetched:
+            res = self._fetch(route)
 
-        if res.status_code in [400, 404]:
-            msg = f"Could not make query for route `{route}`"
-            self._logger.exception(msg)
-            raise InvalidQueryException(msg)
+            if isinstance(res, list):
+                fetched.set(rows=max(len(res) - 1, 0))
 
-        if res.status_code == 204:  # no content
-            msg = f"Received no content for query for route {route}"
-            self._logger.info(msg)
+            return res
 
-            return []
+    def _fetch(self, route: str = "") -> Any:
+        url = route_url(self._url, route, self._config.api_key)
+
+        # a request that's identical to one that's already being
+        # made (by another thread, or another `Census` sharing
+        # this transport) waits for, and shares, that one's response
+        return IN_FLIGHT.do(
+            (self._transport, url),
+            lambda: check_response(
+                route, self._get(url), self._config, self.healthcheck, self._logger
+            ),
+        )
 
-        return res.json()  # type: ignore
+    def _get(self, url: str) -> Any:
+        return get_with_retries(
+            self._transport, url, self._config, self._rate_limiter, self._logger
+        )
@@ -0,0 +1,117 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from the_census._config import Config
+
+HEALTHCHECK_DIR = "healthchecks"
+
+_DatasetKey = Tuple[int, str, str]
+
+
+def _dataset_key(config: Config) -> _DatasetKey:
+    return (config.year, config.dataset, config.survey)
+
+
+def _healthcheck_path(config: Config) -> Path:
+    return Path(config.cache_dir).joinpath(
+        HEALTHCHECK_DIR, f"{config.year}-{config.dataset}-{config.survey}.json"
+    )
+
+
+class HealthChecks:
+    """
+    Remembers which datasets have passed a healthcheck, and when,
+    so that `Census` objects made for the same dataset don't each
+    need to check it again, until `config.healthcheck_ttl_seconds`
+    have passed.
+
+    Passes are kept in memory and, with `should_cache_on_disk`, in
+    the on-disk cache, so that other processes using the same
+    cache can rely on them too.
+    Failed checks aren't remembered.
+    """
+
+    _lock: threading.Lock
+    _passed_at: Dict[_DatasetKey, float]
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._passed_at = {}
+
+    def passed(self, config: Config) -> bool:
+        """
+        Whether the dataset in `config` passed a healthcheck
+        within the last `config.healthcheck_ttl_seconds`
+        """
+        if config.healthcheck_ttl_seconds <= 0:
+            return False
+
+        key = _dataset_key(config)
+
+        with self._lock:
+            passed_at = self._passed_at.get(key)
+
+        if passed_at is None and config.should_cache_on_disk:
+            passed_at = self.__read(config)
+
+            if passed_at is not None:
+                with self._lock:
+                    self._passed_at[key] = passed_at
+
+        return (
+            passed_at is not None
+            and time.time() - passed_at < config.healthcheck_ttl_seconds
+        )
+
+    def record_pass(self, config: Config) -> None:
+        """
+        Remembers that the dataset in `config` exists
+        (unless that's already known)
+        """
+        if config.healthcheck_ttl_seconds <= 0 or self.passed(config):
+            return
+
+        passed_at = time.time()
+
+        with self._lock:
+            self._passed_at[_dataset_key(config)] = passed_at
+
+        if config.should_cache_on_disk:
+            self.__write(config, passed_at)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._passed_at.clear()
+
+    def __read(self, config: Config) -> Optional[float]:
+        try:
+            with open(_healthcheck_path(config)) as f:
+                return float(json.load(f)["passed_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def __write(self, config: Config, passed_at: float) -> None:
+        path = _healthcheck_path(config)
+        tmp_path = path.with_name(
+            f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(tmp_path, "w") as f:
+                json.dump({"passed_at": passed_at}, f)
+
+            # so that other processes never read half a file
+            os.replace(tmp_path, path)
+        except OSError:
+            # it'll be checked again next time, which is fine
+            pass
+
+
+# passed healthchecks, for every `Census` in the process
+HEALTH_CHECKS = HealthChecks()
@@ -1,12 +1,68 @@
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from typing import Any, Dict, Generator, List
+from typing import Any, Dict, Generator, List, Optional
 
 from the_census._api.models import GeographyItem
 from the_census._geographies.models import GeoDomain
 from the_census._variables.models import Group, GroupVariable, VariableCode
 
 
+class IHttpTransport(ABC):
+    """
+    Sends HTTP requests to the Census API. A single transport
+    can be shared by several fetch services (and so several
+    `Census` objects), so that they reuse the same connections
+    """
+
+    @abstractmethod
+    def get(self, url: str, timeout: Optional[float] = None) -> Any:
+        """
+        Makes a GET request to `url`
+
+        Args:
+            url (str)
+            timeout (Optional[float], optional): how many seconds to wait
+            for the server before giving up. Defaults to None (forever).
+
+        Returns:
+            Any: the response, with a `status_code` and a `json()` method
+        """
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Closes all pooled connections
+        """
+        ...
+
+
+class IRateLimiter(ABC):
+    """
+    Paces requests to the Census API. One limiter is shared by
+    every fetch in the process, so that concurrent queries (and
+    `Census` objects) draw from the same budget
+    """
+
+    @abstractmethod
+    def acquire(self) -> None:
+        """
+        Blocks until another request can be made
+        """
+        ...
+
+    @abstractmethod
+    def defer(self, seconds: float) -> None:
+        """
+        Holds back every request for the next `seconds`
+        (e.g., when the API asks us to slow down)
+
+        Args:
+            seconds (float)
+        """
+        ...
+
+
 class ICensusApiFetchService(ABC):
     """
     Interface for our API client, which will
@@ -77,6 +133,23 @@ class ICensusApiFetchService(ABC):
         """
         ...
 
+    @abstractmethod
+    def variables_for_groups(
+        self, groups: List[str]
+    ) -> Generator[List[GroupVariable], None, None]:
+        """
+        Gets all queryable variables for each of `groups`,
+        making up to `max_concurrent_requests` requests at once.
+
+        Args:
+            groups (List[str]): the groups' codes
+
+        Yields:
+            Generator[List[GroupVariable], None, None]: each group's
+            variables, in the order of `groups`
+        """
+        ...
+
     @abstractmethod
     def all_variables(self) -> List[GroupVariable]:
         """
@@ -111,6 +184,62 @@ class ICensusApiFetchService(ABC):
         ...
 
 
+class IAsyncCensusApiFetchService(ABC):
+    """
+    Asynchronous counterpart to `ICensusApiFetchService`:
+    the same queries, but awaitable, so that many of them
+    can be in flight at once
+    """
+
+    @abstractmethod
+    async def healthcheck(self) -> None:
+        ...
+
+    @abstractmethod
+    async def geography_codes(
+        self, for_domain: GeoDomain, in_domains: List[GeoDomain] = []
+    ) -> List[List[str]]:
+        ...
+
+    @abstractmethod
+    async def group_data(self) -> Dict[str, Group]:
+        ...
+
+    @abstractmethod
+    async def supported_geographies(self) -> OrderedDict[str, GeographyItem]:
+        ...
+
+    @abstractmethod
+    async def variables_for_group(self, group: str) -> List[GroupVariable]:
+        ...
+
+    @abstractmethod
+    async def all_variables(self) -> List[GroupVariable]:
+        ...
+
+    @abstractmethod
+    async def stats(
+        self,
+        variables_codes: List[VariableCode],
+        for_domain: GeoDomain,
+        in_domains: List[GeoDomain] = [],
+    ) -> List[List[List[str]]]:
+        """
+        Gets stats based on `variableCodes` for the geographies in question.
+        All of the (chunked) API calls are made concurrently.
+
+        Args:
+            variables_codes (List[VariableCode])
+            for_domain (GeoDomain)
+            in_domains (List[GeoDomain], optional). Defaults to [].
+
+        Returns:
+            List[List[List[str]]]: one API response per chunk, in
+            the same order as `variables_codes`
+        """
+        ...
+
+
 class ICensusApiSerializationService(ABC):
     """
     Serialization layer between the raw API results & models
@@ -0,0 +1,158 @@
+import itertools
+import threading
+import time
+import weakref
+from typing import Dict, Optional
+
+from the_census._api.interface import IRateLimiter
+from the_census._config import Config
+
+
+class TokenBucket(IRateLimiter):
+    """
+    Lets up to `max_requests_per_second` requests through per second,
+    on average, across all threads. Up to a second's worth of requests
+    can be made at once, after a pause.
+
+    With no `max_requests_per_second`, requests are only held
+    back while they're deferred.
+
+    Other limits can be added with `limit`, for as long as whatever
+    set them is alive; the lowest limit in place applies.
+    """
+
+    _base_rate: Optional[float]
+    _rate: Optional[float]
+    # the limits added with `limit`, for as long as their owners live
+    _limits: Dict[int, float]
+    _limit_ids: "itertools.count[int]"
+    _tokens: float
+    _updated_at: float
+    _not_before: float
+    # reentrant, since an owner may be garbage-collected (and
+    # its limit lifted) while this thread holds it
+    _lock: threading.RLock
+
+    def __init__(self, max_requests_per_second: Optional[float] = None) -> None:
+        if max_requests_per_second is not None and max_requests_per_second <= 0:
+            raise ValueError("`max_requests_per_second` must be positive")
+
+        self._base_rate = max_requests_per_second
+        self._rate = max_requests_per_second
+        self._limits = {}
+        self._limit_ids = itertools.count()
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._not_before = 0.0
+        self._lock = threading.RLock()
+
+    @property
+    def max_requests_per_second(self) -> Optional[float]:
+        return self._rate
+
+    @property
+    def _capacity(self) -> float:
+        return max(self._rate or 1.0, 1.0)
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            wait = max(self._not_before - now, 0.0)
+
+            if self._rate is not None:
+                self._tokens = min(
+                    self._tokens + (now - self._updated_at) * self._rate,
+                    self._capacity,
+                )
+                self._updated_at = now
+
+                # takes the token now, even if it's yet to be refilled,
+                # so that waiting threads are let through in order
+                self._tokens -= 1
+                wait = max(wait, -self._tokens / self._rate)
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def defer(self, seconds: float) -> None:
+        with self._lock:
+            self._not_before = max(self._not_before, time.monotonic() + seconds)
+
+    def limit(self, owner: object, max_requests_per_second: float) -> None:
+        """
+        Limits requests to `max_requests_per_second` (if no lower
+        limit is in place) until `owner` is garbage-collected
+        """
+        if max_requests_per_second <= 0:
+            raise ValueError("`max_requests_per_second` must be positive")
+
+        with self._lock:
+            limit_id = next(self._limit_ids)
+            self._limits[limit_id] = max_requests_per_second
+            self.__update_rate()
+
+        weakref.finalize(owner, self.__lift, limit_id)
+
+    def reset(self) -> None:
+        """
+        Lifts every limit added with `limit`
+        """
+        with self._lock:
+            self._limits.clear()
+            self.__update_rate()
+
+    def __lift(self, limit_id: int) -> None:
+        with self._lock:
+            self._limits.pop(limit_id, None)
+            self.__update_rate()
+
+    def __update_rate(self) -> None:
+        rates = list(self._limits.values())
+
+        if self._base_rate is not None:
+            rates.append(self._base_rate)
+
+        rate = min(rates, default=None)
+
+        if rate == self._rate:
+            return
+
+        now = time.monotonic()
+
+        if self._rate is None:
+            # nothing was being held back, so the bucket starts full
+            self._rate = rate
+            self._tokens = self._capacity
+        else:
+            # tokens are only refilled at the new rate from now on
+            self._tokens = min(
+                self._tokens + (now - self._updated_at) * self._rate, self._capacity
+            )
+            self._rate = rate
+            self._tokens = min(self._tokens, self._capacity)
+
+        self._updated_at = now
+
+
+_shared = TokenBucket()
+
+
+def shared_rate_limiter(config: Config) -> TokenBucket:
+    """
+    Gets the limiter shared by every fetch in the process. If several
+    `Census` objects set a `max_requests_per_second`, the lowest of
+    those still in use applies to all of them, since they all query
+    the same API. Once a `Census` (i.e., its `config`) is garbage-
+    collected, its limit no longer applies
+    """
+    if config.max_requests_per_second is not None:
+        _shared.limit(config, config.max_requests_per_second)
+
+    return _shared
+
+
+def reset_rate_limit() -> None:
+    """
+    Lifts every `Census`'s limit on the shared limiter
+    """
+    _shared.reset()
@@ -0,0 +1,141 @@
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from logging import Logger
+from typing import Any, Optional
+
+import requests
+
+from the_census._api.archive import normalize_url
+from the_census._api.interface import IHttpTransport, IRateLimiter
+from the_census._config import Config
+from the_census._exceptions import CensusApiUnavailableException
+from the_census._utils.metrics import METRICS
+from the_census._utils.tracing import span
+
+# responses that mean the API is throttling us, or is (hopefully
+# briefly) down, so that the same request may well succeed later
+RETRYABLE_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+RETRYABLE_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    ConnectionError,
+    TimeoutError,
+)
+
+# no backoff is longer than this, unless the API asks for it
+MAX_BACKOFF_SECONDS = 60.0
+
+
+def backoff_seconds(attempt: int, base_seconds: float) -> float:
+    """
+    How long to wait before retrying after `attempt` (from 0) failed:
+    a random time of up to `base_seconds * 2**attempt`, so that
+    concurrent requests that failed together don't retry together
+    """
+    return random.uniform(0, min(base_seconds * 2 ** attempt, MAX_BACKOFF_SECONDS))
+
+
+def retry_after_seconds(res: Any) -> Optional[float]:
+    """
+    Reads a response's `Retry-After` header, which can
+    be either a number of seconds, or an HTTP date
+    """
+    value = getattr(res, "headers", {}).get("Retry-After")
+
+    if value is None:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def response_bytes(res: Any) -> int:
+    """
+    How big a response's body is, if it's known
+    """
+    content = getattr(res, "content", None)
+
+    return len(content) if isinstance(content, (bytes, bytearray)) else 0
+
+
+def get_with_retries(
+    transport: IHttpTransport,
+    url: str,
+    config: Config,
+    rate_limiter: IRateLimiter,
+    logger: Logger,
+) -> Any:
+    """
+    Makes a GET request to `url`, retrying up to `config.max_retries`
+    times, with backoff, if it's throttled, gets a 5xx, or its
+    connection fails (or times out, after `config.request_timeout_seconds`).
+
+    Throttling (a 429, or any `Retry-After`) holds back every request
+    that shares `rate_limiter`, not just this one.
+
+    Raises:
+        CensusApiUnavailableException: if the last attempt failed, too
+
+    Returns:
+        Any: the first response that isn't worth retrying
+    """
+    for attempt in range(config.max_retries + 1):
+        rate_limiter.acquire()
+
+        try:
+            with span("GET", attempt=attempt, url_length=len(url)) as request:
+                res = transport.get(url, config.request_timeout_seconds)
+                request.set(status=res.status_code, bytes=response_bytes(res))
+        except RETRYABLE_ERRORS as e:
+            METRICS.increment("api_requests", status="error")
+
+            failure = f"{type(e).__name__}: {e}"
+            error: Optional[Exception] = e
+            wait = backoff_seconds(attempt, config.retry_backoff_seconds)
+            throttled = False
+        else:
+            METRICS.increment("api_requests", status=str(res.status_code))
+            METRICS.increment("api_response_bytes", response_bytes(res))
+
+            if res.status_code not in RETRYABLE_STATUS_CODES:
+                return res
+
+            failure = f"status {res.status_code}"
+            error = None
+            retry_after = retry_after_seconds(res)
+            wait = (
+                retry_after
+                if retry_after is not None
+                else backoff_seconds(attempt, config.retry_backoff_seconds)
+            )
+            throttled = res.status_code == 429 or retry_after is not None
+
+        if attempt == config.max_retries:
+            msg = (
+                f"Request for `{normalize_url(url)}` failed after "
+                f"{attempt + 1} attempt(s) ({failure})"
+            )
+            logger.exception(msg)
+
+            raise CensusApiUnavailableException(msg) from error
+
+        logger.info(
+            f"Request for `{normalize_url(url)}` failed ({failure}); "
+            f"retrying in {wait:.2f}s"
+        )
+
+        if throttled:
+            rate_limiter.defer(wait)
+        else:
+            time.sleep(wait)
@@ -0,0 +1,153 @@
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from the_census._api.archive import ResponseArchive
+from the_census._api.interface import IHttpTransport
+from the_census._exceptions import ResponseNotRecordedException
+
+DEFAULT_POOL_SIZE = 10
+
+
+class HttpTransport(IHttpTransport):
+    """
+    Connection-pooled transport for the Census API. Every request
+    goes through one `requests.Session`, so TCP/TLS connections
+    to api.census.gov are kept alive and reused across calls.
+
+    To share connections across several `Census` objects, create
+    one transport and pass it to each of them:
+
+    ```python
+    transport = HttpTransport(pool_size=20)
+
+    panel = [Census(year, transport=transport) for year in range(2010, 2020)]
+    ```
+    """
+
+    _session: requests.Session
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, keep_alive: bool = True):
+        """
+        Args:
+            pool_size (int, optional): maximum number of connections kept
+            open per host. This should be at least as large as
+            `max_concurrent_requests`. Defaults to DEFAULT_POOL_SIZE.
+            keep_alive (bool, optional): if `False`, connections are
+            closed after every response. Defaults to True.
+        """
+        self._session = requests.Session()
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        if not keep_alive:
+            self._session.headers["Connection"] = "close"
+
+    def get(self, url: str, timeout: Optional[float] = None) -> Any:
+        return self._session.get(url, timeout=timeout)  # type: ignore
+
+    def close(self) -> None:
+        self._session.close()
+
+    def __enter__(self) -> "HttpTransport":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+
+class RecordingTransport(IHttpTransport):
+    """
+    Makes requests through another transport, and archives every
+    response (by its URL, without the API key) in `archive_path`,
+    so that they can be replayed later with `ReplayTransport`:
+
+    ```python
+    with RecordingTransport("responses.db") as transport:
+        Census(2019, transport=transport).get_stats(...)
+    ```
+    """
+
+    _transport: IHttpTransport
+    _archive: ResponseArchive
+
+    def __init__(
+        self,
+        archive_path: Union[str, Path],
+        transport: Optional[IHttpTransport] = None,
+    ):
+        """
+        Args:
+            archive_path (Union[str, Path]): where to archive responses.
+            If there's already an archive there, it's added to.
+            transport (Optional[IHttpTransport], optional): what to make
+            requests with. Defaults to a new `HttpTransport`.
+        """
+        self._transport = transport if transport is not None else HttpTransport()
+        self._archive = ResponseArchive(archive_path)
+
+    def get(self, url: str, timeout: Optional[float] = None) -> Any:
+        res = self._transport.get(url, timeout)
+
+        self._archive.put(url, res)
+
+        return res
+
+    def close(self) -> None:
+        self._transport.close()
+        self._archive.close()
+
+    def __enter__(self) -> "RecordingTransport":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+
+class ReplayTransport(IHttpTransport):
+    """
+    Answers requests from an archive made by `RecordingTransport`,
+    without going over the network. The API key doesn't matter:
+    requests are matched on their URLs without it.
+
+    ```python
+    with ReplayTransport("responses.db") as transport:
+        Census(2019, transport=transport).get_stats(...)
+    ```
+    """
+
+    _archive: ResponseArchive
+
+    def __init__(self, archive_path: Union[str, Path]):
+        """
+        Args:
+            archive_path (Union[str, Path]): the archive to replay from
+
+        Raises:
+            FileNotFoundError: if there's no archive at `archive_path`
+        """
+        if not Path(archive_path).exists():
+            raise FileNotFoundError(f"No archive of responses at {archive_path}")
+
+        self._archive = ResponseArchive(archive_path)
+
+    def get(self, url: str, timeout: Optional[float] = None) -> Any:
+        res = self._archive.get(url)
+
+        if res is None:
+            raise ResponseNotRecordedException(f"No recorded response for {url}")
+
+        return res
+
+    def close(self) -> None:
+        self._archive.close()
+
+    def __enter__(self) -> "ReplayTransport":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
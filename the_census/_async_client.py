@@ -0,0 +1,218 @@
+import asyncio
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from the_census._api.interface import IAsyncCensusApiFetchService
+from the_census._client import CensusClient
+from the_census._geographies.models import GeoDomain, GeoDomainTypes, SupportedGeoSet
+from the_census._persistence.models import MemoStats
+from the_census._stats.interface import ICensusStatisticsService
+from the_census._utils.metrics import METRICS
+from the_census._utils.tracing import span
+from the_census._utils.unique import get_unique
+from the_census._variables.models import GroupCode, VariableCode
+from the_census._variables.repository.interface import IVariableRepository
+from the_census._variables.repository.models import GroupSet, VariableSet
+
+
+class AsyncCensusClient:
+    """
+    Async counterpart to `CensusClient`. Stats and group variables
+    are fetched with the async API service, so their requests run
+    concurrently; everything else is delegated to the sync client
+    on a worker thread.
+    """
+
+    _client: CensusClient
+    _api: IAsyncCensusApiFetchService
+    _variable_repo: IVariableRepository[pd.DataFrame]
+    _stats: ICensusStatisticsService[pd.DataFrame]
+
+    def __init__(
+        self,
+        client: CensusClient,
+        api: IAsyncCensusApiFetchService,
+        variableRepo: IVariableRepository[pd.DataFrame],
+        stats: ICensusStatisticsService[pd.DataFrame],
+    ) -> None:
+        self._client = client
+        self._api = api
+        self._variable_repo = variableRepo
+        self._stats = stats
+
+    # search
+    async def search_groups(self, regex: str) -> pd.DataFrame:
+        return await asyncio.to_thread(self._client.search_groups, regex)
+
+    async def search_variables(self, regex: str, *in_groups: GroupCode) -> pd.DataFrame:
+        return await asyncio.to_thread(self._client.search_variables, regex, *in_groups)
+
+    async def search(
+        self,
+        query: str,
+        *in_groups: GroupCode,
+        limit: Optional[int] = None,
+        fuzzy: bool = False,
+    ) -> pd.DataFrame:
+        return await asyncio.to_thread(
+            lambda: self._client.search(query, *in_groups, limit=limit, fuzzy=fuzzy)
+        )
+
+    async def find_groups(
+        self, query: str, limit: Optional[int] = None, fuzzy: bool = False
+    ) -> pd.DataFrame:
+        return await asyncio.to_thread(
+            lambda: self._client.find_groups(query, limit=limit, fuzzy=fuzzy)
+        )
+
+    # repo
+    async def get_geography_codes(
+        self, for_domain: GeoDomainTypes, *in_domains: GeoDomainTypes
+    ) -> pd.DataFrame:
+        return await asyncio.to_thread(
+            self._client.get_geography_codes, for_domain, *in_domains
+        )
+
+    async def get_groups(self) -> pd.DataFrame:
+        return await asyncio.to_thread(self._client.get_groups)
+
+    async def get_variables_by_group(self, *groups: GroupCode) -> pd.DataFrame:
+        unique_groups = get_unique(groups)
+
+        cached: Dict[GroupCode, pd.DataFrame] = await asyncio.to_thread(
+            lambda: {
+                group: self._variable_repo.get_cached_group_variables(group)
+                for group in unique_groups
+            }
+        )
+
+        misses = [group for group in unique_groups if cached[group].empty]
+
+        fetched = await asyncio.gather(
+            *[self._api.variables_for_group(group) for group in misses]
+        )
+
+        for group, variables in zip(misses, fetched):
+            if len(variables) > 0:
+                cached[group] = self._variable_repo.store_group_variables(
+                    group, variables
+                )
+
+        return self._variable_repo.register_variables(
+            *[cached[group] for group in unique_groups]
+        )
+
+    async def get_all_variables(self) -> pd.DataFrame:
+        return await asyncio.to_thread(self._client.get_all_variables)
+
+    async def get_supported_geographies(self) -> pd.DataFrame:
+        return await asyncio.to_thread(self._client.get_supported_geographies)
+
+    async def get_stats(
+        self,
+        variables_to_query: List[VariableCode],
+        for_domain: GeoDomainTypes,
+        *in_domains: GeoDomainTypes,
+        use_cache: bool = True,
+        refresh_cache: bool = False,
+    ) -> pd.DataFrame:
+        with span(
+            "AsyncCensusClient.get_stats",
+            variables=len(variables_to_query),
+            for_domain=str(for_domain),
+        ) as query:
+            df = await self.__get_stats(
+                variables_to_query,
+                for_domain,
+                *in_domains,
+                use_cache=use_cache,
+                refresh_cache=refresh_cache,
+            )
+
+            METRICS.increment("stats_rows", len(df))
+            query.set(rows=len(df))
+
+            return df
+
+    async def __get_stats(
+        self,
+        variables_to_query: List[VariableCode],
+        for_domain: GeoDomainTypes,
+        *in_domains: GeoDomainTypes,
+        use_cache: bool,
+        refresh_cache: bool,
+    ) -> pd.DataFrame:
+        variables = get_unique(variables_to_query)
+        for_geo_domain = GeoDomain._from(for_domain)
+        in_geo_domains = get_unique(
+            [GeoDomain._from(in_domain) for in_domain in in_domains]
+        )
+
+        if use_cache and not refresh_cache:
+            cached = await asyncio.to_thread(
+                self._stats.get_cached_stats, variables, for_geo_domain, *in_geo_domains
+            )
+
+            if not cached.empty:
+                return cached
+
+        variables_to_fetch = (
+            self._stats.uncached_variables(variables, for_geo_domain, *in_geo_domains)
+            if use_cache and not refresh_cache
+            else variables
+        )
+
+        api_results = (
+            await self._api.stats(variables_to_fetch, for_geo_domain, in_geo_domains)
+            if len(variables_to_fetch)
+            else []
+        )
+
+        # assembling the frame may need to load supported geographies,
+        # and can be CPU-heavy for wide queries, so it runs off the loop
+        df = await asyncio.to_thread(
+            self._stats.assemble_stats,
+            api_results,
+            variables,
+            for_geo_domain,
+            *in_geo_domains,
+            variables_fetched=variables_to_fetch,
+            use_cache=use_cache,
+        )
+
+        if use_cache:
+            await asyncio.to_thread(
+                self._stats.store_stats,
+                df,
+                variables,
+                for_geo_domain,
+                *in_geo_domains,
+                overwrite=refresh_cache,
+            )
+
+        return df
+
+    # in-memory cache
+    def invalidate(self, *queries: str) -> None:
+        self._client.invalidate(*queries)
+
+    def clear(self) -> None:
+        self._client.clear()
+
+    def cache_info(self) -> MemoStats:
+        return self._client.cache_info()
+
+    # property variables for Jupyter notebook usage
+
+    @property
+    def variables(self) -> VariableSet:
+        return self._client.variables
+
+    @property
+    def groups(self) -> GroupSet:
+        return self._client.groups
+
+    @property
+    def supported_geographies(self) -> SupportedGeoSet:
+        return self._client.supported_geographies
@@ -1,11 +1,16 @@
-from typing import List
+from typing import List, Optional
 
 import pandas as pd
 
-from the_census._api.fetch import ICensusApiFetchService
+from the_census._config import Config
 from the_census._geographies.interface import IGeographyRepository
 from the_census._geographies.models import GeoDomain, GeoDomainTypes, SupportedGeoSet
+from the_census._persistence.interface import IMemoCache
+from the_census._persistence.models import MemoStats
 from the_census._stats.interface import ICensusStatisticsService
+from the_census._utils.memoize import MEMOIZED_QUERIES
+from the_census._utils.metrics import METRICS
+from the_census._utils.tracing import span
 from the_census._variables.models import GroupCode, VariableCode
 from the_census._variables.repository.interface import IVariableRepository
 from the_census._variables.repository.models import GroupSet, VariableSet
@@ -16,8 +21,14 @@ class CensusClient:
     """
     The Census client. Using a layer of indirection to hide
     additional properties from consumers.
+
+    Results are memoized by the services below, so this is the
+    one place they're copied before being handed out.
     """
 
+    _config: Config
+    _memo: IMemoCache
+
     _variable_repo: IVariableRepository[pd.DataFrame]
     _variableSearch: IVariableSearchService[pd.DataFrame]
     _stats: ICensusStatisticsService[pd.DataFrame]
@@ -25,66 +36,120 @@ class CensusClient:
 
     def __init__(
         self,
+        config: Config,
+        memo: IMemoCache,
         variableRepo: IVariableRepository[pd.DataFrame],
         variableSearch: IVariableSearchService[pd.DataFrame],
         stats: ICensusStatisticsService[pd.DataFrame],
-        api: ICensusApiFetchService,
         geoRepo: IGeographyRepository[pd.DataFrame],
     ) -> None:
+        self._config = config
+        self._memo = memo
         self._variable_repo = variableRepo
         self._variableSearch = variableSearch
         self._stats = stats
         self._geo_repo = geoRepo
 
-        # if this healthcheck fails, it will throw, and we
-        # won't instantiate the client
-        api.healthcheck()
-
     # search
     def search_groups(self, regex: str) -> pd.DataFrame:
-        return self._variableSearch.search_groups(regex).copy(deep=True)
+        return self.__copy(self._variableSearch.search_groups(regex))
 
     def search_variables(
         self,
         regex: str,
         *in_groups: GroupCode,
     ) -> pd.DataFrame:
-        return self._variableSearch.search_variables(regex, *in_groups).copy(deep=True)
+        return self.__copy(self._variableSearch.search_variables(regex, *in_groups))
+
+    def search(
+        self,
+        query: str,
+        *in_groups: GroupCode,
+        limit: Optional[int] = None,
+        fuzzy: bool = False,
+    ) -> pd.DataFrame:
+        # results are built afresh for every search, so there's no need to copy them
+        return self._variableSearch.search(query, *in_groups, limit=limit, fuzzy=fuzzy)
+
+    def find_groups(
+        self, query: str, limit: Optional[int] = None, fuzzy: bool = False
+    ) -> pd.DataFrame:
+        return self._variableSearch.find_groups(query, limit=limit, fuzzy=fuzzy)
 
     # repo
     def get_geography_codes(
         self, for_domain: GeoDomainTypes, *in_domains: GeoDomainTypes
     ) -> pd.DataFrame:
-        return self._geo_repo.get_geography_codes(
-            GeoDomain._from(for_domain),
-            *[GeoDomain._from(in_domain) for in_domain in in_domains],
-        ).copy(deep=True)
+        return self.__copy(
+            self._geo_repo.get_geography_codes(
+                GeoDomain._from(for_domain),
+                *[GeoDomain._from(in_domain) for in_domain in in_domains],
+            )
+        )
 
     def get_groups(self) -> pd.DataFrame:
-        return self._variable_repo.get_groups().copy(deep=True)
+        return self.__copy(self._variable_repo.get_groups())
 
     def get_variables_by_group(self, *groups: GroupCode) -> pd.DataFrame:
-        return self._variable_repo.get_variables_by_group(*groups).copy(deep=True)
+        return self.__copy(self._variable_repo.get_variables_by_group(*groups))
 
     def get_all_variables(self) -> pd.DataFrame:
-        return self._variable_repo.get_all_variables().copy(deep=True)
+        return self.__copy(self._variable_repo.get_all_variables())
 
     def get_supported_geographies(self) -> pd.DataFrame:
-        return self._geo_repo.get_supported_geographies().copy(deep=True)
+        return self.__copy(self._geo_repo.get_supported_geographies())
 
     def get_stats(
         self,
         variables_to_query: List[VariableCode],
         for_domain: GeoDomainTypes,
         *in_domains: GeoDomainTypes,
+        use_cache: bool = True,
+        refresh_cache: bool = False,
     ) -> pd.DataFrame:
-        return self._stats.get_stats(
-            variables_to_query,
-            GeoDomain._from(for_domain),
-            *[GeoDomain._from(in_domain) for in_domain in in_domains],
-        ).copy(deep=True)
+        with span(
+            "CensusClient.get_stats",
+            variables=len(variables_to_query),
+            for_domain=str(for_domain),
+        ) as query:
+            df = self._stats.get_stats(
+                variables_to_query,
+                GeoDomain._from(for_domain),
+                *[GeoDomain._from(in_domain) for in_domain in in_domains],
+                use_cache=use_cache,
+                refresh_cache=refresh_cache,
+            )
+
+            METRICS.increment("stats_rows", len(df))
+            query.set(rows=len(df))
+
+            # without the cache, or when it's refreshed, the results
+            # aren't memoized, so there's no need to copy them
+            return self.__copy(df) if use_cache and not refresh_cache else df
+
+    # in-memory cache
+    def invalidate(self, *queries: str) -> None:
+        unknown = [query for query in queries if query not in MEMOIZED_QUERIES]
+        if len(unknown):
+            raise ValueError(
+                f"Unknown queries {unknown}; expected any of {list(MEMOIZED_QUERIES)}"
+            )
+
+        for query in queries:
+            self._memo.invalidate(query)
+
+    def clear(self) -> None:
+        self._memo.clear()
+
+    def cache_info(self) -> MemoStats:
+        return self._memo.stats()
 
     # helpers
+    def __copy(self, df: pd.DataFrame) -> pd.DataFrame:
+        # a shallow copy shares its values with the memoized frame,
+        # but not its index or columns; with pandas' copy-on-write
+        # mode, writes to it won't reach the memoized frame either
+        return df.copy(deep=self._config.copy_results)
 
     # property variables for Jupyter notebook usage
 
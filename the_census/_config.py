@@ -1,6 +1,14 @@
 from dataclasses import dataclass
+from typing import Optional
 
 CACHE_DIR = "cache"
+DEFAULT_MAX_CONCURRENT_REQUESTS = 1
+DEFAULT_CACHE_FORMAT = "csv"
+DEFAULT_MEMO_MAX_BYTES = 512 * 1024 ** 2
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF_SECONDS = 1.0
+DEFAULT_HEALTHCHECK_TTL_SECONDS = 24 * 60 * 60.0
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 30.0
 
 
 @dataclass(frozen=True)
@@ -18,3 +26,14 @@ class Config:
     should_cache_on_disk: bool = False
     replace_column_headers: bool = False
     api_key: str = ""
+    max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS
+    cache_format: str = DEFAULT_CACHE_FORMAT
+    copy_results: bool = True
+    memo_max_bytes: int = DEFAULT_MEMO_MAX_BYTES
+    memo_ttl_seconds: Optional[float] = None
+    max_retries: int = DEFAULT_MAX_RETRIES
+    retry_backoff_seconds: float = DEFAULT_RETRY_BACKOFF_SECONDS
+    max_requests_per_second: Optional[float] = None
+    defer_healthcheck: bool = False
+    healthcheck_ttl_seconds: float = DEFAULT_HEALTHCHECK_TTL_SECONDS
+    request_timeout_seconds: Optional[float] = DEFAULT_REQUEST_TIMEOUT_SECONDS
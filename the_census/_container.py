@@ -0,0 +1,176 @@
+# pyright: reportUnknownMemberType=false
+
+# wires up the services behind `Census` and `AsyncCensus`. This is
+# where pandas, requests, punq, etc. get imported, so this module is
+# only imported once the first `Census` (or `AsyncCensus`) is made
+
+import os
+import threading
+from typing import Optional
+
+import dotenv
+import pandas
+import punq
+
+from the_census._api.async_fetch import AsyncCensusApiFetchService
+from the_census._api.fetch import CensusApiFetchService
+from the_census._api.interface import (
+    IAsyncCensusApiFetchService,
+    ICensusApiFetchService,
+    ICensusApiSerializationService,
+    IHttpTransport,
+    IRateLimiter,
+)
+from the_census._api.rate_limit import shared_rate_limiter
+from the_census._api.serialization import ApiSerializationService
+from the_census._api.transport import HttpTransport
+from the_census._async_client import AsyncCensusClient
+from the_census._client import CensusClient
+from the_census._config import Config
+from the_census._data_transformation.interface import ICensusDataTransformer
+from the_census._data_transformation.service import CensusDataTransformer
+from the_census._exceptions import NoCensusApiKeyException
+from the_census._geographies.interface import IGeographyRepository
+from the_census._geographies.service import GeographyRepository
+from the_census._persistence.inMemory import InMemoryCache
+from the_census._persistence.interface import ICache, IMemoCache, IVariableStore
+from the_census._persistence.onDisk import OnDiskCache
+from the_census._persistence.variableStore import SqliteVariableStore
+from the_census._stats.interface import ICensusStatisticsService
+from the_census._stats.service import CensusStatisticsService
+from the_census._utils.log.configureLogger import configureLogger
+from the_census._utils.log.factory import ILoggerFactory, LoggerFactory
+from the_census._variables.repository.interface import IVariableRepository
+from the_census._variables.repository.service import VariableRepository
+from the_census._variables.search.interface import IVariableSearchService
+from the_census._variables.search.service import VariableSearchService
+
+# these are singletons
+_serializer = ApiSerializationService()
+
+_transport: Optional[HttpTransport] = None
+_transport_lock = threading.Lock()
+
+
+def default_transport() -> HttpTransport:
+    """
+    The transport shared by every `Census` that isn't given its
+    own, so that they all reuse the same pooled connections.
+    It's made when it's first needed
+    """
+    global _transport
+
+    with _transport_lock:
+        if _transport is None:
+            _transport = HttpTransport()
+
+        return _transport
+
+
+def make_config(
+    year: int,
+    dataset: str,
+    survey: str,
+    cache_dir: str,
+    should_load_from_existing_cache: bool,
+    should_cache_on_disk: bool,
+    replace_column_headers: bool,
+    max_concurrent_requests: int,
+    cache_format: str,
+    copy_results: bool,
+    memo_max_bytes: int,
+    memo_ttl_seconds: Optional[float],
+    max_retries: int,
+    retry_backoff_seconds: float,
+    max_requests_per_second: Optional[float],
+    defer_healthcheck: bool,
+    healthcheck_ttl_seconds: float,
+    request_timeout_seconds: Optional[float],
+) -> Config:
+    dotenvPath = dotenv.find_dotenv()
+
+    dotenv.load_dotenv(dotenvPath)
+
+    api_key = os.getenv("CENSUS_API_KEY")
+
+    if api_key is None:
+        raise NoCensusApiKeyException("Could not find `CENSUS_API_KEY` in .env")
+
+    return Config(
+        year,
+        dataset,
+        survey,
+        cache_dir,
+        should_load_from_existing_cache,
+        should_cache_on_disk,
+        replace_column_headers,
+        api_key,
+        max_concurrent_requests,
+        cache_format,
+        copy_results,
+        memo_max_bytes,
+        memo_ttl_seconds,
+        max_retries,
+        retry_backoff_seconds,
+        max_requests_per_second,
+        defer_healthcheck,
+        healthcheck_ttl_seconds,
+        request_timeout_seconds,
+    )
+
+
+def make_container(
+    config: Config, transport: Optional[IHttpTransport], log_file: str
+) -> punq.Container:
+    """
+    Registers every service. Besides the caches, none of them
+    are made until they're resolved (i.e., until a query needs them)
+    """
+    # so that this `Census`'s records only go to its log file
+    loggerFactory = LoggerFactory(
+        configureLogger(log_file, datasetName=f"{config.dataset}.{config.survey}")
+    )
+
+    container = punq.Container()
+
+    # singletons
+    container.register(Config, instance=config)
+    container.register(ICensusApiSerializationService, instance=_serializer)
+    container.register(ILoggerFactory, instance=loggerFactory)
+    container.register(
+        IHttpTransport,
+        instance=transport if transport is not None else default_transport(),
+    )
+    container.register(IRateLimiter, instance=shared_rate_limiter(config))
+    container.register(IMemoCache, instance=InMemoryCache(config, loggerFactory))
+    # made now, rather than with the rest of the services, so
+    # that the on-disk cache is set up (or purged) when the
+    # `Census` is made, and not when it's first queried
+    cache = OnDiskCache(config, loggerFactory)
+    container.register(ICache[pandas.DataFrame], instance=cache)
+    # shared, so that the repository and search see the same (possibly
+    # in-memory) database. It isn't opened until it's first needed
+    container.register(
+        IVariableStore[pandas.DataFrame],
+        instance=SqliteVariableStore(config, cache, loggerFactory),
+    )
+
+    # services
+    container.register(ICensusDataTransformer[pandas.DataFrame], CensusDataTransformer)
+    container.register(ICensusApiFetchService, CensusApiFetchService)
+    container.register(IAsyncCensusApiFetchService, AsyncCensusApiFetchService)
+    container.register(IVariableRepository[pandas.DataFrame], VariableRepository)
+    container.register(IVariableSearchService[pandas.DataFrame], VariableSearchService)
+    container.register(IGeographyRepository[pandas.DataFrame], GeographyRepository)
+    container.register(
+        ICensusStatisticsService[pandas.DataFrame], CensusStatisticsService
+    )
+
+    # the clients
+    container.register(CensusClient)
+    container.register(AsyncCensusClient)
+
+    # for Jupyter
+    pandas.set_option("display.max_colwidth", None)  # type: ignore
+
+    return container
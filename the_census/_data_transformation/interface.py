@@ -58,8 +58,9 @@ class ICensusDataTransformer(Generic[T]):
 
         Args:
             results (List[List[List[str]]]): from the API
-            type_conversions (Dict[str, Any]): for converting the data (which may all be strings) to
-                floats if necessary, otherwise strings
+            type_conversions (Dict[str, Any]): `int` or `float` for each numeric variable;
+                all other variables are kept as strings. Annotation values (e.g., -666666666)
+                and nulls become missing values
             geo_domains_queried (List[str]): by the stats service
             column_headers (Dict[VariableCode, str]): the column headers with cleaned names
             supportedGoes (T): we need to pass this in (as opposed to DI-ing the Geography
@@ -1,23 +1,66 @@
 from collections import OrderedDict
-from typing import Any, Dict, List, Tuple, Union, cast
+from logging import Logger
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
+import numpy as np
 import pandas as pd
 
 from the_census._api.models import GeographyItem
 from the_census._config import Config
 from the_census._data_transformation.interface import ICensusDataTransformer
 from the_census._geographies.models import GeoDomain
+from the_census._utils.log.factory import ILoggerFactory
 from the_census._utils.timer import timer
+from the_census._utils.tracing import span
 from the_census._variables.models import Group, GroupVariable, VariableCode
 
+# the API uses these values to annotate estimates that are missing,
+# or couldn't be computed, instead of returning them as null. See
+# https://www.census.gov/data/developers/data-sets/acs-1year/notes-on-acs-estimate-and-annotation-values.html
+ANNOTATION_VALUES = [
+    -111111111,
+    -222222222,
+    -333333333,
+    -555555555,
+    -666666666,
+    -888888888,
+    -999999999,
+]
+
+
+def parse_numeric(values: np.ndarray) -> np.ndarray:
+    """
+    Parses a 2D object array of API values into floats
+
+    Args:
+        values (np.ndarray): raw values from the API
+
+    Returns:
+        np.ndarray: float64 values, with nulls, unparseable values
+        and annotation values as NaN
+    """
+    try:
+        parsed = values.astype(np.float64)
+    except (TypeError, ValueError):
+        # some values are null or non-numeric, so we need
+        # to go column by column
+        parsed = np.empty(values.shape, dtype=np.float64)
+        for i in range(values.shape[1]):
+            parsed[:, i] = pd.to_numeric(values[:, i], errors="coerce")  # type: ignore
+
+    parsed[np.isin(parsed, ANNOTATION_VALUES)] = np.nan
+
+    return parsed
+
 
 class CensusDataTransformer(ICensusDataTransformer[pd.DataFrame]):
 
     _config: Config
+    _logger: Logger
 
-    def __init__(self, config: Config) -> None:
-
+    def __init__(self, config: Config, logger_factory: ILoggerFactory) -> None:
         self._config = config
+        self._logger = logger_factory.getLogger(__name__)
 
     @timer
     def supported_geographies(
@@ -91,18 +134,18 @@ class CensusDataTransformer(ICensusDataTransformer[pd.DataFrame]):
         column_headers: Dict[VariableCode, str],
         supported_geos: pd.DataFrame,
     ) -> pd.DataFrame:
-        main_df = pd.DataFrame()
-
         mergeKeys = [domain.name for domain in geo_domains_queried]
 
-        for result in results:
-            df = pd.DataFrame(result[1:], columns=result[0])
+        if self._are_chunks_aligned(results, mergeKeys):
+            main_df = self._concat_chunks(results, mergeKeys, type_conversions)
+        else:
+            self._logger.debug("chunks have different geographies; merging them")
 
-            if main_df.empty:
-                main_df = df
-            else:
-                df = df.drop(columns=["NAME"])  # type: ignore
-                main_df = cast(pd.DataFrame, pd.merge(main_df, df, on=mergeKeys, how="inner"))  # type: ignore
+            with span("merge chunks", chunks=len(results)) as merged:
+                merged_df = self._merge_chunks(results, mergeKeys)
+                merged.set(rows=len(merged_df))
+
+            main_df = self._parse_numeric_columns(merged_df, type_conversions)
 
         all_cols = main_df.columns.tolist()
 
@@ -114,16 +157,193 @@ class CensusDataTransformer(ICensusDataTransformer[pd.DataFrame]):
 
         reorderedColumns = name_col + sorted_geo_cols + variable_cols
 
-        return (
-            main_df[reorderedColumns]  # type: ignore
-            .astype(type_conversions)
-            .rename(
-                columns=column_headers if self._config.replace_column_headers else {}
+        with span("sort", rows=len(main_df), columns=len(reorderedColumns)):
+            return (
+                main_df[reorderedColumns]  # type: ignore
+                .rename(
+                    columns=(
+                        column_headers if self._config.replace_column_headers else {}
+                    )
+                )
+                .sort_values(by=sorted_geo_cols)
+                .reset_index(drop=True)
             )
-            .sort_values(by=sorted_geo_cols)
-            .reset_index(drop=True)
+
+    def _are_chunks_aligned(
+        self, results: List[List[List[str]]], merge_keys: List[str]
+    ) -> bool:
+        """
+        The API returns rows in the same geography order for every
+        chunk of a query. If it did so here, the chunks can be put
+        side-by-side, without needing to join them.
+        """
+        if len(results) == 0:
+            return False
+
+        def keys(result: List[List[str]]) -> Optional[List[Tuple[str, ...]]]:
+            header = result[0]
+
+            if not all(key in header for key in merge_keys):
+                return None
+
+            indices = [header.index(key) for key in merge_keys]
+
+            return [tuple(row[i] for i in indices) for row in result[1:]]
+
+        first_keys = keys(results[0])
+
+        return first_keys is not None and all(
+            keys(result) == first_keys for result in results[1:]
         )
 
+    def _concat_chunks(
+        self,
+        results: List[List[List[str]]],
+        merge_keys: List[str],
+        type_conversions: Dict[str, Any],
+    ) -> pd.DataFrame:
+        """
+        Builds one frame from all chunks, without joining them.
+        Geography columns are taken from the first chunk only, and
+        numeric columns are parsed straight into float arrays,
+        one chunk at a time.
+        """
+        n_rows = len(results[0]) - 1
+        cols_by_kind: Dict[str, List[str]] = {"object": [], "float": [], "int": []}
+        indices_by_chunk: List[Dict[str, List[int]]] = []
+
+        for chunk_index, result in enumerate(results):
+            indices: Dict[str, List[int]] = {"object": [], "float": [], "int": []}
+
+            for i, col in enumerate(result[0]):
+                if chunk_index > 0 and (col == "NAME" or col in merge_keys):
+                    continue
+
+                kind = self._column_kind(col, type_conversions)
+                indices[kind].append(i)
+                cols_by_kind[kind].append(col)
+
+            indices_by_chunk.append(indices)
+
+        values_by_kind = {
+            kind: np.empty(
+                (n_rows, len(cols)), dtype=object if kind == "object" else np.float64
+            )
+            for kind, cols in cols_by_kind.items()
+        }
+        starts = {kind: 0 for kind in cols_by_kind}
+
+        for chunk_index, (result, indices) in enumerate(zip(results, indices_by_chunk)):
+            with span("parse chunk", chunk=chunk_index, rows=n_rows):
+                chunk_values = np.array(result[1:], dtype=object).reshape(
+                    n_rows, len(result[0])
+                )
+
+                for kind, kind_indices in indices.items():
+                    end = starts[kind] + len(kind_indices)
+                    raw = chunk_values[:, kind_indices]
+
+                    values_by_kind[kind][:, starts[kind] : end] = (
+                        raw if kind == "object" else parse_numeric(raw)
+                    )
+                    starts[kind] = end
+
+        return self._make_stats_frame(values_by_kind, cols_by_kind)
+
+    def _parse_numeric_columns(
+        self, df: pd.DataFrame, type_conversions: Dict[str, Any]
+    ) -> pd.DataFrame:
+        cols_by_kind: Dict[str, List[str]] = {"object": [], "float": [], "int": []}
+
+        for col in cast(List[str], df.columns.tolist()):
+            cols_by_kind[self._column_kind(col, type_conversions)].append(col)
+
+        with span("parse columns", rows=len(df), columns=len(df.columns)):
+            values_by_kind = {
+                kind: (
+                    df[cols].to_numpy(dtype=object)  # type: ignore
+                    if kind == "object"
+                    else parse_numeric(df[cols].to_numpy(dtype=object))
+                )  # type: ignore
+                for kind, cols in cols_by_kind.items()
+            }
+
+        return self._make_stats_frame(values_by_kind, cols_by_kind)
+
+    def _column_kind(self, col: str, type_conversions: Dict[str, Any]) -> str:
+        if col not in type_conversions:
+            return "object"
+
+        return "int" if type_conversions[col] is int else "float"
+
+    def _make_stats_frame(
+        self,
+        values_by_kind: Dict[str, np.ndarray],
+        cols_by_kind: Dict[str, List[str]],
+    ) -> pd.DataFrame:
+        """
+        Integer columns become nullable integers, so that
+        missing values are masked; float columns keep NaNs.
+        Integer columns with fractional values stay floats
+        """
+        n_rows = len(values_by_kind["object"])
+        int_values = values_by_kind["int"]
+
+        with span(
+            "build frame", rows=n_rows, columns=sum(map(len, cols_by_kind.values()))
+        ):
+            frames = [
+                pd.DataFrame(
+                    values_by_kind["object"], columns=cols_by_kind["object"], copy=False
+                ),
+                pd.DataFrame(
+                    values_by_kind["float"], columns=cols_by_kind["float"], copy=False
+                ),
+                pd.DataFrame(
+                    {
+                        col: self._int_column(col, int_values[:, i])
+                        for i, col in enumerate(cols_by_kind["int"])
+                    },
+                    index=pd.RangeIndex(n_rows),
+                ),
+            ]
+
+            return cast(
+                pd.DataFrame,
+                pd.concat(  # type: ignore
+                    [frame for frame in frames if len(frame.columns)],
+                    axis=1,
+                    copy=False,
+                ),
+            )
+
+    def _int_column(self, col: str, values: np.ndarray) -> Any:
+        mask = np.isnan(values)
+
+        # casting would silently truncate these
+        if not np.all(np.mod(values[~mask], 1) == 0):
+            self._logger.debug(f"`{col}` has non-integer values; keeping it as floats")
+
+            return values
+
+        return pd.arrays.IntegerArray(np.nan_to_num(values).astype(np.int64), mask=mask)
+
+    def _merge_chunks(
+        self, results: List[List[List[str]]], merge_keys: List[str]
+    ) -> pd.DataFrame:
+        main_df = pd.DataFrame()
+
+        for result in results:
+            df = pd.DataFrame(result[1:], columns=result[0])
+
+            if main_df.empty:
+                main_df = df
+            else:
+                df = df.drop(columns=["NAME"])  # type: ignore
+                main_df = cast(pd.DataFrame, pd.merge(main_df, df, on=merge_keys, how="inner"))  # type: ignore
+
+        return main_df
+
     def _partition_stat_columns(
         self,
         renamed_column_headers: Dict[VariableCode, str],
@@ -31,3 +31,25 @@ class NoCensusApiKeyException(Exception):
     """
     Thrown when no Census API key is provided
     """
+
+
+class UnsupportedCacheFormatException(Exception):
+    """
+    Thrown when the requested on-disk cache format is unknown,
+    or its dependencies aren't installed
+    """
+
+
+class ResponseNotRecordedException(Exception):
+    """
+    Thrown when replaying responses from an archive
+    that doesn't have the requested one
+    """
+
+
+class CensusApiUnavailableException(Exception):
+    """
+    Thrown when a request to the Census API is still being
+    throttled, failing with a 5xx, or dropping its connection,
+    after every retry
+    """
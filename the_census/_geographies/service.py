@@ -1,4 +1,3 @@
-from functools import cache
 from logging import Logger
 from typing import List, Tuple, cast
 
@@ -8,8 +7,9 @@ from the_census._api.interface import ICensusApiFetchService
 from the_census._data_transformation.interface import ICensusDataTransformer
 from the_census._geographies.interface import IGeographyRepository
 from the_census._geographies.models import GeoDomain, SupportedGeoSet
-from the_census._persistence.interface import ICache
+from the_census._persistence.interface import ICache, IMemoCache
 from the_census._utils.log.factory import ILoggerFactory
+from the_census._utils.memoize import memoize
 from the_census._utils.timer import timer
 from the_census._utils.unique import get_unique
 
@@ -18,26 +18,37 @@ SUPPORTED_GEOS_FILE = "supported_geographies.csv"
 
 class GeographyRepository(IGeographyRepository[pd.DataFrame]):
     _cache: ICache[pd.DataFrame]
+    _memo: IMemoCache
     _api: ICensusApiFetchService
     _transformer: ICensusDataTransformer[pd.DataFrame]
     _logger: Logger
+    _has_populated_repository: bool
 
     def __init__(
         self,
         cache: ICache[pd.DataFrame],
+        memo: IMemoCache,
         api: ICensusApiFetchService,
         transformer: ICensusDataTransformer[pd.DataFrame],
         logger_factory: ILoggerFactory,
     ) -> None:
         self._cache = cache
+        self._memo = memo
         self._api = api
         self._transformer = transformer
         self._logger = logger_factory.getLogger(__name__)
 
         self._supported_geographies = SupportedGeoSet()
 
+        # the on-disk cache is only read once something needs it
+        self._has_populated_repository = False
+
+    @property
+    def supported_geographies(self) -> SupportedGeoSet:
         self.__populate_repository()
 
+        return self._supported_geographies
+
     @timer
     def get_geography_codes(
         self, for_domain: GeoDomain, *in_domains: GeoDomain
@@ -46,7 +57,7 @@ class GeographyRepository(IGeographyRepository[pd.DataFrame]):
             for_domain, in_domains=tuple(get_unique(in_domains))
         )
 
-    @cache
+    @memoize("get_geography_codes")
     def __get_geography_codes(
         self, for_domain: GeoDomain, in_domains: Tuple[GeoDomain, ...] = ()
     ) -> pd.DataFrame:
@@ -64,7 +75,7 @@ class GeographyRepository(IGeographyRepository[pd.DataFrame]):
     def get_supported_geographies(self) -> pd.DataFrame:
         return self.__get_supported_geographies()
 
-    @cache
+    @memoize("get_supported_geographies")
     def __get_supported_geographies(self) -> pd.DataFrame:
         self._logger.debug("getting supported geographies")
 
@@ -88,6 +99,11 @@ class GeographyRepository(IGeographyRepository[pd.DataFrame]):
         return df
 
     def __populate_repository(self) -> None:
+        if self._has_populated_repository:
+            return
+
+        self._has_populated_repository = True
+
         self._logger.debug("Trying to populate geography repository")
 
         df = self._cache.get(SUPPORTED_GEOS_FILE)
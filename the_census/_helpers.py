@@ -1,14 +1,24 @@
 from dataclasses import dataclass
-from functools import cache
-from typing import Any, Dict, List, cast
+from typing import Any, Dict, List, Optional, cast
 
 import pandas
 import pandas as pd
-import requests
-from tqdm.notebook import tqdm
+
+from the_census._api.interface import IHttpTransport
+from the_census._config import DEFAULT_REQUEST_TIMEOUT_SECONDS, Config
+from the_census._persistence.inMemory import InMemoryCache
+from the_census._persistence.interface import IMemoCache
+from the_census._utils.log.factory import LoggerFactory
+from the_census._utils.memoize import memo_key
+from the_census._utils.progress import progress
 
 URL = "https://api.census.gov/data.json"
 
+# a `Census` keeps the list of datasets in its own in-memory cache;
+# this one's for the lists that aren't made by any one `Census`
+# (i.e., from `Census.list_available_datasets()`)
+_memo = InMemoryCache(Config(), LoggerFactory())
+
 # documentation: https://www2.census.gov/programs-surveys/acs/tech_docs/subject_definitions/
 
 
@@ -31,20 +41,29 @@ class _DatasetsRes:
         )
 
 
-def list_available_datasets() -> pd.DataFrame:
-    return __list_available_datasets()
+def list_available_datasets(
+    transport: IHttpTransport,
+    memo: Optional[IMemoCache] = None,
+    timeout: Optional[float] = DEFAULT_REQUEST_TIMEOUT_SECONDS,
+) -> pd.DataFrame:
+    return (memo if memo is not None else _memo).get_or_compute(
+        "list_available_datasets",
+        memo_key(transport),
+        lambda: __list_available_datasets(transport, timeout),
+    )
 
 
-@cache
-def __list_available_datasets() -> pd.DataFrame:
-    res: Dict[str, Any] = requests.get(URL).json()  # type: ignore
+def __list_available_datasets(
+    transport: IHttpTransport, timeout: Optional[float]
+) -> pd.DataFrame:
+    res: Dict[str, Any] = transport.get(URL, timeout).json()
     dataset_dicts: List[Dict[str, str]] = []
 
     available_datasets: List[_DatasetsRes] = [
         _DatasetsRes.from_json(datasetJson) for datasetJson in res["dataset"]
     ]
 
-    for dataset in cast(List[_DatasetsRes], tqdm(available_datasets)):
+    for dataset in cast(List[_DatasetsRes], progress(available_datasets)):
         # these won't play nice with the tool
         if not dataset.is_aggregate:
             continue
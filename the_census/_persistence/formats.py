@@ -0,0 +1,99 @@
+import importlib.util
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Optional, Type
+
+import pandas as pd
+
+from the_census._exceptions import UnsupportedCacheFormatException
+
+
+class ICacheFormat(ABC):
+    """
+    How a DataFrame is stored in the on-disk cache
+    """
+
+    suffix: str
+
+    @abstractmethod
+    def write(self, data: pd.DataFrame, path: Path) -> None:
+        ...
+
+    @abstractmethod
+    def read(self, path: Path, dtype: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        """
+        Args:
+            path (Path)
+            dtype (Optional[Dict[str, Any]], optional): column types,
+            for formats that don't store them. Defaults to None.
+        """
+        ...
+
+    def resource_name(self, resource: str) -> str:
+        """
+        Swaps the file extension of `resource` (e.g., "groups.csv")
+        for this format's
+        """
+        return os.path.splitext(resource)[0] + self.suffix
+
+
+class CsvFormat(ICacheFormat):
+    suffix = ".csv"
+
+    def write(self, data: pd.DataFrame, path: Path) -> None:
+        data.to_csv(str(path.absolute()), index=False)
+
+    def read(self, path: Path, dtype: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        return pd.read_csv(path.absolute(), dtype=dtype)  # type: ignore
+
+
+class _ArrowFormat(ICacheFormat):
+    """
+    Binary formats keep each column's dtype, so they
+    load without any parsing or type inference
+    """
+
+    def __init__(self) -> None:
+        if importlib.util.find_spec("pyarrow") is None:
+            raise UnsupportedCacheFormatException(
+                f"`pyarrow` must be installed to cache as {self.suffix}; "
+                "install it with `pip install the_census[parquet]`"
+            )
+
+
+class FeatherFormat(_ArrowFormat):
+    suffix = ".feather"
+
+    def write(self, data: pd.DataFrame, path: Path) -> None:
+        # feather only supports the default index
+        data.reset_index(drop=True).to_feather(str(path.absolute()))
+
+    def read(self, path: Path, dtype: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        return pd.read_feather(path.absolute())  # type: ignore
+
+
+class ParquetFormat(_ArrowFormat):
+    suffix = ".parquet"
+
+    def write(self, data: pd.DataFrame, path: Path) -> None:
+        data.to_parquet(str(path.absolute()), index=False)
+
+    def read(self, path: Path, dtype: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        return pd.read_parquet(path.absolute())  # type: ignore
+
+
+CACHE_FORMATS: Dict[str, Type[ICacheFormat]] = {
+    "csv": CsvFormat,
+    "feather": FeatherFormat,
+    "parquet": ParquetFormat,
+}
+
+
+def get_cache_format(name: str) -> ICacheFormat:
+    if name not in CACHE_FORMATS:
+        raise UnsupportedCacheFormatException(
+            f"Unknown cache format `{name}`; expected one of {list(CACHE_FORMATS)}"
+        )
+
+    return CACHE_FORMATS[name]()
@@ -0,0 +1,203 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from logging import Logger
+from typing import Any, Callable, Hashable, Optional, Tuple, TypeVar
+
+import pandas as pd
+
+from the_census._config import Config
+from the_census._persistence.interface import IMemoCache
+from the_census._persistence.models import MemoStats
+from the_census._utils.log.factory import ILoggerFactory
+from the_census._utils.metrics import METRICS
+from the_census._utils.single_flight import SingleFlight
+
+LOG_PREFIX = "[In-Memory Cache]"
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class _Entry:
+    value: Any
+    size_bytes: int
+    expires_at: Optional[float]
+
+
+def size_of(value: Any) -> int:
+    """
+    Roughly how many bytes `value` takes up. DataFrames are what
+    we mostly hold, so they're measured properly (including the
+    strings in object columns); anything else is approximated
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+
+    return sys.getsizeof(value)
+
+
+class InMemoryCache(IMemoCache):
+    """
+    LRU cache that's bounded by the total size of its values,
+    rather than by how many there are. Entries can also
+    expire after `memo_ttl_seconds`.
+
+    It's safe to use from several threads; each value is
+    computed at most once at a time.
+    """
+
+    _logger: Logger
+    _max_bytes: int
+    _ttl_seconds: Optional[float]
+    _entries: "OrderedDict[Tuple[str, Hashable], _Entry]"
+    _in_flight: SingleFlight
+    _size_bytes: int
+    _hits: int
+    _misses: int
+    _evictions: int
+
+    def __init__(self, config: Config, logger_factory: ILoggerFactory) -> None:
+        self._logger = logger_factory.getLogger(__name__)
+        self._max_bytes = config.memo_max_bytes
+        self._ttl_seconds = config.memo_ttl_seconds
+
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self._in_flight = SingleFlight()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, namespace: str, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self.__lookup(namespace, key)
+
+            if entry is None:
+                self._misses += 1
+                METRICS.increment("memo_misses", query=namespace)
+                return False, None
+
+            self._hits += 1
+            METRICS.increment("memo_hits", query=namespace)
+
+            return True, entry.value
+
+    def peek(self, namespace: str, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self.__lookup(namespace, key)
+
+            if entry is None:
+                return False, None
+
+            return True, entry.value
+
+    def put(self, namespace: str, key: Hashable, value: Any) -> None:
+        size_bytes = size_of(value)
+
+        with self._lock:
+            self.__remove((namespace, key))
+
+            if size_bytes > self._max_bytes:
+                self._logger.debug(
+                    f"{LOG_PREFIX} {namespace} entry ({size_bytes} bytes) is "
+                    f"larger than the whole cache; not caching it"
+                )
+                return
+
+            self._entries[(namespace, key)] = _Entry(
+                value,
+                size_bytes,
+                (
+                    None
+                    if self._ttl_seconds is None
+                    else time.monotonic() + self._ttl_seconds
+                ),
+            )
+            self._size_bytes += size_bytes
+
+            while self._size_bytes > self._max_bytes:
+                evicted_key, _ = next(iter(self._entries.items()))
+                self._logger.debug(f"{LOG_PREFIX} evicting {evicted_key[0]} entry")
+                self.__remove(evicted_key)
+                self._evictions += 1
+
+    def get_or_compute(
+        self, namespace: str, key: Hashable, compute: Callable[[], _T]
+    ) -> _T:
+        found, value = self.get(namespace, key)
+
+        if found:
+            return value
+
+        # concurrent misses on the same key wait for
+        # the first one's value, rather than compute it again
+        return self._in_flight.do(
+            (namespace, key), lambda: self.__compute(namespace, key, compute)
+        )
+
+    def invalidate(self, namespace: str, key: Optional[Hashable] = None) -> None:
+        with self._lock:
+            keys = (
+                [(namespace, key)]
+                if key is not None
+                else [k for k in self._entries if k[0] == namespace]
+            )
+
+            for k in keys:
+                self.__remove(k)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def stats(self) -> MemoStats:
+        with self._lock:
+            return MemoStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+                max_bytes=self._max_bytes,
+            )
+
+    def __compute(self, namespace: str, key: Hashable, compute: Callable[[], _T]) -> _T:
+        # another thread may have computed it just before we started
+        with self._lock:
+            entry = self.__lookup(namespace, key)
+
+        if entry is not None:
+            return entry.value
+
+        value = compute()
+        self.put(namespace, key, value)
+
+        return value
+
+    def __lookup(self, namespace: str, key: Hashable) -> Optional[_Entry]:
+        entry = self._entries.get((namespace, key))
+
+        if entry is not None and self.__has_expired(entry):
+            self._logger.debug(f"{LOG_PREFIX} {namespace} entry expired")
+            self.__remove((namespace, key))
+            self._evictions += 1
+            entry = None
+
+        if entry is not None:
+            self._entries.move_to_end((namespace, key))
+
+        return entry
+
+    def __has_expired(self, entry: _Entry) -> bool:
+        return entry.expires_at is not None and time.monotonic() >= entry.expires_at
+
+    def __remove(self, key: Tuple[str, Hashable]) -> None:
+        entry = self._entries.pop(key, None)
+
+        if entry is not None:
+            self._size_bytes -= entry.size_bytes
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Generic, Optional, TypeVar
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from the_census._persistence.models import MemoStats
+from the_census._variables.models import GroupCode, VariableCode
 
 T = TypeVar("T")
 
@@ -14,26 +17,32 @@ class ICache(ABC, Generic[T]):
     _cache_path: Path
 
     @abstractmethod
-    def put(self, resource: str, data: T) -> bool:
+    def put(self, resource: str, data: T, overwrite: bool = False) -> bool:
         """
         Adds `data` to the cache
 
         Args:
             resource (str): string path to identify the resource
             data (T): the data that's being cached
+            overwrite (bool, optional): replace `resource` if it's
+            already cached. Defaults to False.
 
         Returns:
-            bool: `True` if the data did not exist in the cache, `False` if it did
+            bool: `True` if the data was written, `False` if it already
+            existed (and wasn't overwritten)
         """
         ...
 
     @abstractmethod
-    def get(self, resource: str) -> Optional[T]:
+    def get(self, resource: str, dtype: Optional[Dict[str, Any]] = None) -> Optional[T]:
         """
         Gets `resource` from the cache, if it exists, else `None`.
 
         Args:
             resource (str)
+            dtype (Optional[Dict[str, Any]], optional): column types to
+            read `resource` with, if the cache can't keep them itself.
+            Defaults to None.
 
         Returns:
             Optional[T]
@@ -43,3 +52,137 @@ class ICache(ABC, Generic[T]):
     @property
     def cache_path(self) -> Path:
         return self._cache_path
+
+
+class IMemoCache(ABC):
+    """
+    Bounded in-memory cache for query results, so that
+    repeat queries don't need to be recomputed (or refetched).
+
+    Entries are grouped by namespace (e.g., the query that
+    produced them), so that they can be invalidated together.
+    """
+
+    @abstractmethod
+    def get(self, namespace: str, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Returns:
+            Tuple[bool, Any]: whether `key` was found, and its value
+        """
+        ...
+
+    @abstractmethod
+    def peek(self, namespace: str, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Like `get`, but isn't counted as a hit or a miss (e.g., for
+        entries that are only read to see what's held)
+        """
+        ...
+
+    @abstractmethod
+    def put(self, namespace: str, key: Hashable, value: Any) -> None:
+        ...
+
+    @abstractmethod
+    def get_or_compute(
+        self, namespace: str, key: Hashable, compute: Callable[[], T]
+    ) -> T:
+        """
+        Gets `key`'s value, calling `compute` to get (and cache) it
+        if it isn't in the cache
+        """
+        ...
+
+    @abstractmethod
+    def invalidate(self, namespace: str, key: Optional[Hashable] = None) -> None:
+        """
+        Drops `key` from `namespace`, or the whole
+        namespace if no key is given
+        """
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    @abstractmethod
+    def stats(self) -> MemoStats:
+        ...
+
+
+class IVariableStore(ABC, Generic[T]):
+    """
+    On-disk store of all variable metadata for a dataset,
+    indexed by variable code and by group, so that a few
+    variables can be looked up without loading all of them
+    """
+
+    @abstractmethod
+    def put_group(self, group: GroupCode, variables: T) -> bool:
+        """
+        Adds `group`'s variables to the store, without
+        rewriting anything that's already in it
+
+        Args:
+            group (GroupCode)
+            variables (T)
+
+        Returns:
+            bool: `True` if the variables were added, `False` if
+            the group was already stored
+        """
+        ...
+
+    @abstractmethod
+    def get_group(self, group: GroupCode) -> T:
+        """
+        Gets all of `group`'s variables, or an empty
+        result if the group isn't stored
+        """
+        ...
+
+    @abstractmethod
+    def get_variables(self, *codes: VariableCode) -> T:
+        """
+        Gets the stored variables with `codes`
+        """
+        ...
+
+    @abstractmethod
+    def get_all(self) -> T:
+        ...
+
+    @abstractmethod
+    def is_complete(self) -> bool:
+        """
+        Whether every one of the dataset's variables has been stored
+        (rather than just some of its groups')
+        """
+        ...
+
+    @abstractmethod
+    def set_complete(self) -> None:
+        ...
+
+    @abstractmethod
+    def version(self) -> int:
+        """
+        Changes whenever variables are added to the store
+        """
+        ...
+
+    @abstractmethod
+    def get_search_index(self, name: str) -> Optional[bytes]:
+        """
+        Gets the search index saved as `name`, unless
+        variables have been added since it was saved
+        """
+        ...
+
+    @abstractmethod
+    def put_search_index(self, name: str, version: int, data: bytes) -> None:
+        """
+        Saves a search index, built over the variables
+        that were in the store as of `version`
+        """
+        ...
@@ -1,12 +1,15 @@
 import shutil
 from logging import Logger
 from pathlib import Path
+from typing import Any, Dict, Optional
 
 import pandas as pd
 
 from the_census._config import Config
+from the_census._persistence.formats import CsvFormat, ICacheFormat, get_cache_format
 from the_census._persistence.interface import ICache
 from the_census._utils.log.factory import ILoggerFactory
+from the_census._utils.metrics import METRICS
 from the_census._utils.timer import timer
 
 LOG_PREFIX = "[On-Disk Cache]"
@@ -15,10 +18,12 @@ LOG_PREFIX = "[On-Disk Cache]"
 class OnDiskCache(ICache[pd.DataFrame]):
     _config: Config
     _logger: Logger
+    _format: ICacheFormat
 
     def __init__(self, config: Config, logger_factory: ILoggerFactory) -> None:
         self._config = config
         self._logger = logger_factory.getLogger(__name__)
+        self._format = get_cache_format(config.cache_format)
 
         self._cache_path = Path(
             f"{config.cache_dir}/{config.year}/{config.dataset}/{config.survey}"
@@ -45,37 +50,76 @@ class OnDiskCache(ICache[pd.DataFrame]):
         self._cache_path.mkdir(parents=True, exist_ok=True)
 
     @timer
-    def put(self, resource: str, data: pd.DataFrame) -> bool:
+    def put(self, resource: str, data: pd.DataFrame, overwrite: bool = False) -> bool:
         if not self._config.should_cache_on_disk:
             return True
 
-        path = self._cache_path.joinpath(Path(resource))
+        path = self.__resource_path(resource)
+        legacy_path = self.__legacy_csv_path(resource)
 
-        if path.exists():
-            self._logger.debug(f'resource "{resource}" already exists; terminating')
-            return False
+        if path.exists() or legacy_path.exists():
+            if not overwrite:
+                self._logger.debug(f'resource "{resource}" already exists; terminating')
+                return False
+
+            self._logger.debug(f'overwriting resource "{resource}"')
+            legacy_path.unlink(missing_ok=True)
 
         path.parent.mkdir(parents=True, exist_ok=True)
 
         self._logger.debug(f'persisting "{path}" on disk')
 
-        data.to_csv(str(path.absolute()), index=False)
+        self._format.write(data, path)
         return True
 
     @timer
-    def get(self, resource: str) -> pd.DataFrame:
+    def get(
+        self, resource: str, dtype: Optional[Dict[str, Any]] = None
+    ) -> pd.DataFrame:
         if (
             not self._config.should_load_from_existing_cache
             or not self._config.should_cache_on_disk
         ):
             return pd.DataFrame()
 
-        path = self._cache_path.joinpath(Path(resource))
+        path = self.__resource_path(resource)
 
         if not path.exists():
-            self._logger.debug(f'cache miss for "{path}"')
-            return pd.DataFrame()
+            legacy_path = self.__legacy_csv_path(resource)
+
+            if not legacy_path.exists():
+                self._logger.debug(f'cache miss for "{path}"')
+                METRICS.increment("disk_cache_misses")
+                return pd.DataFrame()
+
+            return self.__migrate(legacy_path, path, dtype)
 
         self._logger.debug(f'cache hit for "{path}"')
+        METRICS.increment("disk_cache_hits")
+
+        return self._format.read(path, dtype)
+
+    def __resource_path(self, resource: str) -> Path:
+        return self._cache_path.joinpath(Path(self._format.resource_name(resource)))
+
+    def __legacy_csv_path(self, resource: str) -> Path:
+        """
+        Where `resource` would be, had it been cached as CSV
+        (which used to be the only format)
+        """
+        if isinstance(self._format, CsvFormat):
+            return self.__resource_path(resource)
+
+        return self._cache_path.joinpath(Path(CsvFormat().resource_name(resource)))
+
+    def __migrate(
+        self, legacy_path: Path, path: Path, dtype: Optional[Dict[str, Any]]
+    ) -> pd.DataFrame:
+        self._logger.debug(f'migrating "{legacy_path}" to "{path}"')
+
+        data = CsvFormat().read(legacy_path, dtype)
+
+        self._format.write(data, path)
+        legacy_path.unlink()
 
-        return pd.read_csv(path.absolute())  # type: ignore
+        return data
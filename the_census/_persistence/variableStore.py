@@ -0,0 +1,267 @@
+import os
+import shutil
+import sqlite3
+import threading
+from logging import Logger
+from pathlib import Path
+from typing import Any, List, Optional, Sequence
+
+import pandas as pd
+
+from the_census._config import Config
+from the_census._persistence.interface import ICache, IVariableStore
+from the_census._utils.chunk import chunk
+from the_census._utils.log.factory import ILoggerFactory
+from the_census._utils.timer import timer
+from the_census._variables.models import GroupCode, VariableCode
+
+LOG_PREFIX = "[Variable Store]"
+
+VARIABLES_DB = "variables.db"
+
+# where each group's variables used to be cached, one file per group
+LEGACY_VARIABLES_DIR = "variables"
+
+COLUMNS = [
+    "code",
+    "group_code",
+    "group_concept",
+    "name",
+    "predicate_type",
+    "predicate_only",
+    "limit",
+    "cleaned_name",
+]
+
+# SQLite limits how many parameters a single statement can have
+MAX_PARAMS_PER_QUERY = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS variables (
+    code TEXT NOT NULL,
+    group_code TEXT NOT NULL,
+    group_concept TEXT,
+    name TEXT,
+    predicate_type TEXT,
+    predicate_only INTEGER,
+    "limit" INTEGER,
+    cleaned_name TEXT
+);
+CREATE INDEX IF NOT EXISTS variables_by_code ON variables (code);
+CREATE INDEX IF NOT EXISTS variables_by_group ON variables (group_code);
+CREATE TABLE IF NOT EXISTS variables_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS search_indices (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+"""
+
+# set once every one of the dataset's variables has been stored
+_IS_COMPLETE = "is_complete"
+# bumped whenever variables are added, so that what's been
+# worked out from them (e.g., search indices) can tell it's stale
+_VERSION = "version"
+
+_SELECT = "SELECT {} FROM variables".format(", ".join(f'"{c}"' for c in COLUMNS))
+
+
+class SqliteVariableStore(IVariableStore[pd.DataFrame]):
+    """
+    Keeps every variable for a dataset in a single SQLite
+    table, next to the rest of the on-disk cache (or in memory,
+    if there isn't one). The database isn't opened until it's
+    first needed.
+    """
+
+    _config: Config
+    _cache: ICache[pd.DataFrame]
+    _logger: Logger
+    _connection: Optional[sqlite3.Connection]
+
+    def __init__(
+        self,
+        config: Config,
+        cache: ICache[pd.DataFrame],
+        logger_factory: ILoggerFactory,
+    ) -> None:
+        self._config = config
+        self._cache = cache
+        self._logger = logger_factory.getLogger(__name__)
+
+        self._connection = None
+        self._lock = threading.RLock()
+
+    @timer
+    def put_group(self, group: GroupCode, variables: pd.DataFrame) -> bool:
+        with self._lock:
+            connection = self.__connect()
+
+            if self.__has_group(connection, group):
+                self._logger.debug(f'{LOG_PREFIX} group "{group}" already exists')
+                return False
+
+            self._logger.debug(f'{LOG_PREFIX} adding group "{group}"')
+
+            with connection:
+                self.__insert(connection, variables)
+
+            return True
+
+    @timer
+    def get_group(self, group: GroupCode) -> pd.DataFrame:
+        return self.__select("WHERE group_code = ?", [group])
+
+    @timer
+    def get_variables(self, *codes: VariableCode) -> pd.DataFrame:
+        frames = [
+            self.__select(f"WHERE code IN ({', '.join('?' * len(part))})", part)
+            for part in chunk(list(codes), MAX_PARAMS_PER_QUERY)
+        ]
+
+        if len(frames) == 0:
+            return pd.DataFrame()
+
+        return pd.concat(frames, ignore_index=True)
+
+    @timer
+    def get_all(self) -> pd.DataFrame:
+        return self.__select("", [])
+
+    def is_complete(self) -> bool:
+        with self._lock:
+            return (
+                self.__connect()
+                .execute("SELECT 1 FROM variables_meta WHERE key = ?", [_IS_COMPLETE])
+                .fetchone()
+                is not None
+            )
+
+    def set_complete(self) -> None:
+        with self._lock:
+            connection = self.__connect()
+
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO variables_meta VALUES (?, ?)",
+                    [_IS_COMPLETE, "1"],
+                )
+
+    def version(self) -> int:
+        with self._lock:
+            return self.__version(self.__connect())
+
+    def get_search_index(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            connection = self.__connect()
+
+            row = connection.execute(
+                "SELECT data FROM search_indices WHERE name = ? AND version = ?",
+                [name, self.__version(connection)],
+            ).fetchone()
+
+        return None if row is None else bytes(row[0])
+
+    def put_search_index(self, name: str, version: int, data: bytes) -> None:
+        with self._lock:
+            connection = self.__connect()
+
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO search_indices VALUES (?, ?, ?)",
+                    [name, version, sqlite3.Binary(data)],
+                )
+
+    def __version(self, connection: sqlite3.Connection) -> int:
+        row = connection.execute(
+            "SELECT value FROM variables_meta WHERE key = ?", [_VERSION]
+        ).fetchone()
+
+        return 0 if row is None else int(row[0])
+
+    def __select(self, where: str, params: Sequence[Any]) -> pd.DataFrame:
+        with self._lock:
+            rows = (
+                self.__connect()
+                .execute(f"{_SELECT} {where} ORDER BY code", params)
+                .fetchall()
+            )
+
+        if len(rows) == 0:
+            return pd.DataFrame()
+
+        df = pd.DataFrame(rows, columns=COLUMNS)
+        df["predicate_only"] = df["predicate_only"].astype(bool)
+
+        return df
+
+    def __connect(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+
+        if self._config.should_cache_on_disk:
+            path = self._cache.cache_path.joinpath(VARIABLES_DB)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            database = str(path)
+        else:
+            database = ":memory:"
+
+        self._logger.debug(f"{LOG_PREFIX} opening {database}")
+
+        # the async client reads & writes from worker threads
+        connection = sqlite3.connect(database, check_same_thread=False)
+        connection.executescript(_SCHEMA)
+
+        if self._config.should_cache_on_disk:
+            self.__migrate_legacy_files(connection)
+
+        self._connection = connection
+
+        return connection
+
+    def __migrate_legacy_files(self, connection: sqlite3.Connection) -> None:
+        legacy_path = self._cache.cache_path.joinpath(LEGACY_VARIABLES_DIR)
+
+        if not legacy_path.is_dir():
+            return
+
+        self._logger.debug(f"{LOG_PREFIX} migrating {legacy_path}")
+
+        groups: List[str] = sorted(
+            {os.path.splitext(file)[0] for file in os.listdir(legacy_path)}
+        )
+
+        with connection:
+            for group in groups:
+                if self.__has_group(connection, GroupCode(group)):
+                    continue
+
+                variables = self._cache.get(f"{LEGACY_VARIABLES_DIR}/{group}.csv")
+
+                if variables is not None and not variables.empty:
+                    self.__insert(connection, variables)
+
+        shutil.rmtree(legacy_path)
+
+    def __has_group(self, connection: sqlite3.Connection, group: GroupCode) -> bool:
+        return (
+            connection.execute(
+                "SELECT 1 FROM variables WHERE group_code = ? LIMIT 1", [group]
+            ).fetchone()
+            is not None
+        )
+
+    def __insert(self, connection: sqlite3.Connection, variables: pd.DataFrame) -> None:
+        # `tolist` gives native Python values, which sqlite3 can store
+        rows = zip(*[variables[column].tolist() for column in COLUMNS])
+
+        connection.executemany(
+            f"INSERT INTO variables VALUES ({', '.join('?' * len(COLUMNS))})", rows
+        )
+        connection.execute(
+            "INSERT OR REPLACE INTO variables_meta VALUES (?, ?)",
+            [_VERSION, str(self.__version(connection) + 1)],
+        )
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Optional, TypeVar
 
 from the_census._geographies.models import GeoDomain
 from the_census._variables.models import VariableCode
@@ -19,5 +19,85 @@ class ICensusStatisticsService(ABC, Generic[_T]):
         variables_to_query: List[VariableCode],
         for_domain: GeoDomain,
         *in_domains: GeoDomain,
+        use_cache: bool = True,
+        refresh_cache: bool = False,
     ) -> _T:
+        """
+        Gets stats for a query, from the cache if it's been made before
+
+        Args:
+            variables_to_query (List[VariableCode])
+            for_domain (GeoDomain)
+            in_domains (List[GeoDomain], optional). Defaults to [].
+            use_cache (bool, optional): whether to read and write cached
+            results at all. Defaults to True.
+            refresh_cache (bool, optional): refetch the query, and replace
+            its cached results. Defaults to False.
+        """
+        pass
+
+    @abstractmethod
+    def get_cached_stats(
+        self,
+        variables_queried: List[VariableCode],
+        for_domain: GeoDomain,
+        *in_domains: GeoDomain,
+    ) -> _T:
+        """
+        Gets a query's results from the on-disk cache, without
+        hitting the API. Results are empty if the query isn't cached.
+        """
+        pass
+
+    @abstractmethod
+    def store_stats(
+        self,
+        stats: _T,
+        variables_queried: List[VariableCode],
+        for_domain: GeoDomain,
+        *in_domains: GeoDomain,
+        overwrite: bool = False,
+    ) -> None:
+        """
+        Puts a query's results in the on-disk cache
+        """
+        pass
+
+    @abstractmethod
+    def uncached_variables(
+        self,
+        variables_to_query: List[VariableCode],
+        for_domain: GeoDomain,
+        *in_domains: GeoDomain,
+    ) -> List[VariableCode]:
+        """
+        The variables in a query whose columns we don't yet have
+        for its geographies, and so need to be fetched
+        """
+        pass
+
+    @abstractmethod
+    def assemble_stats(
+        self,
+        api_results: List[List[List[str]]],
+        variables_queried: List[VariableCode],
+        for_domain: GeoDomain,
+        *in_domains: GeoDomain,
+        variables_fetched: Optional[List[VariableCode]] = None,
+        use_cache: bool = True,
+    ) -> _T:
+        """
+        Turns raw stats responses from the API into the final result
+
+        Args:
+            api_results (List[List[List[str]]]): one API response per chunk
+            variables_queried (List[VariableCode]): the variables in the query
+            for_domain (GeoDomain)
+            in_domains (List[GeoDomain], optional). Defaults to [].
+            variables_fetched (Optional[List[VariableCode]], optional): the
+            variables in `api_results`; the rest are taken from columns
+            fetched by earlier queries. Defaults to all of `variables_queried`.
+            use_cache (bool, optional): whether to keep, and reuse, fetched
+            columns. Defaults to True.
+        """
         pass
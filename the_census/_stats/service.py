@@ -1,42 +1,96 @@
-from functools import cache
+import hashlib
+import json
+import threading
 from logging import Logger
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, cast
 
 import pandas as pd
 
 from the_census._api.interface import ICensusApiFetchService
+from the_census._config import Config
 from the_census._data_transformation.interface import ICensusDataTransformer
 from the_census._exceptions import EmptyRepositoryException
 from the_census._geographies.interface import IGeographyRepository
 from the_census._geographies.models import GeoDomain
+from the_census._persistence.interface import ICache, IMemoCache
 from the_census._stats.interface import ICensusStatisticsService
 from the_census._utils.log.factory import ILoggerFactory
+from the_census._utils.memoize import memo_key, memoize
 from the_census._utils.timer import timer
+from the_census._utils.tracing import span
 from the_census._utils.unique import get_unique
 from the_census._variables.models import VariableCode
 from the_census._variables.repository.interface import IVariableRepository
 
+STATS_DIR = "stats"
+
+# the columns held for one `(for_domain, in_domains)` query
+GeoKey = Tuple[GeoDomain, Tuple[GeoDomain, ...]]
+
+# stats are memoized under this namespace, as are the columns
+# held for each geography (under `("columns", GeoKey)`)
+STATS_MEMO = "get_stats"
+
+
+def stats_cache_key(
+    config: Config,
+    variables_to_query: Sequence[VariableCode],
+    for_domain: GeoDomain,
+    in_domains: Sequence[GeoDomain],
+) -> str:
+    """
+    Hashes a stats query, so that the same query always gets the
+    same key, no matter what order its variables or parent
+    geographies were given in
+    """
+
+    query = dict(
+        year=str(config.year),
+        dataset=str(config.dataset),
+        survey=str(config.survey),
+        # the cached frame's column names depend on this
+        replace_column_headers=bool(config.replace_column_headers),
+        variables=sorted(set(str(code) for code in variables_to_query)),
+        for_domain=str(for_domain),
+        in_domains=sorted(set(str(domain) for domain in in_domains)),
+    )
+
+    return hashlib.sha256(json.dumps(query, sort_keys=True).encode()).hexdigest()
+
 
 class CensusStatisticsService(ICensusStatisticsService[pd.DataFrame]):
+    _config: Config
+    _cache: ICache[pd.DataFrame]
+    _memo: IMemoCache
     _api: ICensusApiFetchService
     _transformer: ICensusDataTransformer[pd.DataFrame]
     _variable_repo: IVariableRepository[pd.DataFrame]
     _geo_repo: IGeographyRepository[pd.DataFrame]
     _logger: Logger
+    # held while adding fetched columns to the ones held,
+    # so that concurrent queries don't drop each other's
+    _held_lock: threading.Lock
 
     def __init__(
         self,
+        config: Config,
+        cache: ICache[pd.DataFrame],
+        memo: IMemoCache,
         api: ICensusApiFetchService,
         transformer: ICensusDataTransformer[pd.DataFrame],
         variableRepo: IVariableRepository[pd.DataFrame],
         geoRepo: IGeographyRepository[pd.DataFrame],
         loggerFactory: ILoggerFactory,
     ) -> None:
+        self._config = config
+        self._cache = cache
+        self._memo = memo
         self._api = api
         self._transformer = transformer
         self._variable_repo = variableRepo
         self._geo_repo = geoRepo
         self._logger = loggerFactory.getLogger(__name__)
+        self._held_lock = threading.Lock()
 
     @timer
     def get_stats(
@@ -44,15 +98,38 @@ class CensusStatisticsService(ICensusStatisticsService[pd.DataFrame]):
         variables_to_query: List[VariableCode],
         for_domain: GeoDomain,
         *in_domains: GeoDomain,
+        use_cache: bool = True,
+        refresh_cache: bool = False,
     ) -> pd.DataFrame:
+        unique_variables = tuple(get_unique(variables_to_query))
+        unique_in_domains = tuple(get_unique(in_domains))
 
-        return self.__get_stats(
-            variables_to_query=tuple(get_unique(variables_to_query)),
-            for_domain=for_domain,
-            in_domains=tuple(get_unique(in_domains)),
-        )
+        if not use_cache:
+            return self.__fetch_stats(
+                unique_variables, for_domain, unique_in_domains, use_cache=False
+            )
+
+        if refresh_cache:
+            self._memo.invalidate(
+                STATS_MEMO, memo_key(unique_variables, for_domain, unique_in_domains)
+            )
+
+            df = self.__fetch_stats(
+                unique_variables, for_domain, unique_in_domains, refresh=True
+            )
+            self.store_stats(
+                df,
+                list(unique_variables),
+                for_domain,
+                *unique_in_domains,
+                overwrite=True,
+            )
+
+            return df
 
-    @cache
+        return self.__get_stats(unique_variables, for_domain, unique_in_domains)
+
+    @memoize(STATS_MEMO)
     def __get_stats(
         self,
         variables_to_query: Tuple[VariableCode],
@@ -60,40 +137,345 @@ class CensusStatisticsService(ICensusStatisticsService[pd.DataFrame]):
         in_domains: Tuple[GeoDomain],
     ) -> pd.DataFrame:
 
+        df = self.get_cached_stats(list(variables_to_query), for_domain, *in_domains)
+
+        if not df.empty:
+            return df
+
+        df = self.__fetch_stats(variables_to_query, for_domain, in_domains)
+
+        self.store_stats(df, list(variables_to_query), for_domain, *in_domains)
+
+        return df
+
+    def __fetch_stats(
+        self,
+        variables_to_query: Tuple[VariableCode],
+        for_domain: GeoDomain,
+        in_domains: Tuple[GeoDomain],
+        use_cache: bool = True,
+        refresh: bool = False,
+    ) -> pd.DataFrame:
+
+        variables_to_fetch = (
+            list(variables_to_query)
+            if refresh or not use_cache
+            else self.uncached_variables(
+                list(variables_to_query), for_domain, *in_domains
+            )
+        )
+
         pullStats = lambda: self._api.stats(
-            list(variables_to_query), for_domain, list(in_domains)
+            variables_to_fetch, for_domain, list(in_domains)
+        )
+
+        with span("fetch stats", variables=len(variables_to_fetch)) as fetched:
+            apiResults: List[List[List[str]]] = (
+                [res for res in pullStats()] if len(variables_to_fetch) else []
+            )
+            fetched.set(chunks=len(apiResults))
+
+        return self.assemble_stats(
+            apiResults,
+            list(variables_to_query),
+            for_domain,
+            *in_domains,
+            variables_fetched=variables_to_fetch,
+            use_cache=use_cache,
+        )
+
+    def uncached_variables(
+        self,
+        variables_to_query: List[VariableCode],
+        for_domain: GeoDomain,
+        *in_domains: GeoDomain,
+    ) -> List[VariableCode]:
+        held = self.__held_columns(self.__geo_key(for_domain, in_domains))
+
+        if held is None:
+            return list(variables_to_query)
+
+        return [code for code in variables_to_query if code not in held.columns]
+
+    @timer
+    def get_cached_stats(
+        self,
+        variables_queried: List[VariableCode],
+        for_domain: GeoDomain,
+        *in_domains: GeoDomain,
+    ) -> pd.DataFrame:
+        (
+            column_headers,
+            type_conversions,
+        ) = self._get_variable_names_and_type_conversions(set(variables_queried))
+
+        variable_cols = [
+            self.__column_name(code, column_headers) for code in variables_queried
+        ]
+
+        dtype: Dict[str, Any] = {
+            domain.name: str for domain in [for_domain] + list(in_domains)
+        }
+        dtype.update(NAME=str)
+        int_cols: List[str] = []
+        for code in variables_queried:
+            conversion = type_conversions.get(code)
+            col = self.__column_name(code, column_headers)
+            # int columns are read as floats, since they're kept as
+            # floats if they have fractional values
+            dtype[col] = "float64" if conversion in (int, float) else str
+
+            if conversion is int:
+                int_cols.append(col)
+
+        df = self._cache.get(
+            self.__stats_resource(variables_queried, for_domain, in_domains),
+            dtype=dtype,
+        )
+
+        if df is None or df.empty:
+            return pd.DataFrame()
+
+        self._logger.debug("loaded stats from cache")
+
+        for col in int_cols:
+            if col in df.columns and not isinstance(df[col].dtype, pd.Int64Dtype):
+                try:
+                    df[col] = df[col].astype("Int64")
+                except TypeError:
+                    # it has fractional values
+                    pass
+
+        # the key doesn't depend on variable order, but the columns do
+        geo_cols = [col for col in df.columns if col not in variable_cols]
+
+        return df[geo_cols + variable_cols]  # type: ignore
+
+    @timer
+    def store_stats(
+        self,
+        stats: pd.DataFrame,
+        variables_queried: List[VariableCode],
+        for_domain: GeoDomain,
+        *in_domains: GeoDomain,
+        overwrite: bool = False,
+    ) -> None:
+        if stats.empty:
+            return
+
+        self._cache.put(
+            self.__stats_resource(variables_queried, for_domain, in_domains),
+            stats,
+            overwrite=overwrite,
         )
 
-        apiResults: List[List[List[str]]] = [res for res in pullStats()]
+    def __stats_resource(
+        self,
+        variables_queried: Sequence[VariableCode],
+        for_domain: GeoDomain,
+        in_domains: Sequence[GeoDomain],
+    ) -> str:
+        key = stats_cache_key(self._config, variables_queried, for_domain, in_domains)
 
+        return f"{STATS_DIR}/{key}.csv"
+
+    def __column_name(
+        self, code: VariableCode, column_headers: Dict[VariableCode, str]
+    ) -> str:
+        return column_headers[code] if self._config.replace_column_headers else code
+
+    def assemble_stats(
+        self,
+        api_results: List[List[List[str]]],
+        variables_queried: List[VariableCode],
+        for_domain: GeoDomain,
+        *in_domains: GeoDomain,
+        variables_fetched: Optional[List[VariableCode]] = None,
+        use_cache: bool = True,
+    ) -> pd.DataFrame:
         (
             column_headers,
             type_conversions,
-        ) = self._get_variable_names_and_type_conversions(set(variables_to_query))
+        ) = self._get_variable_names_and_type_conversions(set(variables_queried))
 
         geo_domains_queried = [for_domain] + list(in_domains)
 
         supported_geos = self._geo_repo.get_supported_geographies()
 
-        df = self._transformer.stats(
-            apiResults,
-            type_conversions,
+        if not use_cache:
+            return self._transformer.stats(
+                api_results,
+                type_conversions,
+                geo_domains_queried,
+                column_headers,
+                supported_geos,
+            )
+
+        fetched = (
+            list(variables_queried) if variables_fetched is None else variables_fetched
+        )
+        geo_key = self.__geo_key(for_domain, in_domains)
+        held: Optional[pd.DataFrame]
+
+        def fetched_columns(
+            results: List[List[List[str]]], variables: List[VariableCode]
+        ) -> pd.DataFrame:
+            # keeping variable codes as column names, since what a
+            # variable's column gets renamed to depends on the query
+            return self._transformer.stats(
+                results,
+                {
+                    code: conversion
+                    for code, conversion in type_conversions.items()
+                    if code in variables
+                },
+                geo_domains_queried,
+                {code: code for code in variables},
+                supported_geos,
+            )
+
+        if len(fetched):
+            fresh = fetched_columns(api_results, fetched)
+
+            if fresh.empty:
+                return self.__select(
+                    fresh, variables_queried, geo_domains_queried, column_headers
+                )
+
+            held = self.__hold(geo_key, fresh, geo_domains_queried)
+        else:
+            held = self.__held_columns(geo_key)
+
+        missing = [
+            code
+            for code in variables_queried
+            if held is None or code not in held.columns
+        ]
+
+        if len(missing):
+            # these were held when we checked what to fetch,
+            # but have since been evicted
+            self._logger.debug(f"refetching {len(missing)} evicted variables")
+
+            with span("fetch evicted stats", variables=len(missing)):
+                refetched = [
+                    res
+                    for res in self._api.stats(missing, for_domain, list(in_domains))
+                ]
+
+            fresh = fetched_columns(refetched, missing)
+
+            if fresh.empty:
+                return self.__select(
+                    fresh, variables_queried, geo_domains_queried, column_headers
+                )
+
+            held = self.__hold(geo_key, fresh, geo_domains_queried)
+
+        return self.__select(
+            cast(pd.DataFrame, held),
+            variables_queried,
             geo_domains_queried,
             column_headers,
-            supported_geos,
         )
 
-        return df
+    def __select(
+        self,
+        held: pd.DataFrame,
+        variables_queried: Sequence[VariableCode],
+        geo_domains: List[GeoDomain],
+        column_headers: Dict[VariableCode, str],
+    ) -> pd.DataFrame:
+        # an empty result (e.g., for geographies with no data) may not
+        # have every variable's column, but still gets them, renamed
+        # like any other result's
+        df = held.reindex(
+            columns=self.__geo_columns(held, geo_domains) + list(variables_queried)
+        )
+
+        return cast(
+            pd.DataFrame,
+            df.rename(
+                columns=column_headers if self._config.replace_column_headers else {}
+            ),
+        )
+
+    def __geo_key(
+        self, for_domain: GeoDomain, in_domains: Sequence[GeoDomain]
+    ) -> GeoKey:
+        return (for_domain, tuple(sorted(get_unique(in_domains), key=str)))
+
+    def __held_columns(self, geo_key: GeoKey) -> Optional[pd.DataFrame]:
+        # only queries' results count as memo hits & misses
+        _, held = self._memo.peek(STATS_MEMO, ("columns", geo_key))
+
+        return held
+
+    def __hold(
+        self, geo_key: GeoKey, fresh: pd.DataFrame, geo_domains: List[GeoDomain]
+    ) -> pd.DataFrame:
+        """
+        Adds `fresh`'s columns to the ones held for `geo_key`
+        (as they are now, not as they were when we checked
+        what to fetch), and returns them all
+        """
+        with self._held_lock:
+            held = self.__combine_columns(
+                self.__held_columns(geo_key), fresh, geo_domains
+            )
+
+            self._memo.put(STATS_MEMO, ("columns", geo_key), held)
+
+        return held
+
+    def __geo_columns(
+        self, df: pd.DataFrame, geo_domains: List[GeoDomain]
+    ) -> List[str]:
+        geo_names = {"NAME"} | {domain.name for domain in geo_domains}
+
+        return [col for col in df.columns if col in geo_names]
+
+    def __combine_columns(
+        self,
+        held: Optional[pd.DataFrame],
+        fresh: pd.DataFrame,
+        geo_domains: List[GeoDomain],
+    ) -> pd.DataFrame:
+        if held is None:
+            return fresh
+
+        with span("combine columns", held=len(held.columns), fresh=len(fresh.columns)):
+            geo_cols = self.__geo_columns(held, geo_domains)
+            fresh_cols = [col for col in fresh.columns if col not in geo_cols]
+
+            # refetched columns replace the ones we had
+            held = held.drop(columns=[col for col in fresh_cols if col in held.columns])
+
+            if held[geo_cols].equals(fresh[geo_cols]):
+                return pd.concat([held, fresh[fresh_cols]], axis=1)
+
+            self._logger.debug("geographies changed since last query; merging them")
+
+            return cast(
+                pd.DataFrame,
+                pd.merge(
+                    held,
+                    fresh.drop(columns="NAME"),
+                    on=[col for col in geo_cols if col != "NAME"],
+                    how="inner",
+                ),
+            )
 
     def _get_variable_names_and_type_conversions(
         self, variables_to_query: Set[VariableCode]
     ) -> Tuple[Dict[VariableCode, str], Dict[str, Any]]:
 
-        relevant_variables = {
-            variable.code: variable
-            for variable in self._variable_repo.variables.values()
-            if variable.code in variables_to_query
-        }
+        with span("variable lookup", variables=len(variables_to_query)):
+            relevant_variables = {
+                variable.code: variable
+                for variable in self._variable_repo.find_variables(*variables_to_query)
+                if variable.code in variables_to_query
+            }
         if len(relevant_variables) != len(variables_to_query):
             msg = f"Queried {len(variables_to_query)} variables, but found only {len(relevant_variables)} in repository"
 
@@ -108,7 +490,9 @@ class CensusStatisticsService(ICensusStatisticsService[pd.DataFrame]):
         type_conversions: Dict[str, Any] = {}
         column_headers: Dict[VariableCode, str] = {}
         for k, v in relevant_variables.items():
-            if v.predicate_type in ["int", "float"]:
+            if v.predicate_type == "int":
+                type_conversions.update({k: int})
+            elif v.predicate_type == "float":
                 type_conversions.update({k: float})
 
             cleanedVarName = v.cleaned_name
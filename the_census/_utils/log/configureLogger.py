@@ -1,36 +1,148 @@
+import atexit
 import logging
+import os
+import queue
+import re
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Set
 
-from the_census._utils.log.filters import ModuleFilter
+from the_census._utils.log.filters import LogFileFilter, ModuleFilter
 
 DEFAULT_LOG_FILE = "census.log"
 
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S%z"
 
-def configureLogger(log_file: str, datasetName: str) -> None:
+# the logger that every one of the package's loggers is under
+PACKAGE_LOGGER = "the_census"
+
+_lock = threading.Lock()
+# writes records to the log files, on its own thread
+_listener: Optional[QueueListener] = None
+# the handlers for each log file, by its absolute path
+_file_handlers: Dict[str, logging.Handler] = {}
+# the channel of each log file, by its absolute path
+_channels: Dict[str, str] = {}
+# every channel, for the file handlers' filters
+_all_channels: Set[str] = set()
+
+
+class _QueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # the message is merged with its args now, in case they
+        # change before the listener gets to it; the rest of the
+        # formatting is left to the listener's thread
+        record.msg = record.getMessage()
+        record.args = None
+
+        return record
+
+
+def _log_format(datasetName: str) -> str:
+    return "[{0} %(levelname)s] %(asctime)s [%(name)s.%(funcName)s:%(lineno)d] %(message)s".format(
+        datasetName
+    )
+
+
+def _stop_listener() -> None:
+    """
+    Writes whatever records are still on the queue, and stops the listener
     """
-    sets up logger for the project
+    global _listener
+
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+def _channel_for(path: str) -> str:
+    # e.g., `census_log` for `census.log`, or `census_log2` if
+    # that's taken by another directory's `census.log`
+    name = re.sub(r"\W", "_", os.path.basename(path))
+    channel = name
+    n = 1
+
+    while channel in _all_channels:
+        n += 1
+        channel = f"{name}{n}"
+
+    return channel
+
+
+def configureLogger(log_file: str, datasetName: str) -> str:
+    """
+    sets up logger for the project. This only needs doing once
+    per process (and per log file), so calling it again (e.g.,
+    for every `Census`) doesn't add any more handlers.
+
+    Records are put on a queue, and written to the log file on
+    another thread, so that logging never waits on the disk.
+
+    Only the package's records are logged (at every level, unless
+    the `the_census` logger's level is raised); the root logger
+    isn't changed.
+
+    Each log file has a channel: only records from loggers in it
+    (see `LoggerFactory`) are written to that file, rather than to
+    every log file. The package's other records (e.g., the timer's)
+    aren't meant for any one file, so they're written to all of them.
 
     Args:
         log_file (str): the name of the file that log output will be sent to
+        datasetName (str): prefixes the file's records. If several datasets
+        log to the same file, the first to set it up names it
+
+    Returns:
+        str: the log file's channel
     """
+    global _listener
 
-    logFormat = "[{0} %(levelname)s] %(asctime)s [%(name)s.%(funcName)s:%(lineno)d] %(message)s".format(
-        datasetName
-    )
-    dateFormat = "%Y-%m-%d %H:%M:%S%z"
+    path = os.path.abspath(log_file)
+
+    with _lock:
+        if path in _channels:
+            return _channels[path]
+
+        channel = _channel_for(path)
+        _channels[path] = channel
+        _all_channels.add(channel)
+
+        formatter = logging.Formatter(_log_format(datasetName), datefmt=DATE_FORMAT)
+
+        fileHandler = logging.FileHandler(path)
+        fileHandler.setLevel(logging.NOTSET)
+        fileHandler.addFilter(ModuleFilter())
+        fileHandler.addFilter(LogFileFilter(channel, _all_channels))
+        fileHandler.setFormatter(formatter)
+
+        _file_handlers[path] = fileHandler
+
+        if _listener is not None:
+            # the listener reads its handlers afresh for every record
+            _listener.handlers = tuple(_file_handlers.values())
+            return channel
+
+        logger = logging.getLogger("census")
+        logger.setLevel(logging.NOTSET)
+
+        streamHandler = logging.StreamHandler(sys.stdout)
+        streamHandler.setLevel(logging.INFO)
+        streamHandler.setFormatter(formatter)
+        logger.addHandler(streamHandler)
 
-    logger = logging.getLogger("census")
-    logger.setLevel(logging.NOTSET)
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
 
-    streamHandler = logging.StreamHandler(sys.stdout)
-    streamHandler.setLevel(logging.INFO)
-    formatter = logging.Formatter(logFormat, datefmt=dateFormat)
-    streamHandler.setFormatter(formatter)
-    logger.addHandler(streamHandler)
+        _listener = QueueListener(records, fileHandler, respect_handler_level=True)
+        _listener.start()
+        # so that records still on the queue are written before exiting
+        atexit.register(_stop_listener)
 
-    rootHandler = logging.FileHandler(log_file)
-    rootHandler.setLevel(logging.NOTSET)
-    rootHandler.addFilter(ModuleFilter())
-    rootHandler.setFormatter(formatter)
+        # only the package's records are queued: the root logger (its
+        # level and handlers) is left to the app using the package
+        package_logger = logging.getLogger(PACKAGE_LOGGER)
+        package_logger.setLevel(logging.DEBUG)
+        package_logger.addHandler(_QueueHandler(records))
 
-    logging.basicConfig(level=logging.DEBUG, format=logFormat, handlers=[rootHandler])
+        return channel
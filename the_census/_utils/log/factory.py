@@ -1,5 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
+from typing import Optional
 
 
 class ILoggerFactory(ABC):
@@ -9,8 +10,19 @@ class ILoggerFactory(ABC):
 
 
 class LoggerFactory(ILoggerFactory):
-    def __init__(self) -> None:
+    """
+    Makes loggers whose records go to one log file (see
+    `configureLogger`), if it's given that file's `channel`
+    """
+
+    _channel: Optional[str]
+
+    def __init__(self, channel: Optional[str] = None) -> None:
         super().__init__()
+        self._channel = channel
 
     def getLogger(self, name: str) -> logging.Logger:
-        return logging.getLogger(name)
+        if self._channel is None:
+            return logging.getLogger(name)
+
+        return logging.getLogger(f"{name}.{self._channel}")
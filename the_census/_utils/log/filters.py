@@ -1,4 +1,5 @@
 import logging
+from typing import Collection
 
 
 class ModuleFilter(logging.Filter):
@@ -10,3 +11,25 @@ class ModuleFilter(logging.Filter):
                 return True
 
         return False
+
+
+class LogFileFilter(logging.Filter):
+    """
+    Passes the records meant for one log file (i.e., logged by loggers
+    in its channel), and records that aren't meant for any one file
+    (e.g., the timer's), but not records meant for another file
+    """
+
+    _channel: str
+    _channels: Collection[str]
+
+    def __init__(self, channel: str, channels: Collection[str]) -> None:
+        super().__init__()
+        self._channel = channel
+        # every log file's channel, as more are set up
+        self._channels = channels
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        channel = record.name.rpartition(".")[2]
+
+        return channel == self._channel or channel not in self._channels
@@ -0,0 +1,43 @@
+import functools
+from typing import Any, Callable, Hashable, Tuple, TypeVar, cast
+
+_Func = TypeVar("_Func", bound=Callable[..., Any])
+
+
+def memo_key(*args: Hashable, **kwargs: Hashable) -> Hashable:
+    return (args, tuple(sorted(kwargs.items())))
+
+
+def memoize(namespace: str) -> Callable[[_Func], _Func]:
+    """
+    Like `functools.cache`, but for methods of objects with a `_memo`
+    (an `IMemoCache`): results are kept there, under `namespace`,
+    so they're bounded, and can be invalidated. Unlike
+    `functools.cache`, keys don't hold on to `self`.
+    """
+
+    def decorator(func: _Func) -> _Func:
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Hashable, **kwargs: Hashable) -> Any:
+            return self._memo.get_or_compute(
+                namespace,
+                memo_key(*args, **kwargs),
+                lambda: func(self, *args, **kwargs),
+            )
+
+        return cast(_Func, wrapper)
+
+    return decorator
+
+
+# the namespaces that queries are memoized under (named after
+# the queries), so that they can be invalidated by name
+MEMOIZED_QUERIES: Tuple[str, ...] = (
+    "get_stats",
+    "get_geography_codes",
+    "get_supported_geographies",
+    "get_groups",
+    "get_variables_by_group",
+    "get_all_variables",
+    "list_available_datasets",
+)
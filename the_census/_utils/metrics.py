@@ -0,0 +1,228 @@
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+# upper bounds (in seconds) of the buckets that call
+# durations are counted in, from 10us to 500s
+BUCKETS: Tuple[float, ...] = tuple(
+    round(m * 10.0 ** e, 6) for e in range(-5, 3) for m in (1, 2, 5)
+)
+
+PROMETHEUS_PREFIX = "the_census"
+
+# what each counter counts, for `Metrics.to_prometheus`
+COUNTERS: Dict[str, str] = {
+    "api_requests": "Requests made to the Census API, by status",
+    "api_response_bytes": "Bytes received from the Census API",
+    "memo_hits": "In-memory cache hits, by query",
+    "memo_misses": "In-memory cache misses, by query",
+    "disk_cache_hits": "On-disk cache hits",
+    "disk_cache_misses": "On-disk cache misses",
+    "stats_rows": "Rows returned by get_stats",
+}
+
+_Labels = Tuple[Tuple[str, str], ...]
+
+
+@dataclass(frozen=True)
+class Timing:
+    """
+    How long calls to a function took. Percentiles are estimated
+    from the buckets the calls were counted in
+    """
+
+    calls: int
+    total_ms: float
+    max_ms: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    # how many calls took at most each of `BUCKETS`,
+    # and (last) how many calls there were at all
+    buckets: Tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class Metrics:
+    """
+    A snapshot of the metrics collected in this process
+    """
+
+    # by function (e.g., "CensusStatisticsService.get_stats")
+    timings: Dict[str, Timing]
+    # by counter, and its labels (e.g., 'api_requests{status="200"}')
+    counters: Dict[str, float]
+
+    def to_prometheus(self) -> str:
+        """
+        Renders the metrics in Prometheus' text exposition format
+
+        Returns:
+            str
+        """
+        lines: List[str] = []
+
+        if self.timings:
+            name = f"{PROMETHEUS_PREFIX}_call_duration_seconds"
+            lines += [
+                f"# HELP {name} How long calls to each function took",
+                f"# TYPE {name} histogram",
+            ]
+
+            for function, timing in self.timings.items():
+                label = f'function="{_escape(function)}"'
+
+                for bound, count in zip(BUCKETS, timing.buckets):
+                    lines.append(f'{name}_bucket{{{label},le="{bound:g}"}} {count}')
+
+                lines += [
+                    f'{name}_bucket{{{label},le="+Inf"}} {timing.calls}',
+                    f"{name}_sum{{{label}}} {timing.total_ms / 1000:g}",
+                    f"{name}_count{{{label}}} {timing.calls}",
+                ]
+
+        by_counter: Dict[str, List[Tuple[str, float]]] = {}
+        for key, value in self.counters.items():
+            counter, _, labels = key.partition("{")
+            by_counter.setdefault(counter, []).append(
+                ("{" + labels if labels else "", value)
+            )
+
+        for counter, values in by_counter.items():
+            name = f"{PROMETHEUS_PREFIX}_{counter}_total"
+            lines += [
+                f"# HELP {name} {COUNTERS.get(counter, counter)}",
+                f"# TYPE {name} counter",
+            ]
+            lines += [f"{name}{labels} {value:g}" for labels, value in values]
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(label_value: str) -> str:
+    return label_value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _counter_key(name: str, labels: _Labels) -> str:
+    if not labels:
+        return name
+
+    return (
+        name
+        + "{"
+        + ",".join(f'{label}="{_escape(value)}"' for label, value in labels)
+        + "}"
+    )
+
+
+class _Histogram:
+    counts: List[int]
+    total: float
+    max: float
+
+    def __init__(self) -> None:
+        # the last bucket is for calls slower than all of `BUCKETS`
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.max = 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimates the `q`th quantile, by interpolating
+        within the bucket that it falls in
+        """
+        target = q * sum(self.counts)
+        seen = 0
+
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= target:
+                lower = BUCKETS[i - 1] if i > 0 else 0.0
+                upper = min(BUCKETS[i] if i < len(BUCKETS) else self.max, self.max)
+
+                return lower + (upper - lower) * (target - seen) / count
+
+            seen += count
+
+        return 0.0
+
+    def timing(self) -> Timing:
+        cumulative: List[int] = []
+        seen = 0
+        for count in self.counts[:-1]:
+            seen += count
+            cumulative.append(seen)
+
+        return Timing(
+            calls=sum(self.counts),
+            total_ms=self.total * 1000,
+            max_ms=self.max * 1000,
+            p50_ms=self.percentile(0.5) * 1000,
+            p90_ms=self.percentile(0.9) * 1000,
+            p99_ms=self.percentile(0.99) * 1000,
+            buckets=tuple(cumulative),
+        )
+
+
+class MetricsRegistry:
+    """
+    Collects call durations (from `@timer`) and counters
+    (e.g., bytes fetched, cache hits), for every `Census`
+    in the process
+    """
+
+    _lock: threading.Lock
+    _histograms: Dict[str, _Histogram]
+    _counters: Dict[Tuple[str, _Labels], float]
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._counters = {}
+
+    def observe(self, function: str, seconds: float) -> None:
+        """
+        Records a call to `function` that took `seconds`
+        """
+        bucket = bisect_left(BUCKETS, seconds)
+
+        # this is called for every timed call, so it's kept inline
+        with self._lock:
+            histogram = self._histograms.get(function)
+
+            if histogram is None:
+                histogram = self._histograms[function] = _Histogram()
+
+            histogram.counts[bucket] += 1
+            histogram.total += seconds
+
+            if seconds > histogram.max:
+                histogram.max = seconds
+
+    def increment(self, counter: str, value: float = 1, **labels: str) -> None:
+        key = (counter, tuple(sorted(labels.items())))
+
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def snapshot(self) -> Metrics:
+        with self._lock:
+            return Metrics(
+                timings={
+                    function: histogram.timing()
+                    for function, histogram in sorted(self._histograms.items())
+                },
+                counters={
+                    _counter_key(counter, labels): value
+                    for (counter, labels), value in sorted(self._counters.items())
+                },
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+
+# metrics for every `Census` in the process
+METRICS = MetricsRegistry()
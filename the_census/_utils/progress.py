@@ -0,0 +1,26 @@
+import sys
+from typing import Any, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+def progress(items: Iterable[T], **kwargs: Any) -> Iterable[T]:
+    """
+    Wraps `items` in a tqdm progress bar: a widget in Jupyter,
+    and a text bar otherwise. tqdm (and, in Jupyter, ipywidgets)
+    is only imported once there's something to show progress for
+
+    Args:
+        items (Iterable[T])
+        kwargs: passed on to tqdm (e.g., `total`)
+
+    Returns:
+        Iterable[T]: the same items
+    """
+
+    if "ipykernel" in sys.modules:
+        from tqdm.notebook import tqdm
+    else:
+        from tqdm import tqdm
+
+    return tqdm(items, **kwargs)  # type: ignore
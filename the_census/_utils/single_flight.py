@@ -0,0 +1,65 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, TypeVar
+
+_T = TypeVar("_T")
+
+
+class _Call:
+    thread: int
+    result: "Future[Any]"
+
+    def __init__(self) -> None:
+        self.thread = threading.get_ident()
+        self.result = Future()
+
+
+class SingleFlight:
+    """
+    Makes at most one call per key at a time. Callers asking for
+    a key that's already being computed (on another thread) wait
+    for that call, and share its result, or its exception,
+    instead of making the same call again.
+    """
+
+    _lock: threading.Lock
+    _calls: Dict[Hashable, _Call]
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key: Hashable, fn: Callable[[], _T]) -> _T:
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not is_leader:
+            if call.thread == threading.get_ident():
+                # the same key, asked for while it's being computed,
+                # on the same thread, would otherwise wait on itself
+                return fn()
+
+            return call.result.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.result.set_exception(e)
+            raise
+        else:
+            call.result.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def in_flight(self) -> int:
+        """
+        How many calls are being made right now
+        """
+        with self._lock:
+            return len(self._calls)
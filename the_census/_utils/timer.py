@@ -2,22 +2,45 @@ import logging
 import time
 from typing import Any, Callable, Dict, TypeVar, cast
 
+from the_census._utils.metrics import METRICS
+from the_census._utils.tracing import TRACER, span
+
 _Func = TypeVar("_Func", bound=Callable[..., Any])
 
+_logger = logging.getLogger(__name__)
+
 
 def timer(func: _Func) -> _Func:
+    """
+    Records how long each call to `func` takes in `METRICS`,
+    and logs it (at the `DEBUG` level). While tracing, each
+    call is a span, too
+    """
+
+    name = func.__qualname__
+
     def wrapper(*args: Any, **kwargs: Dict[Any, Any]) -> Any:
+        if TRACER.enabled:
+            with span(name):
+                return timed(*args, **kwargs)
+
+        return timed(*args, **kwargs)
+
+    def timed(*args: Any, **kwargs: Dict[Any, Any]) -> Any:
         start_time = time.perf_counter()
 
         retval = func(*args, **kwargs)
 
         end_time = time.perf_counter()
 
-        elapsed_ms = (end_time - start_time) * 1000
+        METRICS.observe(name, end_time - start_time)
+
+        # timed functions are called a lot, so their
+        # messages are only formatted if they'd be logged
+        if _logger.isEnabledFor(logging.DEBUG):
+            elapsed_ms = (end_time - start_time) * 1000
 
-        logging.getLogger(__name__).debug(
-            f"[{func.__qualname__}] - duration: {elapsed_ms:.2f}ms"
-        )
+            _logger.debug(f"[{name}] - duration: {elapsed_ms:.2f}ms")
 
         return retval
 
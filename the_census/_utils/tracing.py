@@ -0,0 +1,279 @@
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Type, TypeVar, Union
+
+_T = TypeVar("_T")
+
+# the span that spans started now are nested in. Threads started
+# by a traced call only see it if they're given the caller's
+# context (see `traced`); asyncio tasks get it on their own
+_current_span: "contextvars.ContextVar[Optional[Span]]" = contextvars.ContextVar(
+    "the_census_current_span", default=None
+)
+
+
+@dataclass
+class Span:
+    """
+    One traced step of a call (e.g., fetching one chunk
+    of a query), and what it was nested in
+    """
+
+    id: int
+    parent_id: Optional[int]
+    name: str
+    thread_id: int
+    start_ns: int
+    end_ns: int = 0
+    # e.g., how many rows a step returned
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+
+class _NoSpan:
+    """
+    Stands in for a span while nothing's being traced
+    """
+
+    def __enter__(self) -> "_NoSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+class _SpanContext:
+    _tracer: "Tracer"
+    _name: str
+    _attributes: Dict[str, Any]
+    _span: Span
+    _token: "Optional[contextvars.Token[Optional[Span]]]"
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any]):
+        self._tracer = tracer
+        self._name = name
+        self._attributes = attributes
+        self._token = None
+
+    def __enter__(self) -> Span:
+        parent = _current_span.get()
+
+        self._span = Span(
+            id=self._tracer._next_id(),
+            parent_id=parent.id if parent is not None else None,
+            name=self._name,
+            thread_id=threading.get_ident(),
+            start_ns=time.perf_counter_ns(),
+            attributes=self._attributes,
+        )
+        self._token = _current_span.set(self._span)
+
+        return self._span
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._span.end_ns = time.perf_counter_ns()
+
+        if exc_type is not None:
+            self._span.attributes["error"] = exc_type.__name__
+
+        if self._token is not None:
+            _current_span.reset(self._token)
+
+        self._tracer._record(self._span)
+
+
+@dataclass
+class Trace:
+    """
+    The spans recorded while tracing, in the order they finished
+    """
+
+    spans: List[Span] = field(default_factory=list)
+    # by thread ID
+    thread_names: Dict[int, str] = field(default_factory=dict)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Renders the trace in the Trace Event Format, which Chrome's
+        `about:tracing`, Perfetto and speedscope show as flame charts
+
+        Returns:
+            Dict[str, Any]
+        """
+        pid = os.getpid()
+        origin_ns = min((span.start_ns for span in self.spans), default=0)
+
+        events: List[Dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": thread_id,
+                "args": {"name": name},
+            }
+            for thread_id, name in self.thread_names.items()
+        ]
+        events += [
+            {
+                "name": span.name,
+                "cat": "the_census",
+                "ph": "X",
+                "ts": (span.start_ns - origin_ns) / 1000,
+                "dur": (span.end_ns - span.start_ns) / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": {
+                    "id": span.id,
+                    "parent_id": span.parent_id,
+                    **{key: _jsonable(value) for key, value in span.attributes.items()},
+                },
+            }
+            for span in sorted(self.spans, key=lambda span: span.start_ns)
+        ]
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """
+        Writes the trace to `path`, as JSON in the Trace Event Format
+        """
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+def _jsonable(value: Any) -> Any:
+    return (
+        value if isinstance(value, (str, int, float, bool, type(None))) else str(value)
+    )
+
+
+class Tracer:
+    """
+    Records nested spans for every `Census` in the process, but
+    only while it's enabled; otherwise, `span` does next to nothing
+    """
+
+    enabled: bool
+    _lock: threading.Lock
+    _trace: Optional[Trace]
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._trace = None
+        self._ids = itertools.count(1)
+
+    def start(self) -> None:
+        with self._lock:
+            if self._trace is not None:
+                raise RuntimeError("Already tracing")
+
+            self._trace = Trace()
+            self.enabled = True
+
+    def stop(self) -> Trace:
+        with self._lock:
+            trace = self._trace if self._trace is not None else Trace()
+
+            self._trace = None
+            self.enabled = False
+
+        return trace
+
+    def _next_id(self) -> int:
+        return next(self._ids)
+
+    def _record(self, span: Span) -> None:
+        with self._lock:
+            # spans that finish after tracing stopped are dropped
+            if self._trace is None:
+                return
+
+            self._trace.spans.append(span)
+
+            if span.thread_id not in self._trace.thread_names:
+                self._trace.thread_names[
+                    span.thread_id
+                ] = threading.current_thread().name
+
+
+# traces calls for every `Census` in the process
+TRACER = Tracer()
+
+
+def span(name: str, **attributes: Any) -> Union[_SpanContext, _NoSpan]:
+    """
+    Traces the step in a `with` block as `name`, nested in the span
+    it was started in. Attributes can be added (e.g., once a step
+    knows how many rows it returned) with `.set()` on what the block
+    is given.
+
+    While nothing's being traced, this returns a span that does
+    nothing, so it's cheap enough to leave in.
+    """
+    if not TRACER.enabled:
+        return _NO_SPAN
+
+    return _SpanContext(TRACER, name, attributes)
+
+
+def traced(fn: Callable[..., _T]) -> Callable[..., _T]:
+    """
+    Makes `fn` run in (a copy of) the caller's context, so that spans
+    it starts on another thread (e.g., a thread pool's) are nested in
+    the caller's span
+    """
+    if not TRACER.enabled:
+        return fn
+
+    context = contextvars.copy_context()
+
+    def run(*args: Any, **kwargs: Any) -> _T:
+        # a context can only be entered by one thread at a time
+        return context.copy().run(fn, *args, **kwargs)
+
+    return run
+
+
+@contextmanager
+def tracing(path: Optional[Union[str, "os.PathLike[str]"]] = None) -> Iterator[Trace]:
+    """
+    Traces the calls made in a `with` block, and (with `path`)
+    writes the trace there once the block is done
+    """
+    trace = Trace()
+    TRACER.start()
+
+    try:
+        yield trace
+    finally:
+        recorded = TRACER.stop()
+        trace.spans = recorded.spans
+        trace.thread_names = recorded.thread_names
+
+        if path is not None:
+            trace.write(path)
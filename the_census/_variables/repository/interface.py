@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Generic, List, TypeVar
 
-from the_census._variables.models import GroupCode
+from the_census._variables.models import GroupCode, GroupVariable, VariableCode
 from the_census._variables.repository.models import GroupSet, VariableSet
 
 T = TypeVar("T")
@@ -30,6 +30,59 @@ class IVariableRepository(ABC, Generic[T]):
     def get_all_variables(self) -> T:
         ...
 
+    @abstractmethod
+    def get_cached_group_variables(self, group: GroupCode) -> T:
+        """
+        Gets a group's variables from the cache
+
+        Args:
+            group (GroupCode)
+
+        Returns:
+            T: the variables, or an empty result if they aren't cached
+        """
+        ...
+
+    @abstractmethod
+    def store_group_variables(
+        self, group: GroupCode, variables: List[GroupVariable]
+    ) -> T:
+        """
+        Transforms & caches variables that were fetched for `group`
+
+        Args:
+            group (GroupCode)
+            variables (List[GroupVariable]): from the API
+
+        Returns:
+            T: the transformed variables
+        """
+        ...
+
+    @abstractmethod
+    def register_variables(self, *variables: T) -> T:
+        """
+        Adds variables (from `get_cached_group_variables` or
+        `store_group_variables`) to the repository, so that
+        they can be used in stats queries
+
+        Returns:
+            T: all of `variables`, combined
+        """
+        ...
+
+    @abstractmethod
+    def find_variables(self, *codes: VariableCode) -> List[GroupVariable]:
+        """
+        Finds the variables with `codes`, loading only
+        those variables from the cache, rather than
+        every cached variable
+
+        Returns:
+            List[GroupVariable]: the variables that were found
+        """
+        ...
+
     @property
     def variables(self) -> VariableSet:
         return self._variables
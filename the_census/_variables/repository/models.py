@@ -1,14 +1,25 @@
+import threading
 from abc import ABC, abstractmethod
-from typing import Generic, ItemsView, KeysView, TypeVar, ValuesView
+from collections import Counter
+from typing import Dict, Generic, ItemsView, KeysView, List, Set, TypeVar, ValuesView
 
-from the_census._variables.models import Group, GroupCode, GroupVariable
+from the_census._variables.models import Group, GroupCode, GroupVariable, VariableCode
 
 ValueType = TypeVar("ValueType")
 ItemType = TypeVar("ItemType")
 
 
 class ICodeSet(ABC, Generic[ItemType, ValueType]):
+    # entries live in `__dict__`, for attribute-style access (and
+    # tab-completion); the index used to look them up by code (and
+    # the lock that guards adding to them) are kept in slots, so
+    # that they don't show up as entries
+    __slots__ = ("__dict__", "_index", "_lock")
+
+    _lock: threading.Lock
+
     def __init__(self, *items: ItemType) -> None:
+        self._lock = threading.Lock()
         self.add(*items)
 
     @abstractmethod
@@ -53,29 +64,57 @@ class ICodeSet(ABC, Generic[ItemType, ValueType]):
 
 
 class VariableSet(ICodeSet[GroupVariable, GroupVariable]):
+    _index: Dict[VariableCode, List[GroupVariable]]
+
+    def __init__(self, *items: GroupVariable) -> None:
+        self._index = {}
+        super().__init__(*items)
+
     def add(self, *items: GroupVariable):
-        filteredItems = [item for item in items if item not in self.values()]
+        with self._lock:
+            for item in items:
+                same_code = self._index.setdefault(item.code, [])
 
-        entries = {
-            f"{item.cleaned_name}_{item.group_code}": item for item in filteredItems
-        }
+                if item in same_code:
+                    continue
 
-        self.__dict__.update(entries)
+                name = f"{item.cleaned_name}_{item.group_code}"
 
+                replaced = self.__dict__.get(name)
+                if replaced is not None:
+                    self._index[replaced.code].remove(replaced)
 
-class GroupSet(ICodeSet[Group, GroupCode]):
-    def add(self, *items: Group):
-        itemNames = [item.cleaned_name for item in items]
+                self.__dict__[name] = item
+                same_code.append(item)
+
+    def with_code(self, code: VariableCode) -> List[GroupVariable]:
+        with self._lock:
+            return list(self._index.get(code, []))
 
-        for item in items:
-            if item.code in self.values():
-                continue
 
-            cleaned_name_freq = len(
-                [1 for name in itemNames if item.cleaned_name == name]
-            )
+class GroupSet(ICodeSet[Group, GroupCode]):
+    _index: Set[GroupCode]
 
-            if cleaned_name_freq > 1 or item.cleaned_name in self.__dict__:
-                self.__dict__.update({f"{item.cleaned_name}_{item.code}": item.code})
-            else:
-                self.__dict__.update({item.cleaned_name: item.code})
+    def __init__(self, *items: Group) -> None:
+        self._index = set()
+        super().__init__(*items)
+
+    def add(self, *items: Group):
+        cleaned_name_freqs = Counter(item.cleaned_name for item in items)
+
+        with self._lock:
+            for item in items:
+                if item.code in self._index:
+                    continue
+
+                if (
+                    cleaned_name_freqs[item.cleaned_name] > 1
+                    or item.cleaned_name in self.__dict__
+                ):
+                    self.__dict__.update(
+                        {f"{item.cleaned_name}_{item.code}": item.code}
+                    )
+                else:
+                    self.__dict__.update({item.cleaned_name: item.code})
+
+                self._index.add(item.code)
@@ -1,43 +1,51 @@
-import os
-from functools import cache
+import threading
 from logging import Logger
-from pathlib import Path
-from typing import Tuple, cast
+from typing import Dict, List, Tuple, cast
 
 import pandas as pd
-from tqdm.notebook import tqdm
 
 from the_census._api.interface import ICensusApiFetchService
 from the_census._data_transformation.interface import ICensusDataTransformer
-from the_census._persistence.interface import ICache
+from the_census._persistence.interface import ICache, IMemoCache, IVariableStore
 from the_census._utils.log.factory import ILoggerFactory
+from the_census._utils.memoize import memoize
+from the_census._utils.progress import progress
 from the_census._utils.timer import timer
 from the_census._utils.unique import get_unique
-from the_census._variables.models import Group, GroupCode, GroupVariable
+from the_census._variables.models import Group, GroupCode, GroupVariable, VariableCode
 from the_census._variables.repository.interface import IVariableRepository
 from the_census._variables.repository.models import GroupSet, VariableSet
 
 GROUPS_FILE = "groups.csv"
 SUPPORTED_GEOS_FILE = "supported_geographies.csv"
 
-VARIABLES_DIR = "variables"
-
 
 class VariableRepository(IVariableRepository[pd.DataFrame]):
 
     _cache: ICache[pd.DataFrame]
+    _store: IVariableStore[pd.DataFrame]
+    _memo: IMemoCache
     _api: ICensusApiFetchService
     _transformer: ICensusDataTransformer[pd.DataFrame]
     _logger: Logger
 
+    # what's been loaded from the on-disk cache so far
+    _has_loaded_groups: bool
+    _has_loaded_variables: bool
+    _load_lock: threading.Lock
+
     def __init__(
         self,
         cache: ICache[pd.DataFrame],
+        store: IVariableStore[pd.DataFrame],
+        memo: IMemoCache,
         transformer: ICensusDataTransformer[pd.DataFrame],
         api: ICensusApiFetchService,
         logger_factory: ILoggerFactory,
     ):
         self._cache = cache
+        self._store = store
+        self._memo = memo
         self._api = api
         self._transformer = transformer
         self._logger = logger_factory.getLogger(__name__)
@@ -46,13 +54,46 @@ class VariableRepository(IVariableRepository[pd.DataFrame]):
         self._variables = VariableSet()
         self._groups = GroupSet()
 
-        self.__populate_repository()
+        # the on-disk cache is only read once something needs
+        # it, and then only as much of it as is needed
+        self._has_loaded_groups = False
+        self._has_loaded_variables = False
+        # so that threads don't see the flags set before
+        # what they're flagging has finished loading
+        self._load_lock = threading.Lock()
+
+    @property
+    def variables(self) -> VariableSet:
+        self.__load_cached_variables()
+
+        return self._variables
+
+    @property
+    def groups(self) -> GroupSet:
+        self.__load_cached_groups()
+
+        return self._groups
+
+    def find_variables(self, *codes: VariableCode) -> List[GroupVariable]:
+        unique_codes = get_unique(codes)
+
+        missing = [code for code in unique_codes if not self._variables.with_code(code)]
+
+        if len(missing) > 0 and not self._has_loaded_variables:
+            self._logger.debug(f"loading variables {missing}")
+            self.__add_variables(self._store.get_variables(*missing))
+
+        return [
+            variable
+            for code in unique_codes
+            for variable in self._variables.with_code(code)
+        ]
 
     @timer
     def get_groups(self) -> pd.DataFrame:
         return self.__get_groups()
 
-    @cache
+    @memoize("get_groups")
     def __get_groups(self) -> pd.DataFrame:
         df = self._cache.get(GROUPS_FILE)
         if df is None:
@@ -77,40 +118,45 @@ class VariableRepository(IVariableRepository[pd.DataFrame]):
     def get_variables_by_group(self, *groups: GroupCode) -> pd.DataFrame:
         return self.__get_variables_by_group(tuple(get_unique(groups)))
 
-    @cache
+    @memoize("get_variables_by_group")
     def __get_variables_by_group(self, groups: Tuple[GroupCode, ...]) -> pd.DataFrame:
-        all_vars = pd.DataFrame()
+        all_vars: Dict[GroupCode, pd.DataFrame] = {
+            group: self.get_cached_group_variables(group) for group in groups
+        }
 
-        for group in tqdm(groups):  # type: ignore
-            resource = f"{VARIABLES_DIR}/{group}.csv"
+        misses = [group for group in groups if all_vars[group].empty]
 
-            df = self._cache.get(resource)
-            if df is None:
-                df = pd.DataFrame()
+        # misses are fetched concurrently, but are stored as they come in
+        for group, res in progress(
+            zip(misses, self._api.variables_for_groups(list(misses))),
+            total=len(misses),
+        ):
+            if len(res) > 0:
+                all_vars[group] = self.store_group_variables(group, res)
 
-            if not df.empty:
-                if all_vars.empty:
-                    all_vars = df
-                else:
-                    all_vars = all_vars.append(df, ignore_index=True)  # type: ignore
-            else:
-                res = self._api.variables_for_group(cast(GroupCode, group))
+        # all of the groups' variables are combined at once
+        return self.register_variables(*[all_vars[group] for group in groups])
 
-                if len(res) == 0:
-                    continue
+    def get_cached_group_variables(self, group: GroupCode) -> pd.DataFrame:
+        return self._store.get_group(group)
 
-                df = self._transformer.variables(res)
+    def store_group_variables(
+        self, group: GroupCode, variables: List[GroupVariable]
+    ) -> pd.DataFrame:
+        df = self._transformer.variables(variables)
 
-                self._cache.put(resource, df)
+        self._store.put_group(group, df)
 
-                if all_vars.empty:
-                    all_vars = df
-                else:
-                    all_vars = all_vars.append(df, ignore_index=True)
+        return df
 
-        if all_vars.empty:
+    def register_variables(self, *variables: pd.DataFrame) -> pd.DataFrame:
+        non_empty = [df for df in variables if not df.empty]
+
+        if len(non_empty) == 0:
             return pd.DataFrame()
 
+        all_vars = pd.concat(non_empty, ignore_index=True)
+
         for record in all_vars.to_dict("records"):
             var = GroupVariable.from_df_record(record)
             self._variables.add(var)
@@ -121,8 +167,16 @@ class VariableRepository(IVariableRepository[pd.DataFrame]):
     def get_all_variables(self) -> pd.DataFrame:
         return self.__get_all_variables()
 
-    @cache
+    @memoize("get_all_variables")
     def __get_all_variables(self) -> pd.DataFrame:
+        if self._store.is_complete():
+            self._logger.debug("loading all variables from the store")
+
+            df = self._store.get_all()
+            self.__add_variables(df)
+
+            return df.drop(columns=["cleaned_name"])  # type: ignore
+
         self._logger.info("This is a costly operation, and may take time")
 
         all_variables = self._api.all_variables()
@@ -135,7 +189,7 @@ class VariableRepository(IVariableRepository[pd.DataFrame]):
         for GroupCode, variables in df.groupby(["group_code"]):  # type: ignore
             varDf = cast(pd.DataFrame, variables)
 
-            if not self._cache.put(f"{VARIABLES_DIR}/{GroupCode}.csv", varDf):
+            if not self._store.put_group(GroupCode, varDf):
                 # we don't need to update `self._variables` in this case
                 continue
 
@@ -145,34 +199,47 @@ class VariableRepository(IVariableRepository[pd.DataFrame]):
             ]
             self._variables.add(*variables)
 
+        # so that later sessions needn't fetch them again
+        self._store.set_complete()
+
         return df.drop(columns=["cleaned_name"])  # type: ignore
 
-    def __populate_repository(self) -> None:
-        self._logger.debug("populating repository")
+    def __load_cached_groups(self) -> None:
+        if self._has_loaded_groups:
+            return
 
-        groups_df = self._cache.get(GROUPS_FILE)
+        with self._load_lock:
+            if self._has_loaded_groups:
+                return
 
-        if groups_df is not None:
-            groups = [
-                Group.from_df_record(record) for record in groups_df.to_dict("records")
-            ]
-            self._logger.debug(f"adding groups {[group.code for group in groups]}")
-            self._groups.add(*groups)
+            groups_df = self._cache.get(GROUPS_FILE)
+
+            if groups_df is not None:
+                groups = [
+                    Group.from_df_record(record)
+                    for record in groups_df.to_dict("records")
+                ]
+                self._logger.debug(f"adding groups {[group.code for group in groups]}")
+                self._groups.add(*groups)
 
-        variables_path = f"{self._cache.cache_path}/{VARIABLES_DIR}"
+            self._has_loaded_groups = True
 
-        if not Path(variables_path).exists():
-            self._logger.debug("no variables")
+    def __load_cached_variables(self) -> None:
+        if self._has_loaded_variables:
             return
 
-        for file in os.listdir(variables_path):
-            cache_res = self._cache.get(f"{VARIABLES_DIR}/{file}")
-            variable_df = cache_res if cache_res is not None else pd.DataFrame()
+        with self._load_lock:
+            if self._has_loaded_variables:
+                return
 
-            self._logger.debug(f"adding variables from {file}")
+            self._logger.debug("loading all cached variables")
 
-            variables = [
-                GroupVariable.from_df_record(record)
-                for record in variable_df.to_dict("records")
-            ]
-            self._variables.add(*variables)
+            self.__add_variables(self._store.get_all())
+
+            self._has_loaded_variables = True
+
+    def __add_variables(self, df: pd.DataFrame) -> None:
+        variables = [
+            GroupVariable.from_df_record(record) for record in df.to_dict("records")
+        ]
+        self._variables.add(*variables)
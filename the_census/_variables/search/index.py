@@ -0,0 +1,509 @@
+import bisect
+import io
+import json
+import math
+import re
+import zipfile
+from typing import Collection, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from the_census._variables.models import GroupCode
+
+# how much a word counts towards a variable's (or group's)
+# score, depending on which of its columns the word is in
+VARIABLE_FIELDS: Dict[str, float] = dict(
+    code=10.0,
+    group_code=5.0,
+    group_concept=2.0,
+    name=1.0,
+)
+GROUP_FIELDS: Dict[str, float] = dict(code=10.0, description=1.0)
+
+# how alike (by their trigrams) a word has to be to a
+# term for it to match the term, in a fuzzy search
+MIN_SIMILARITY = 0.5
+# terms shorter than this (and numbers) have to match exactly,
+# since a single letter or digit makes too much of a difference
+MIN_FUZZY_LENGTH = 4
+
+# bumped whenever what `SearchIndex.to_bytes` saves changes, so
+# that indices saved by older versions are rebuilt, not misread
+INDEX_FORMAT = 1
+
+_WORD = re.compile(r"\w+")
+
+# the variables that have a word (by their positions in the index,
+# in ascending order), and how much the word weighs for each
+_Postings = Tuple[np.ndarray, np.ndarray]
+
+_NO_POSTINGS: _Postings = (np.empty(0, dtype=np.int64), np.empty(0))
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits `text` into lowercase words. Underscores are kept
+    in words, so that codes (e.g., `B01001_001E`) stay whole
+    """
+    return _WORD.findall(text.lower())
+
+
+def trigrams(word: str) -> Set[str]:
+    """
+    The three-letter sequences in `word`, padded so
+    that its start and end count for a bit more
+    """
+    padded = f"  {word} "
+
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """
+    An inverted index of variables (or groups), by the words in
+    their `fields`, e.g., their codes, names and group concepts.
+
+    Variables are indexed a group at a time (their group's code being
+    in `group_column`), and can be added to the index as more groups
+    are loaded.
+
+    For fuzzy searches, the index's words are themselves indexed by
+    their trigrams, so that words like a misspelled term can be found
+    without comparing the term against every word.
+    """
+
+    _fields: Dict[str, float]
+    _group_column: str
+
+    # everything that's been indexed, by its position in the index
+    _variables: pd.DataFrame
+    _codes: List[str]
+    _group_ids: List[int]
+
+    _indexed_groups: Dict[GroupCode, int]
+    # whether everything's been indexed (rather than just some groups)
+    is_complete: bool
+
+    # word -> {variable's position -> the word's weight for it}.
+    # An index loaded with `from_bytes` only has its postings, so
+    # this is worked out from them if anything's added to it
+    _weights: Optional[Dict[str, Dict[int, float]]]
+
+    # built from the above on the first search after anything's added
+    _is_built: bool
+    _postings: Dict[str, _Postings]
+    _words: List[str]
+    _code_ranks: np.ndarray
+    _group_id_array: np.ndarray
+
+    # trigram -> the positions (in `_fuzzy_words`) of words that have it
+    _fuzzy_words: List[str]
+    _trigrams: Dict[str, np.ndarray]
+    _trigram_counts: np.ndarray
+
+    def __init__(
+        self,
+        fields: Dict[str, float] = VARIABLE_FIELDS,
+        group_column: str = "group_code",
+    ) -> None:
+        self._fields = fields
+        self._group_column = group_column
+
+        self._variables = pd.DataFrame()
+        self._codes = []
+        self._group_ids = []
+        self._indexed_groups = {}
+        self.is_complete = False
+        self._weights = {}
+        self._is_built = False
+
+    @property
+    def groups(self) -> Set[GroupCode]:
+        return set(self._indexed_groups)
+
+    def copy(self) -> "SearchIndex":
+        """
+        A copy of the index that can be added to without changing this
+        one, so that this one can still be searched in the meantime
+        """
+        other = SearchIndex(self._fields, self._group_column)
+
+        # frames aren't changed in place, so this one can be shared
+        other._variables = self._variables
+        other._codes = list(self._codes)
+        other._group_ids = list(self._group_ids)
+        other._indexed_groups = dict(self._indexed_groups)
+        other.is_complete = self.is_complete
+        other._weights = {
+            word: dict(weights) for word, weights in self.__weights().items()
+        }
+
+        return other
+
+    def add(self, variables: pd.DataFrame) -> None:
+        """
+        Indexes `variables`, save for those in groups
+        that have already been indexed
+        """
+        if variables.empty:
+            return
+
+        indexed = list(self._indexed_groups)
+        is_new = ~variables[self._group_column].isin(indexed)  # type: ignore
+
+        if not is_new.any():
+            return
+
+        weights_by_word = self.__weights()
+
+        new = (
+            variables[is_new]
+            .drop(columns=["cleaned_name"], errors="ignore")  # type: ignore
+            .reset_index(drop=True)
+        )
+        offset = len(self._codes)
+
+        columns = {
+            field: new[field].astype(str).tolist()
+            for field in {*self._fields, self._group_column, "code"}
+        }
+
+        for i in range(len(new)):
+            position = offset + i
+
+            for field, weight in self._fields.items():
+                # a word counts once per column it's in
+                for word in set(tokenize(columns[field][i])):
+                    weights = weights_by_word.setdefault(word, {})
+                    weights[position] = weights.get(position, 0.0) + weight
+
+        self._codes.extend(columns["code"])
+
+        for group in columns[self._group_column]:
+            group_id = self._indexed_groups.setdefault(
+                GroupCode(group), len(self._indexed_groups)
+            )
+            self._group_ids.append(group_id)
+        self._variables = pd.concat([self._variables, new], ignore_index=True)
+
+        self._is_built = False
+
+    def search(
+        self,
+        terms: List[str],
+        groups: Collection[GroupCode] = (),
+        limit: Optional[int] = None,
+        fuzzy: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Finds the variables that have every one of `terms` (a term
+        ending in `*` matches any word that starts with it), best
+        first, with a `score` column (higher is better).
+
+        Rarer words count for more than common ones, as do words in
+        a variable's code than in its name or group's concept.
+
+        If `fuzzy`, terms also match words that are like them (by
+        their trigrams), with less alike words scoring less.
+        """
+        self.build()
+
+        postings = [
+            (
+                self.__fuzzy_postings_for(term)
+                if fuzzy and self.__can_be_fuzzy(term)
+                else self.__postings_for(term)
+            )
+            for term in terms
+        ]
+
+        if len(postings) == 0 or any(len(p[0]) == 0 for p in postings):
+            return pd.DataFrame()
+
+        # the fewer the matches for a term, the fewer need to be checked
+        postings.sort(key=lambda p: len(p[0]))
+
+        positions, weights = postings[0]
+        scores = weights * self.__idf(postings[0])
+
+        for other in postings[1:]:
+            other_positions, other_weights = other
+
+            found = np.searchsorted(other_positions, positions)
+            found[found == len(other_positions)] = 0
+            matches = other_positions[found] == positions
+
+            positions = positions[matches]
+            scores = scores[matches] + other_weights[found[matches]] * self.__idf(other)
+
+        if len(groups) > 0:
+            group_ids = [
+                self._indexed_groups[group]
+                for group in groups
+                if group in self._indexed_groups
+            ]
+            in_groups = np.isin(self._group_id_array[positions], group_ids)
+            positions, scores = positions[in_groups], scores[in_groups]
+
+        if len(positions) == 0:
+            return pd.DataFrame()
+
+        if limit is not None and limit < len(scores):
+            # only what could make the cut needs sorting
+            cutoff = -np.partition(-scores, limit - 1)[limit - 1]
+            could_make_cut = scores >= cutoff
+            positions, scores = positions[could_make_cut], scores[could_make_cut]
+
+        # best first, then by code
+        ranked = np.lexsort((self._code_ranks[positions], -scores))[:limit]
+
+        return (
+            self._variables.iloc[positions[ranked]]
+            .assign(score=scores[ranked])
+            .reset_index(drop=True)
+        )
+
+    def __idf(self, postings: _Postings) -> float:
+        return math.log(1 + len(self._codes) / len(postings[0]))
+
+    def __postings_for(self, term: str) -> _Postings:
+        if not term.endswith("*"):
+            return self._postings.get(term.lower(), _NO_POSTINGS)
+
+        prefix = term.rstrip("*").lower()
+
+        start = end = bisect.bisect_left(self._words, prefix)
+        while end < len(self._words) and self._words[end].startswith(prefix):
+            end += 1
+
+        with_prefix = [self._postings[word] for word in self._words[start:end]]
+
+        # a variable scores by the best of its words with the prefix
+        return self.__merge(with_prefix)
+
+    def __can_be_fuzzy(self, term: str) -> bool:
+        return len(term) >= MIN_FUZZY_LENGTH and term.isalpha()
+
+    def __fuzzy_postings_for(self, term: str) -> _Postings:
+        term_trigrams = trigrams(term.lower())
+        with_trigrams = [
+            self._trigrams[t] for t in term_trigrams if t in self._trigrams
+        ]
+
+        if len(with_trigrams) == 0:
+            return _NO_POSTINGS
+
+        shared = np.bincount(
+            np.concatenate(with_trigrams), minlength=len(self._fuzzy_words)
+        )
+        # the Dice coefficient of the term's & each word's trigrams
+        similarities = 2 * shared / (len(term_trigrams) + self._trigram_counts)
+
+        alike: List[_Postings] = []
+        for i in np.flatnonzero(similarities >= MIN_SIMILARITY):
+            positions, weights = self._postings[self._fuzzy_words[i]]
+            alike.append((positions, weights * similarities[i]))
+
+        # a variable scores by the most alike of its words, weighted by how alike
+        return self.__merge(alike)
+
+    def __merge(self, postings: List[_Postings]) -> _Postings:
+        """
+        Merges `postings` into one, taking the greatest
+        weight each variable has across them
+        """
+        if len(postings) == 0:
+            return _NO_POSTINGS
+        if len(postings) == 1:
+            return postings[0]
+
+        positions, inverse = np.unique(
+            np.concatenate([p[0] for p in postings]), return_inverse=True
+        )
+        weights = np.zeros(len(positions))
+        np.maximum.at(weights, inverse, np.concatenate([p[1] for p in postings]))
+
+        return positions, weights
+
+    def __weights(self) -> Dict[str, Dict[int, float]]:
+        if self._weights is None:
+            self._weights = {
+                word: dict(zip(positions.tolist(), weights.tolist()))
+                for word, (positions, weights) in self._postings.items()
+            }
+
+        return self._weights
+
+    def build(self) -> None:
+        """
+        Builds what searches need from what's been added. Searches do
+        this themselves, but it can take a while for a big index, so
+        it can be done ahead of time (e.g., before swapping it in)
+        """
+        if self._is_built:
+            return
+
+        # positions are added in ascending order, so postings are sorted
+        self._postings = {
+            word: (
+                np.fromiter(weights.keys(), dtype=np.int64, count=len(weights)),
+                np.fromiter(weights.values(), dtype=float, count=len(weights)),
+            )
+            for word, weights in self.__weights().items()
+        }
+        self._words = sorted(self._postings)
+        self._code_ranks = np.argsort(np.argsort(np.array(self._codes)))
+        self._group_id_array = np.array(self._group_ids, dtype=np.int64)
+
+        self.__build_trigrams()
+
+        self._is_built = True
+
+    def __build_trigrams(self) -> None:
+        self._fuzzy_words = [word for word in self._words if self.__can_be_fuzzy(word)]
+        word_ids: Dict[str, List[int]] = {}
+        for i, word in enumerate(self._fuzzy_words):
+            for trigram in trigrams(word):
+                word_ids.setdefault(trigram, []).append(i)
+
+        self._trigrams = {
+            trigram: np.array(ids, dtype=np.int64) for trigram, ids in word_ids.items()
+        }
+        self._trigram_counts = np.array(
+            [len(trigrams(word)) for word in self._fuzzy_words], dtype=np.int64
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Saves the built index (its postings, the weights of its fields
+        and its trigrams), but not what it indexed, which `from_bytes`
+        is given back
+        """
+        self.build()
+
+        posting_lengths = [len(self._postings[word][0]) for word in self._words]
+        trigram_keys = sorted(self._trigrams)
+
+        meta = dict(
+            format=INDEX_FORMAT,
+            fields=self._fields,
+            group_column=self._group_column,
+            groups=list(self._indexed_groups),
+            is_complete=self.is_complete,
+            columns=self._variables.columns.tolist(),
+        )
+
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            meta=np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8),
+            codes=np.array(self._codes, dtype=str),
+            group_ids=np.array(self._group_ids, dtype=np.int64),
+            words=np.array(self._words, dtype=str),
+            posting_offsets=np.cumsum([0] + posting_lengths, dtype=np.int64),
+            positions=self.__concat([self._postings[w][0] for w in self._words]),
+            weights=self.__concat([self._postings[w][1] for w in self._words]),
+            trigrams=np.array(trigram_keys, dtype=str),
+            trigram_offsets=np.cumsum(
+                [0] + [len(self._trigrams[t]) for t in trigram_keys], dtype=np.int64
+            ),
+            trigram_words=self.__concat([self._trigrams[t] for t in trigram_keys]),
+        )
+
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        variables: pd.DataFrame,
+        fields: Dict[str, float] = VARIABLE_FIELDS,
+        group_column: str = "group_code",
+    ) -> Optional["SearchIndex"]:
+        """
+        Loads an index saved with `to_bytes`, over `variables` (which
+        need to have every variable that was indexed, in any order).
+
+        Returns:
+            Optional[SearchIndex]: `None` if the index was saved in an
+            older format, with other fields or weights, or over
+            variables that aren't in `variables`
+        """
+        try:
+            with np.load(io.BytesIO(data), allow_pickle=False) as saved:
+                arrays = {name: saved[name] for name in saved.files}
+
+            meta = json.loads(arrays["meta"].tobytes())
+        except (OSError, EOFError, ValueError, KeyError, zipfile.BadZipFile):
+            return None
+
+        if (
+            meta.get("format") != INDEX_FORMAT
+            or meta.get("fields") != fields
+            or meta.get("group_column") != group_column
+        ):
+            return None
+
+        codes: List[str] = arrays["codes"].tolist()
+        index = cls(fields, group_column)
+
+        if len(codes) > 0:
+            if variables.empty:
+                return None
+
+            by_code = variables.set_index("code", drop=False)  # type: ignore
+            by_code = by_code[~by_code.index.duplicated()]
+            columns: List[str] = meta["columns"]
+
+            if not set(codes).issubset(by_code.index):
+                return None
+            if not set(columns).issubset(by_code.columns):
+                return None
+
+            # as they were when they were indexed
+            index._variables = by_code.loc[codes, columns].reset_index(drop=True)
+
+        index._codes = codes
+        index._group_ids = arrays["group_ids"].tolist()
+        index._indexed_groups = {
+            GroupCode(group): i for i, group in enumerate(meta["groups"])
+        }
+        index.is_complete = bool(meta["is_complete"])
+        index._weights = None
+
+        offsets = arrays["posting_offsets"]
+        positions, weights = arrays["positions"], arrays["weights"]
+        index._words = arrays["words"].tolist()
+        index._postings = {
+            word: (positions[start:end], weights[start:end])
+            for word, start, end in zip(
+                index._words, offsets[:-1].tolist(), offsets[1:].tolist()
+            )
+        }
+        index._code_ranks = np.argsort(np.argsort(np.array(codes)))
+        index._group_id_array = np.array(index._group_ids, dtype=np.int64)
+
+        index._fuzzy_words = [
+            word for word in index._words if index.__can_be_fuzzy(word)
+        ]
+        trigram_offsets, trigram_words = (
+            arrays["trigram_offsets"].tolist(),
+            arrays["trigram_words"],
+        )
+        index._trigrams = {
+            trigram: trigram_words[start:end]
+            for trigram, start, end in zip(
+                arrays["trigrams"].tolist(), trigram_offsets[:-1], trigram_offsets[1:]
+            )
+        }
+        index._trigram_counts = np.array(
+            [len(trigrams(word)) for word in index._fuzzy_words], dtype=np.int64
+        )
+
+        index._is_built = True
+
+        return index
+
+    def __concat(self, arrays: List[np.ndarray]) -> np.ndarray:
+        return np.concatenate(arrays) if len(arrays) else np.empty(0)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Generic, Optional, TypeVar
 
 from the_census._variables.models import GroupCode
 
@@ -22,3 +22,32 @@ class IVariableSearchService(ABC, Generic[_T]):
         *in_groups: GroupCode,
     ) -> _T:
         ...
+
+    @abstractmethod
+    def search(
+        self,
+        query: str,
+        *in_groups: GroupCode,
+        limit: Optional[int] = None,
+        fuzzy: bool = False,
+    ) -> _T:
+        """
+        Ranked search over variables' codes, names and group concepts,
+        by the words in `query` (or, if `query` isn't just words, by
+        regex, as `search_variables` does)
+        """
+        ...
+
+    @abstractmethod
+    def find_groups(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        fuzzy: bool = False,
+    ) -> _T:
+        """
+        Ranked search over groups' codes and descriptions, by the words
+        in `query` (or, if `query` isn't just words, by regex, as
+        `search_groups` does)
+        """
+        ...
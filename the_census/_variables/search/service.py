@@ -1,26 +1,65 @@
+import re
+import threading
 from logging import Logger
+from typing import List, Optional, Tuple
 
 import pandas as pd
 
+from the_census._config import Config
+from the_census._persistence.interface import IVariableStore
 from the_census._utils.log.factory import ILoggerFactory
 from the_census._utils.timer import timer
 from the_census._variables.models import GroupCode
 from the_census._variables.repository.interface import IVariableRepository
+from the_census._variables.search.index import GROUP_FIELDS, SearchIndex
 from the_census._variables.search.interface import IVariableSearchService
 
+# queries made up of anything but words (and `*`s, for prefixes)
+# are taken to be regular expressions
+_INDEXABLE_QUERY = re.compile(r"[\w\s*,]*")
+
+# what the variable index is saved as in the variable store
+VARIABLE_INDEX = "variables"
+
 
 class VariableSearchService(IVariableSearchService[pd.DataFrame]):
+    _config: Config
     _variable_repository: IVariableRepository[pd.DataFrame]
+    _store: IVariableStore[pd.DataFrame]
     _logger: Logger
 
+    # built up as variables & groups are searched. Once an index is
+    # searchable it isn't changed; a bigger one is built to replace it
+    _variable_index: SearchIndex
+    _group_index: SearchIndex
+    _has_indexed_groups: bool
+    _has_loaded_variable_index: bool
+    # held only to swap in a new index, so that searches
+    # never wait on one being fetched or built
+    _index_lock: threading.Lock
+    # held while fetching what a new index needs, and building
+    # it, so that it's only fetched and built once
+    _update_lock: threading.Lock
+
     def __init__(
         self,
+        config: Config,
         variableRepository: IVariableRepository[pd.DataFrame],
+        store: IVariableStore[pd.DataFrame],
         loggerFactory: ILoggerFactory,
     ) -> None:
+        self._config = config
         self._variable_repository = variableRepository
+        self._store = store
         self._logger = loggerFactory.getLogger(__name__)
 
+        self._variable_index = SearchIndex()
+        self._group_index = SearchIndex(GROUP_FIELDS, group_column="code")
+        self._has_indexed_groups = False
+        self._has_loaded_variable_index = False
+        self._index_lock = threading.Lock()
+        self._update_lock = threading.Lock()
+
     @timer
     def search_groups(self, regex: str) -> pd.DataFrame:
         self._logger.debug(f"searching groups for regex: `{regex}`")
@@ -62,3 +101,154 @@ class VariableSearchService(IVariableSearchService[pd.DataFrame]):
         series = variables["name"].str.contains(regex, case=False)  # type: ignore
 
         return variables[series].reset_index(drop=True)  # type: ignore
+
+    @timer
+    def search(
+        self,
+        query: str,
+        *in_groups: GroupCode,
+        limit: Optional[int] = None,
+        fuzzy: bool = False,
+    ) -> pd.DataFrame:
+        self._logger.debug(f"searching variables for `{query}`")
+
+        terms = self.__get_terms(query)
+
+        if terms is None:
+            self._logger.debug("query isn't just words; searching by regex")
+
+            return self.__unranked(self.search_variables(query, *in_groups), limit)
+
+        if len(terms) == 0:
+            return pd.DataFrame()
+
+        return self.__variable_index_for(in_groups).search(
+            terms, in_groups, limit=limit, fuzzy=fuzzy
+        )
+
+    @timer
+    def find_groups(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        fuzzy: bool = False,
+    ) -> pd.DataFrame:
+        self._logger.debug(f"searching groups for `{query}`")
+
+        terms = self.__get_terms(query)
+
+        if terms is None:
+            self._logger.debug("query isn't just words; searching by regex")
+
+            return self.__unranked(self.search_groups(query), limit)
+
+        if len(terms) == 0:
+            return pd.DataFrame()
+
+        return self.__group_index().search(terms, limit=limit, fuzzy=fuzzy)
+
+    def __get_terms(self, query: str) -> Optional[List[str]]:
+        if not _INDEXABLE_QUERY.fullmatch(query):
+            return None
+
+        return re.findall(r"\w+\*?", query)
+
+    def __group_index(self) -> SearchIndex:
+        if self._has_indexed_groups:
+            return self._group_index
+
+        with self._update_lock:
+            if not self._has_indexed_groups:
+                index = SearchIndex(GROUP_FIELDS, group_column="code")
+                index.add(self._variable_repository.get_groups())
+                index.build()
+
+                with self._index_lock:
+                    self._group_index = index
+                    self._has_indexed_groups = True
+
+        return self._group_index
+
+    def __variable_index_for(self, in_groups: Tuple[GroupCode, ...]) -> SearchIndex:
+        """
+        An index with every variable in `in_groups` (or every
+        variable at all, if there aren't any), loading it from the
+        variable store, or fetching what's missing and building a
+        new one, if need be
+        """
+        index = self._variable_index
+
+        if self._has_loaded_variable_index and self.__covers(index, in_groups):
+            return index
+
+        with self._update_lock:
+            if not self._has_loaded_variable_index:
+                self.__load_variable_index()
+
+            index = self._variable_index
+
+            if self.__covers(index, in_groups):
+                return index
+
+            missing = [group for group in in_groups if group not in index.groups]
+            variables = (
+                self._variable_repository.get_variables_by_group(*missing)
+                if len(in_groups) > 0
+                else self._variable_repository.get_all_variables()
+            )
+
+            new_index = index.copy()
+            new_index.add(variables)
+            new_index.is_complete = new_index.is_complete or len(in_groups) == 0
+            new_index.build()
+
+            with self._index_lock:
+                self._variable_index = new_index
+
+            self.__save_variable_index(new_index)
+
+            return new_index
+
+    def __covers(self, index: SearchIndex, in_groups: Tuple[GroupCode, ...]) -> bool:
+        if index.is_complete:
+            return True
+
+        return len(in_groups) > 0 and index.groups.issuperset(in_groups)
+
+    def __load_variable_index(self) -> None:
+        self._has_loaded_variable_index = True
+
+        if not self._config.should_cache_on_disk:
+            return
+
+        data = self._store.get_search_index(VARIABLE_INDEX)
+
+        if data is None:
+            return
+
+        index = SearchIndex.from_bytes(data, self._store.get_all())
+
+        if index is None:
+            self._logger.debug("saved search index is out of date; rebuilding it")
+            return
+
+        self._logger.debug("loaded search index from the store")
+
+        with self._index_lock:
+            self._variable_index = index
+
+    def __save_variable_index(self, index: SearchIndex) -> None:
+        if not self._config.should_cache_on_disk:
+            return
+
+        # the variables just indexed are in the store by now
+        self._store.put_search_index(
+            VARIABLE_INDEX, self._store.version(), index.to_bytes()
+        )
+
+    def __unranked(self, matches: pd.DataFrame, limit: Optional[int]) -> pd.DataFrame:
+        if limit is not None:
+            matches = matches.head(limit)
+
+        # these aren't ranked, so they all score the same
+        return matches.assign(score=0.0)  # type: ignore
@@ -0,0 +1,329 @@
+# pyright: reportUnknownMemberType=false
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, ContextManager, List, Optional, cast
+
+from the_census._api.interface import (
+    IAsyncCensusApiFetchService,
+    ICensusApiFetchService,
+    IHttpTransport,
+)
+from the_census._config import (
+    CACHE_DIR,
+    DEFAULT_CACHE_FORMAT,
+    DEFAULT_HEALTHCHECK_TTL_SECONDS,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_MEMO_MAX_BYTES,
+    DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    DEFAULT_RETRY_BACKOFF_SECONDS,
+    Config,
+)
+from the_census._geographies.models import GeoDomainTypes, SupportedGeoSet
+from the_census._persistence.models import MemoStats
+from the_census._utils.log.configureLogger import DEFAULT_LOG_FILE
+from the_census._utils.metrics import METRICS, Metrics
+from the_census._utils.tracing import Trace, tracing
+from the_census._variables.models import GroupCode, VariableCode
+from the_census._variables.repository.models import GroupSet, VariableSet
+
+if TYPE_CHECKING:
+    import pandas
+    import punq
+
+    from the_census._async_client import AsyncCensusClient
+
+DEFAULT_ASYNC_MAX_CONCURRENT_REQUESTS = 10
+
+
+class AsyncCensus:
+    """
+    Async version of `Census`, for use on an event loop.
+
+    Every query is awaitable. `get_stats` and `get_variables_by_group`
+    send all of their API requests concurrently (at most
+    `max_concurrent_requests` at a time, across all queries made
+    with this object); the other queries run on a worker thread.
+
+    Unlike `Census`, making one doesn't check that its dataset exists
+    (see `defer_healthcheck`); `await census.healthcheck()` does.
+
+    ```python
+    census = AsyncCensus(2019)
+
+    frames = await asyncio.gather(
+        census.get_stats(variables, GeoDomain("county"), GeoDomain("state", "06")),
+        census.get_stats(variables, GeoDomain("county"), GeoDomain("state", "08")),
+    )
+    ```
+    """
+
+    _config: Config
+    _container: punq.Container
+    _client_lock: threading.Lock
+    __client: Optional[AsyncCensusClient]
+
+    def __init__(
+        self,
+        year: int,
+        dataset: str = "acs",
+        survey: str = "acs1",
+        cache_dir: str = CACHE_DIR,
+        should_load_from_existing_cache: bool = False,
+        should_cache_on_disk: bool = False,
+        replace_column_headers: bool = True,
+        log_file: str = DEFAULT_LOG_FILE,
+        max_concurrent_requests: int = DEFAULT_ASYNC_MAX_CONCURRENT_REQUESTS,
+        transport: Optional[IHttpTransport] = None,
+        cache_format: str = DEFAULT_CACHE_FORMAT,
+        copy_results: bool = True,
+        memo_max_bytes: int = DEFAULT_MEMO_MAX_BYTES,
+        memo_ttl_seconds: Optional[float] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff_seconds: float = DEFAULT_RETRY_BACKOFF_SECONDS,
+        max_requests_per_second: Optional[float] = None,
+        defer_healthcheck: bool = True,
+        healthcheck_ttl_seconds: float = DEFAULT_HEALTHCHECK_TTL_SECONDS,
+        request_timeout_seconds: Optional[float] = DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    ) -> None:
+        # see `Census.__init__`
+        from the_census._container import make_config, make_container
+
+        self._config = make_config(
+            year,
+            dataset,
+            survey,
+            cache_dir,
+            should_load_from_existing_cache,
+            should_cache_on_disk,
+            replace_column_headers,
+            max_concurrent_requests,
+            cache_format,
+            copy_results,
+            memo_max_bytes,
+            memo_ttl_seconds,
+            max_retries,
+            retry_backoff_seconds,
+            max_requests_per_second,
+            defer_healthcheck,
+            healthcheck_ttl_seconds,
+            request_timeout_seconds,
+        )
+
+        self._container = make_container(self._config, transport, log_file)
+        self._client_lock = threading.Lock()
+        self.__client = None
+
+        # the healthcheck is deferred by default, since making it here
+        # would block the event loop; `await census.healthcheck()`
+        # makes it without blocking
+        if not self._config.defer_healthcheck:
+            cast(
+                ICensusApiFetchService,
+                self._container.resolve(ICensusApiFetchService),
+            ).healthcheck()
+
+    async def healthcheck(self) -> None:
+        """
+        Checks that this dataset exists (unless it passed the check
+        recently), without blocking the event loop.
+
+        Raises:
+            CensusDoesNotExistException: if it doesn't
+        """
+        await cast(
+            IAsyncCensusApiFetchService,
+            self._container.resolve(IAsyncCensusApiFetchService),
+        ).healthcheck()
+
+    @property
+    def _client(self) -> AsyncCensusClient:
+        if self.__client is None:
+            from the_census._async_client import AsyncCensusClient
+
+            with self._client_lock:
+                if self.__client is None:
+                    self.__client = cast(
+                        AsyncCensusClient, self._container.resolve(AsyncCensusClient)
+                    )
+
+        return self.__client
+
+    # search
+    async def search_groups(self, regex: str) -> pandas.DataFrame:
+        """
+        See `Census.search_groups`
+        """
+        return await self._client.search_groups(regex)
+
+    async def search_variables(
+        self,
+        regex: str,
+        *in_groups: GroupCode,
+    ) -> pandas.DataFrame:
+        """
+        See `Census.search_variables`
+        """
+        return await self._client.search_variables(regex, *in_groups)
+
+    async def search(
+        self,
+        query: str,
+        *in_groups: GroupCode,
+        limit: Optional[int] = None,
+        fuzzy: bool = False,
+    ) -> pandas.DataFrame:
+        """
+        See `Census.search`
+        """
+        return await self._client.search(query, *in_groups, limit=limit, fuzzy=fuzzy)
+
+    async def find_groups(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        fuzzy: bool = False,
+    ) -> pandas.DataFrame:
+        """
+        See `Census.find_groups`
+        """
+        return await self._client.find_groups(query, limit=limit, fuzzy=fuzzy)
+
+    # repo
+    async def get_geography_codes(
+        self, for_domain: GeoDomainTypes, *in_domains: GeoDomainTypes
+    ) -> pandas.DataFrame:
+        """
+        See `Census.get_geography_codes`
+        """
+        return await self._client.get_geography_codes(for_domain, *in_domains)
+
+    async def get_groups(self) -> pandas.DataFrame:
+        """
+        See `Census.get_groups`
+        """
+        return await self._client.get_groups()
+
+    async def get_variables_by_group(self, *groups: GroupCode) -> pandas.DataFrame:
+        """
+        Gets all variables whose group is in `groups`. Groups that
+        aren't cached are all fetched from the API at once.
+
+        Args:
+            groups (List[GroupCode]): codes of all the groups whose variables you want.
+
+        Returns:
+            pandas.DataFrame: with the queried variables.
+        """
+        return await self._client.get_variables_by_group(*groups)
+
+    async def get_all_variables(self) -> pandas.DataFrame:
+        """
+        See `Census.get_all_variables`
+        """
+        return await self._client.get_all_variables()
+
+    async def get_supported_geographies(self) -> pandas.DataFrame:
+        """
+        See `Census.get_supported_geographies`
+        """
+        return await self._client.get_supported_geographies()
+
+    async def get_stats(
+        self,
+        variables_to_query: List[VariableCode],
+        for_domain: GeoDomainTypes,
+        *in_domains: GeoDomainTypes,
+        use_cache: bool = True,
+        refresh_cache: bool = False,
+    ) -> pandas.DataFrame:
+        """
+        Gets statistical data based on `variables_to_query`
+        for the specified geographies. All of the query's
+        API requests are sent at once.
+
+        Args:
+            variables_to_query (List[VariableCode]): the variables to query
+            for_domain (GeoDomain)
+            in_domains (List[GeoDomain], optional): Defaults to [].
+            use_cache (bool, optional): whether to use cached results for
+            this query: the on-disk cache, the in-memory cache of query
+            results, and the variables held from earlier queries for the
+            same geographies. With `False`, every variable is refetched
+            from the API, and the result isn't cached. Defaults to True.
+            refresh_cache (bool, optional): refetch this query from the API,
+            and replace its cached results. Defaults to False.
+
+        Returns:
+            pandas.DataFrame: with the data
+        """
+        return await self._client.get_stats(
+            variables_to_query,
+            for_domain,
+            *in_domains,
+            use_cache=use_cache,
+            refresh_cache=refresh_cache,
+        )
+
+    # in-memory cache
+    def invalidate(self, *queries: str) -> None:
+        """
+        Drops the in-memory cached results of `queries`,
+        so that they'll be recomputed the next time they're made
+
+        Args:
+            queries (str): names of the queries (e.g., "get_stats",
+            "get_variables_by_group")
+        """
+        self._client.invalidate(*queries)
+
+    def clear(self) -> None:
+        """
+        Drops all in-memory cached results
+        """
+        self._client.clear()
+
+    def cache_info(self) -> MemoStats:
+        """
+        Returns:
+            MemoStats: hits, misses and evictions of the in-memory
+            cache, and how big it is
+        """
+        return self._client.cache_info()
+
+    @staticmethod
+    def metrics() -> Metrics:
+        """
+        See `Census.metrics`
+        """
+        return METRICS.snapshot()
+
+    @staticmethod
+    def trace(path: Optional[str] = None) -> ContextManager[Trace]:
+        """
+        See `Census.trace`
+        """
+        return tracing(path)
+
+    #################################################
+    # property variables for Jupyter notebook usage #
+    #################################################
+
+    @property
+    def variables(self) -> VariableSet:
+        return self._client.variables
+
+    @property
+    def groups(self) -> GroupSet:
+        return self._client.groups
+
+    @property
+    def supported_geographies(self) -> SupportedGeoSet:
+        return self._client.supported_geographies
+
+    def __repr__(self) -> str:
+        return f"<AsyncCensus year={self._config.year} dataset={self._config.dataset} survey={self._config.survey}>"
+
+    def __str__(self) -> str:
+        return self.__repr__()
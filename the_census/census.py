@@ -1,48 +1,42 @@
 # pyright: reportUnknownMemberType=false
 
-import os
-from typing import List, cast
-
-import dotenv
-import pandas
-import punq
-
-from the_census._api.fetch import CensusApiFetchService
-from the_census._api.interface import (
-    ICensusApiFetchService,
-    ICensusApiSerializationService,
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, ContextManager, List, Optional, cast
+
+from the_census._api.interface import ICensusApiFetchService, IHttpTransport
+from the_census._config import (
+    CACHE_DIR,
+    DEFAULT_CACHE_FORMAT,
+    DEFAULT_HEALTHCHECK_TTL_SECONDS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_MEMO_MAX_BYTES,
+    DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    DEFAULT_RETRY_BACKOFF_SECONDS,
+    Config,
 )
-from the_census._api.serialization import ApiSerializationService
-from the_census._client import CensusClient
-from the_census._config import CACHE_DIR, Config
-from the_census._data_transformation.interface import ICensusDataTransformer
-from the_census._data_transformation.service import CensusDataTransformer
-from the_census._exceptions import NoCensusApiKeyException
-from the_census._geographies.interface import IGeographyRepository
 from the_census._geographies.models import GeoDomainTypes, SupportedGeoSet
-from the_census._geographies.service import GeographyRepository
-from the_census._helpers import list_available_datasets
-from the_census._persistence.interface import ICache
-from the_census._persistence.onDisk import OnDiskCache
-from the_census._stats.interface import ICensusStatisticsService
-from the_census._stats.service import CensusStatisticsService
-from the_census._utils.log.configureLogger import DEFAULT_LOG_FILE, configureLogger
-from the_census._utils.log.factory import ILoggerFactory, LoggerFactory
+from the_census._persistence.models import MemoStats
+from the_census._utils.log.configureLogger import DEFAULT_LOG_FILE
+from the_census._utils.metrics import METRICS, Metrics
+from the_census._utils.tracing import Trace, tracing
 from the_census._variables.models import GroupCode, VariableCode
-from the_census._variables.repository.interface import IVariableRepository
 from the_census._variables.repository.models import GroupSet, VariableSet
-from the_census._variables.repository.service import VariableRepository
-from the_census._variables.search.interface import IVariableSearchService
-from the_census._variables.search.service import VariableSearchService
 
-# these are singletons
-_serializer = ApiSerializationService()
-_loggerFactory = LoggerFactory()
+if TYPE_CHECKING:
+    import pandas
+    import punq
+
+    from the_census._client import CensusClient
 
 
 class Census:
-    _client: CensusClient
     _config: Config
+    _container: punq.Container
+    _client_lock: threading.Lock
+    __client: Optional[CensusClient]
 
     def __init__(
         self,
@@ -54,17 +48,24 @@ class Census:
         should_cache_on_disk: bool = False,
         replace_column_headers: bool = True,
         log_file: str = DEFAULT_LOG_FILE,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        transport: Optional[IHttpTransport] = None,
+        cache_format: str = DEFAULT_CACHE_FORMAT,
+        copy_results: bool = True,
+        memo_max_bytes: int = DEFAULT_MEMO_MAX_BYTES,
+        memo_ttl_seconds: Optional[float] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff_seconds: float = DEFAULT_RETRY_BACKOFF_SECONDS,
+        max_requests_per_second: Optional[float] = None,
+        defer_healthcheck: bool = False,
+        healthcheck_ttl_seconds: float = DEFAULT_HEALTHCHECK_TTL_SECONDS,
+        request_timeout_seconds: Optional[float] = DEFAULT_REQUEST_TIMEOUT_SECONDS,
     ) -> None:
-        dotenvPath = dotenv.find_dotenv()
-
-        dotenv.load_dotenv(dotenvPath)
+        # imported here, so that importing `the_census` doesn't
+        # mean importing pandas, requests, etc.
+        from the_census._container import make_config, make_container
 
-        api_key = os.getenv("CENSUS_API_KEY")
-
-        if api_key is None:
-            raise NoCensusApiKeyException("Could not find `CENSUS_API_KEY` in .env")
-
-        self._config = Config(
+        self._config = make_config(
             year,
             dataset,
             survey,
@@ -72,40 +73,46 @@ class Census:
             should_load_from_existing_cache,
             should_cache_on_disk,
             replace_column_headers,
-            api_key,
+            max_concurrent_requests,
+            cache_format,
+            copy_results,
+            memo_max_bytes,
+            memo_ttl_seconds,
+            max_retries,
+            retry_backoff_seconds,
+            max_requests_per_second,
+            defer_healthcheck,
+            healthcheck_ttl_seconds,
+            request_timeout_seconds,
         )
 
-        container = punq.Container()
-
-        # singletons
-        container.register(Config, instance=self._config)
-        container.register(ICensusApiSerializationService, instance=_serializer)
-        container.register(ILoggerFactory, instance=_loggerFactory)
-
-        # services
-        container.register(ICache[pandas.DataFrame], OnDiskCache)
-        container.register(
-            ICensusDataTransformer[pandas.DataFrame], CensusDataTransformer
-        )
-        container.register(ICensusApiFetchService, CensusApiFetchService)
-        container.register(IVariableRepository[pandas.DataFrame], VariableRepository)
-        container.register(
-            IVariableSearchService[pandas.DataFrame], VariableSearchService
-        )
-        container.register(IGeographyRepository[pandas.DataFrame], GeographyRepository)
-        container.register(
-            ICensusStatisticsService[pandas.DataFrame], CensusStatisticsService
-        )
+        self._container = make_container(self._config, transport, log_file)
+        self._client_lock = threading.Lock()
+        self.__client = None
 
-        # the client
-        container.register(CensusClient)
+        # if this healthcheck fails, it will throw, and we won't
+        # instantiate the census. If it's deferred, it's made
+        # with the first query instead (and only if that fails)
+        if not self._config.defer_healthcheck:
+            cast(
+                ICensusApiFetchService,
+                self._container.resolve(ICensusApiFetchService),
+            ).healthcheck()
 
-        configureLogger(log_file, datasetName=f"{dataset}.{survey}")
+    @property
+    def _client(self) -> CensusClient:
+        # the client (and the services behind it) are only
+        # made once they're first needed
+        if self.__client is None:
+            from the_census._client import CensusClient
 
-        # for Jupyter
-        pandas.set_option("display.max_colwidth", None)  # type: ignore
+            with self._client_lock:
+                if self.__client is None:
+                    self.__client = cast(
+                        CensusClient, self._container.resolve(CensusClient)
+                    )
 
-        self._client = cast(CensusClient, container.resolve(CensusClient))
+        return self.__client
 
     # search
     def search_groups(self, regex: str) -> pandas.DataFrame:
@@ -120,7 +127,7 @@ class Census:
         Returns:
             pandas.DataFrame: with all of the relevant groups.
         """
-        return self._client.search_groups(regex).copy(deep=True)
+        return self._client.search_groups(regex)
 
     def search_variables(
         self,
@@ -142,7 +149,64 @@ class Census:
         Returns:
             pandas.DataFrame: with all of the matched variables
         """
-        return self._client.search_variables(regex, *in_groups).copy(deep=True)
+        return self._client.search_variables(regex, *in_groups)
+
+    def search(
+        self,
+        query: str,
+        *in_groups: GroupCode,
+        limit: Optional[int] = None,
+        fuzzy: bool = False,
+    ) -> pandas.DataFrame:
+        """
+        - Searches variables' codes, names and group concepts for
+        the words in `query`, using an index that's built up as it's used.
+        - Variables have to match every word. End a word with `*` to match
+        any word that starts with it (e.g., "pover* status").
+        - With `fuzzy`, words also match words that are spelled like them
+        (e.g., "ambulatry" matches "ambulatory"), though they score less.
+        - Results are ranked, best first, with their relevance in a `score` column.
+        - Queries that aren't just words are taken to be regular expressions,
+        and are searched for as `search_variables` would (unranked).
+        - Like `search_variables`, this will pull from the API whatever
+        variables haven't been fetched or cached yet.
+
+        Args:
+            query (str)
+            in_groups (List[GroupCode], optional): if populated, this will search
+            only the variables within the specified groups. Defaults to [].
+            limit (Optional[int], optional): the most results to return.
+            Defaults to None (all of them).
+            fuzzy (bool, optional): whether to match misspelled words.
+            Defaults to False.
+
+        Returns:
+            pandas.DataFrame: with the matched variables, best first
+        """
+        return self._client.search(query, *in_groups, limit=limit, fuzzy=fuzzy)
+
+    def find_groups(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        fuzzy: bool = False,
+    ) -> pandas.DataFrame:
+        """
+        Like `search`, but for groups, by the words in their codes
+        and descriptions (or, if `query` isn't just words, by regex,
+        as `search_groups` does)
+
+        Args:
+            query (str)
+            limit (Optional[int], optional): the most results to return.
+            Defaults to None (all of them).
+            fuzzy (bool, optional): whether to match misspelled words.
+            Defaults to False.
+
+        Returns:
+            pandas.DataFrame: with the matched groups, best first
+        """
+        return self._client.find_groups(query, limit=limit, fuzzy=fuzzy)
 
     # repo
     def get_geography_codes(
@@ -166,7 +230,7 @@ class Census:
         Returns:
             pandas.DataFrame: [description]
         """
-        return self._client.get_geography_codes(for_domain, *in_domains).copy(deep=True)
+        return self._client.get_geography_codes(for_domain, *in_domains)
 
     def get_groups(self) -> pandas.DataFrame:
         """
@@ -175,7 +239,7 @@ class Census:
         Returns:
             pandas.DataFrame: with all of the groups
         """
-        return self._client.get_groups().copy(deep=True)
+        return self._client.get_groups()
 
     def get_variables_by_group(self, *groups: GroupCode) -> pandas.DataFrame:
         """
@@ -187,7 +251,7 @@ class Census:
         Returns:
             pandas.DataFrame: with the queried variables.
         """
-        return self._client.get_variables_by_group(*groups).copy(deep=True)
+        return self._client.get_variables_by_group(*groups)
 
     def get_all_variables(self) -> pandas.DataFrame:
         """
@@ -197,7 +261,7 @@ class Census:
         Returns:
             pandas.DataFrame: with all of the variables.
         """
-        return self._client.get_all_variables().copy(deep=True)
+        return self._client.get_all_variables()
 
     def get_supported_geographies(self) -> pandas.DataFrame:
         """
@@ -207,40 +271,138 @@ class Census:
         Returns:
             pandas.DataFrame
         """
-        return self._client.get_supported_geographies().copy(deep=True)
+        return self._client.get_supported_geographies()
 
     def get_stats(
         self,
         variables_to_query: List[VariableCode],
         for_domain: GeoDomainTypes,
         *in_domains: GeoDomainTypes,
+        use_cache: bool = True,
+        refresh_cache: bool = False,
     ) -> pandas.DataFrame:
         """
         Gets statistical data based on `variables_to_query`
         for the specified geographies.
 
+        If `should_cache_on_disk` is set, results are cached
+        on disk, so repeating a query won't hit the API, even
+        across sessions.
+
         Args:
             variables_to_query (List[VariableCode]): the variables to query
             for_domain (GeoDomain)
             in_domains (List[GeoDomain], optional): Defaults to [].
+            use_cache (bool, optional): whether to use cached results for
+            this query: the on-disk cache, the in-memory cache of query
+            results, and the variables held from earlier queries for the
+            same geographies. With `False`, every variable is refetched
+            from the API, and the result isn't cached. Defaults to True.
+            refresh_cache (bool, optional): refetch this query from the API,
+            and replace its cached results. Defaults to False.
 
         Returns:
             pandas.DataFrame: with the data
         """
-        return self._client.get_stats(variables_to_query, for_domain, *in_domains).copy(
-            deep=True
+        return self._client.get_stats(
+            variables_to_query,
+            for_domain,
+            *in_domains,
+            use_cache=use_cache,
+            refresh_cache=refresh_cache,
         )
 
+    # in-memory cache
+    def invalidate(self, *queries: str) -> None:
+        """
+        Drops the in-memory cached results of `queries`,
+        so that they'll be recomputed the next time they're made
+
+        Args:
+            queries (str): names of the queries (e.g., "get_stats",
+            "get_variables_by_group")
+        """
+        self._client.invalidate(*queries)
+
+    def clear(self) -> None:
+        """
+        Drops all in-memory cached results
+        """
+        self._client.clear()
+
+    def cache_info(self) -> MemoStats:
+        """
+        Returns:
+            MemoStats: hits, misses and evictions of the in-memory
+            cache, and how big it is
+        """
+        return self._client.cache_info()
+
+    @staticmethod
+    def metrics() -> Metrics:
+        """
+        How long each step of each query has taken, at the median,
+        90th and 99th percentiles, along with how many requests were
+        made, how many bytes they returned, how many rows `get_stats`
+        returned, and how often each cache was hit. These are counted
+        for every `Census` in the process.
+
+        Use `.to_prometheus()` to export them for Prometheus.
+
+        Returns:
+            Metrics
+        """
+        return METRICS.snapshot()
+
     @staticmethod
-    def list_available_datasets() -> pandas.DataFrame:
+    def trace(path: Optional[str] = None) -> ContextManager[Trace]:
+        """
+        Traces the queries made in a `with` block, as nested spans
+        (e.g., `get_stats` > fetching each chunk > its request), with
+        how long each took, and what it did (how many rows, bytes,
+        etc.). This covers every `Census` in the process.
+
+        With `path`, the trace is written there (as JSON, in the
+        Trace Event Format) once the block is done, so it can be
+        opened as a flame chart in Perfetto, speedscope or Chrome's
+        `about:tracing`.
+
+        Args:
+            path (Optional[str], optional): where to write the trace.
+            Defaults to None.
+
+        Returns:
+            ContextManager[Trace]: gives the trace, whose spans are
+            filled in once the block is done
+        """
+        return tracing(path)
+
+    # not a `staticmethod`, so that it can use a `Census`'s transport
+    # when there is one; `Census.list_available_datasets()` still works
+    def list_available_datasets(self: Optional[Census] = None) -> pandas.DataFrame:
         """
-        The name says it all
+        The name says it all. Called on a `Census` object, the request goes
+        through its transport (so it's recorded or replayed along with its
+        other requests), and the list is kept in its in-memory cache (so
+        `clear` and `invalidate` drop it); called on the class, the default
+        transport and a cache of its own are used
 
         Returns:
             pandas.DataFrame: DataFrame with all available datasets,
             along with their years & descriptions
         """
-        return list_available_datasets()
+        from the_census._container import default_transport
+        from the_census._helpers import list_available_datasets
+        from the_census._persistence.interface import IMemoCache
+
+        if self is None:
+            return list_available_datasets(default_transport())
+
+        return list_available_datasets(
+            cast(IHttpTransport, self._container.resolve(IHttpTransport)),
+            cast(IMemoCache, self._container.resolve(IMemoCache)),
+            self._config.request_timeout_seconds,
+        )
 
     @staticmethod
     def help() -> None: